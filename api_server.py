@@ -0,0 +1,314 @@
+"""
+Security Toolkit - HTTP API
+Headless asyncio JSON API for generate, hash, assess, validate and sanitize.
+CPU-bound work runs in a process pool so the event loop only handles I/O.
+Run: python api_server.py --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from modules import batch_ops
+from modules.guess_estimator import MAX_MATCHED_LENGTH
+from modules.output_encoder import ENCODERS
+from modules.security_policy import current_policy
+from utils.constants import (
+    API_HOST, API_PORT, API_MAX_BODY_BYTES, API_MAX_BATCH_ITEMS, API_MAX_PASSWORD_LENGTH,
+    API_MAX_BATCH_RATED_CHARACTERS, API_KEEPALIVE_TIMEOUT, API_MAX_HEADER_COUNT, API_MAX_HEADER_BYTES
+)
+
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    411: "Length Required", 413: "Payload Too Large", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+# Smallest slice of a batch worth sending to a separate worker process
+MIN_SLICE = 64
+
+
+class APIError(Exception):
+    """Error reported to the client as a JSON body with the given status."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def require_string(payload, key):
+    value = payload.get(key)
+    if not isinstance(value, str):
+        raise APIError(400, f"'{key}' must be a string")
+    return value
+
+
+def check_password_length(password):
+    if len(password) > API_MAX_PASSWORD_LENGTH:
+        raise APIError(413, f"Passwords cannot be longer than {API_MAX_PASSWORD_LENGTH} characters")
+    return password
+
+
+def require_list(payload, key):
+    items = payload.get(key)
+    if not isinstance(items, list):
+        raise APIError(400, f"'{key}' must be an array")
+    if len(items) > API_MAX_BATCH_ITEMS:
+        raise APIError(413, f"'{key}' cannot contain more than {API_MAX_BATCH_ITEMS} items")
+    return items
+
+
+def check_length(length, policy):
+    if length is None:
+        return policy.default_length
+    if not isinstance(length, int) or not policy.min_length <= length <= policy.max_length:
+        raise APIError(400, f"Password length must be between {policy.min_length} and {policy.max_length}")
+    return length
+
+
+def check_form(form_data):
+    if not isinstance(form_data, dict) or not all(isinstance(value, str) for value in form_data.values()):
+        raise APIError(400, "Each form must be an object of string fields")
+    return form_data
+
+
+def check_contexts(contexts):
+    if contexts is None:
+        return None
+    if not isinstance(contexts, dict) or not all(context in ENCODERS for context in contexts.values()):
+        raise APIError(400, f"'contexts' must map fields to one of: {', '.join(ENCODERS)}")
+    return contexts
+
+
+class ToolkitAPI:
+    """Routes JSON requests to batch operations running in a process pool."""
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.routes = {
+            ('GET', '/health'): self.health,
+            ('POST', '/generate'): self.generate,
+            ('POST', '/generate/batch'): self.generate_batch,
+            ('POST', '/hash'): self.hash,
+            ('POST', '/hash/batch'): self.hash_batch,
+            ('POST', '/assess'): self.assess,
+            ('POST', '/assess/batch'): self.assess_batch,
+            ('POST', '/validate'): self.validate,
+            ('POST', '/validate/batch'): self.validate_batch,
+            ('POST', '/sanitize'): self.sanitize,
+            ('POST', '/sanitize/batch'): self.sanitize_batch,
+        }
+
+    async def run(self, func, *args):
+        """Run one call in the process pool."""
+        return await asyncio.get_running_loop().run_in_executor(self.pool, func, *args)
+
+    async def run_batch(self, func, items):
+        """Split a batch across the worker processes and join the results in order."""
+        if not items:
+            return []
+        size = max(MIN_SLICE, -(-len(items) // self.workers))
+        slices = [items[i:i + size] for i in range(0, len(items), size)]
+        results = await asyncio.gather(*(self.run(func, chunk) for chunk in slices))
+        return [result for chunk in results for result in chunk]
+
+    # --- Handlers ---
+    async def health(self, payload):
+        return {'status': 'ok', 'workers': self.workers}
+
+    async def generate(self, payload):
+        return await self.run(batch_ops.generate_one, check_length(payload.get('length'), current_policy()))
+
+    async def generate_batch(self, payload):
+        policy = current_policy()
+        if 'lengths' in payload:
+            lengths = [check_length(length, policy) for length in require_list(payload, 'lengths')]
+        else:
+            count = payload.get('count')
+            if not isinstance(count, int) or not 0 <= count <= API_MAX_BATCH_ITEMS:
+                raise APIError(400, f"'count' must be an integer between 0 and {API_MAX_BATCH_ITEMS}")
+            lengths = [check_length(payload.get('length'), policy)] * count
+        return {'results': await self.run_batch(batch_ops.generate_batch, lengths)}
+
+    async def hash(self, payload):
+        return await self.run(batch_ops.hash_one, require_string(payload, 'password'))
+
+    async def hash_batch(self, payload):
+        passwords = require_list(payload, 'passwords')
+        if not all(isinstance(password, str) for password in passwords):
+            raise APIError(400, "'passwords' must contain only strings")
+        return {'results': await self.run_batch(batch_ops.hash_batch, passwords)}
+
+    async def assess(self, payload):
+        return await self.run(batch_ops.assess_one, check_password_length(require_string(payload, 'password')))
+
+    async def assess_batch(self, payload):
+        passwords = require_list(payload, 'passwords')
+        if not all(isinstance(password, str) for password in passwords):
+            raise APIError(400, "'passwords' must contain only strings")
+        for password in passwords:
+            check_password_length(password)
+        # Only the first MAX_MATCHED_LENGTH characters of each password cost estimator time
+        if sum(min(len(password), MAX_MATCHED_LENGTH) for password in passwords) > API_MAX_BATCH_RATED_CHARACTERS:
+            raise APIError(413, f"A batch can rate at most {API_MAX_BATCH_RATED_CHARACTERS} characters "
+                                f"(each password counts up to {MAX_MATCHED_LENGTH})")
+        return {'results': await self.run_batch(batch_ops.assess_batch, passwords)}
+
+    async def validate(self, payload):
+        return await self.run(batch_ops.validate_one, check_form(payload.get('form')))
+
+    async def validate_batch(self, payload):
+        forms = [check_form(form_data) for form_data in require_list(payload, 'forms')]
+        return {'results': await self.run_batch(batch_ops.validate_batch, forms)}
+
+    async def sanitize(self, payload):
+        contexts = check_contexts(payload.get('contexts'))
+        return await self.run(batch_ops.sanitize_one, check_form(payload.get('form')), contexts)
+
+    async def sanitize_batch(self, payload):
+        contexts = check_contexts(payload.get('contexts'))
+        forms = [check_form(form_data) for form_data in require_list(payload, 'forms')]
+        return {'results': await self.run_batch(partial(batch_ops.sanitize_batch, contexts=contexts), forms)}
+
+    # --- HTTP ---
+    async def dispatch(self, method, path, body):
+        """Return (status, payload) for one request."""
+        handler = self.routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in self.routes):
+                return 405, {'error': f"{method} is not allowed on {path}"}
+            return 404, {'error': f"No endpoint at {path}"}
+
+        try:
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise APIError(400, "Request body must be a JSON object")
+            return 200, await handler(payload)
+        except json.JSONDecodeError as e:
+            return 400, {'error': f"Invalid JSON: {e}"}
+        except APIError as e:
+            return e.status, {'error': e.message}
+        except Exception as e:
+            print(f"Error handling {method} {path}: {e}")
+            return 500, {'error': "Internal server error"}
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one connection until the client closes it or keep-alive times out."""
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), API_KEEPALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                except (ValueError, asyncio.LimitOverrunError):
+                    # readline() raises ValueError once a line outgrows the stream buffer
+                    await self.send(writer, 400, {'error': "Request line too long"}, False)
+                    break
+                if not request_line.strip():
+                    break
+
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self.send(writer, 400, {'error': "Malformed request line"}, False)
+                    break
+
+                headers = {}
+                header_count = header_bytes = 0
+                try:
+                    while True:
+                        # Each line gets the keep-alive timeout, so a client cannot trickle headers forever
+                        line = await asyncio.wait_for(reader.readline(), API_KEEPALIVE_TIMEOUT)
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        header_count += 1
+                        header_bytes += len(line)
+                        if header_count > API_MAX_HEADER_COUNT or header_bytes > API_MAX_HEADER_BYTES:
+                            raise ValueError("too many header fields")
+                        name, _, value = line.decode('latin-1').partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                except asyncio.TimeoutError:
+                    break
+                except (ValueError, asyncio.LimitOverrunError):
+                    await self.send(writer, 431, {'error': "Request header fields too large"}, False)
+                    break
+
+                connection = headers.get('connection', '').lower()
+                if version == 'HTTP/1.1':
+                    keep_alive = connection != 'close'
+                else:
+                    keep_alive = connection == 'keep-alive'
+
+                if 'chunked' in headers.get('transfer-encoding', '').lower():
+                    await self.send(writer, 411, {'error': "Chunked bodies are not supported; send Content-Length"}, False)
+                    break
+
+                # Digits only: int() would also take signs, spaces and underscores
+                length = headers.get('content-length', '0')
+                if not (length.isascii() and length.isdigit()):
+                    await self.send(writer, 400, {'error': "Invalid Content-Length"}, False)
+                    break
+                length = int(length)
+                if length > API_MAX_BODY_BYTES:
+                    await self.send(writer, 413, {'error': "Request body too large"}, False)
+                    break
+
+                try:
+                    body = await asyncio.wait_for(reader.readexactly(length), API_KEEPALIVE_TIMEOUT) if length else b''
+                except asyncio.TimeoutError:
+                    break
+                path = target.split('?', 1)[0]
+
+                status, payload = await self.dispatch(method.upper(), path, body)
+                await self.send(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def send(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                + (f"Keep-Alive: timeout={API_KEEPALIVE_TIMEOUT}\r\n" if keep_alive else "")
+                + "\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f"Octoguard API listening on http://{host}:{port} with {self.workers} worker process(es)")
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Octoguard HTTP API")
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    api = ToolkitAPI(args.workers)
+    try:
+        asyncio.run(api.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Load Test - HTTP API
+Drives a running api_server.py with keep-alive asyncio clients and reports throughput and latency percentiles
+Start the server first: python api_server.py --port 8765
+Then run from the project root: python -m benchmarks.api_load_test --concurrency 32 --requests 5000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+PAYLOADS = {
+    '/generate': {'length': 12},
+    '/hash': {'password': "Password1!xxxx"},
+    '/assess': {'password': "Password1!xxxx"},
+    '/validate': {'form': {'full_name': "Jane Doe", 'email': "jane@example.com",
+                           'username': "jane_doe", 'message': "Hello there"}},
+    '/sanitize': {'form': {'full_name': "Jane Doe", 'email': "jane@example.com",
+                           'username': "jane_doe", 'message': "<script>alert(1)</script>"}},
+}
+
+
+def batch_payload(path, size):
+    """Repeat a single-item payload as the matching batch endpoint's body."""
+    single = PAYLOADS[path]
+    if path == '/generate':
+        return {'count': size, 'length': single['length']}
+    if 'password' in single:
+        return {'passwords': [single['password']] * size}
+    return {'forms': [single['form']] * size}
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Server closed the connection")
+    status = int(status_line.split()[1])
+
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host, port, request, counter, total, timings, errors):
+    """Send requests over one keep-alive connection until the shared quota is used up."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while counter[0] < total:
+            counter[0] += 1
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status = await read_response(reader)
+            timings.append((time.perf_counter() - start) * 1000)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(host, port, path, body, concurrency, total):
+    request = (f"POST {path} HTTP/1.1\r\n"
+               f"Host: {host}:{port}\r\n"
+               f"Content-Type: application/json\r\n"
+               f"Content-Length: {len(body)}\r\n\r\n").encode('latin-1') + body
+
+    counter, timings, errors = [0], [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, request, counter, total, timings, errors)
+                           for _ in range(concurrency)))
+    return time.perf_counter() - start, timings, errors
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP API load test")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--endpoint", choices=sorted(PAYLOADS), default=None,
+                        help="endpoint to test (default: all)")
+    parser.add_argument("--batch", type=int, default=0,
+                        help="items per request; uses the /batch endpoints when set")
+    parser.add_argument("--concurrency", type=int, default=32, help="parallel keep-alive connections")
+    parser.add_argument("--requests", type=int, default=5000, help="requests per endpoint")
+    args = parser.parse_args()
+
+    for path in [args.endpoint] if args.endpoint else sorted(PAYLOADS):
+        if args.batch:
+            target, payload = f"{path}/batch", batch_payload(path, args.batch)
+        else:
+            target, payload = path, PAYLOADS[path]
+        body = json.dumps(payload).encode('utf-8')
+
+        elapsed, timings, errors = asyncio.run(
+            run(args.host, args.port, target, body, args.concurrency, args.requests))
+        timings.sort()
+        items = len(timings) * max(args.batch, 1)
+        print(f"{target:<17} {len(timings) / elapsed:>8.0f} req/s  {items / elapsed:>9.0f} items/s   "
+              f"p50 {statistics.median(timings):>6.1f} ms   p95 {percentile(timings, 0.95):>6.1f} ms   "
+              f"p99 {percentile(timings, 0.99):>6.1f} ms   errors {len(errors)}")
+
+
+if __name__ == "__main__":
+    main()
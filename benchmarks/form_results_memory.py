@@ -0,0 +1,105 @@
+"""
+Memory Benchmark - Form Results
+Compares the old dict-of-dicts result layout with the slotted result types
+Run from the project root: python -m benchmarks.form_results_memory --forms 1000000
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from modules.form_validator import FormValidator
+from modules.form_sanitizer import FormSanitizer
+
+
+def make_forms(count, seed=1234):
+    """Build a reproducible list of form inputs mixing clean and dirty values."""
+    rng = random.Random(seed)
+    names = ["John Doe", "Mary-Jane O'Neil", "J0hn D03", "  Ana   Cruz "]
+    emails = ["john@example.com", "Jane.Doe@Example.COM", "bad email@x", "no-at-sign.com"]
+    usernames = ["johndoe123", "9lives", "user name!", "x_y_z"]
+    messages = [
+        "Hello, I would like to inquire...",
+        "<script>alert(1)</script>Hi",
+        "1 OR 1=1 -- drop",
+        "<b>bold</b> & <i>italic</i>",
+    ]
+
+    return [
+        {
+            'full_name': rng.choice(names),
+            'email': rng.choice(emails),
+            'username': rng.choice(usernames),
+            'message': rng.choice(messages),
+        }
+        for _ in range(count)
+    ]
+
+
+def legacy_results(form_data):
+    """Rebuild the previous dict-of-tuples / dict-of-dicts layout for comparison."""
+    validation = {
+        'full_name': FormValidator.validate_full_name(form_data['full_name']),
+        'email': FormValidator.validate_email(form_data['email']),
+        'username': FormValidator.validate_username(form_data['username']),
+        'message': FormValidator.validate_message(form_data['message']),
+    }
+
+    sanitization = {}
+    for field, sanitize in (('full_name', FormSanitizer.sanitize_full_name),
+                            ('email', FormSanitizer.sanitize_email),
+                            ('username', FormSanitizer.sanitize_username),
+                            ('message', FormSanitizer.sanitize_message)):
+        sanitized, modified, notes = sanitize(form_data[field])
+        sanitization[field] = {
+            'original': form_data[field],
+            'sanitized': sanitized,
+            'was_modified': modified,
+            'notes': notes
+        }
+
+    return validation, sanitization
+
+
+def slotted_results(form_data):
+    """Build results with the current validate_all / sanitize_all."""
+    return FormValidator.validate_all(form_data), FormSanitizer.sanitize_all(form_data)
+
+
+def measure(label, builder, forms):
+    """Keep every result alive and report peak traced memory and wall time."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    results = [builder(form_data) for form_data in forms]
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_form = peak / len(forms)
+    print(f"{label:<10} {len(results):>10,} forms  {peak / 1024 ** 2:>10.1f} MiB peak  "
+          f"{per_form:>8.1f} B/form  {elapsed:>7.2f} s")
+
+    del results
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Form result memory benchmark")
+    parser.add_argument("--forms", type=int, default=1_000_000, help="number of forms to process")
+    args = parser.parse_args()
+
+    forms = make_forms(args.forms)
+
+    legacy_peak = measure("legacy", legacy_results, forms)
+    slotted_peak = measure("slotted", slotted_results, forms)
+
+    print(f"Saved {(1 - slotted_peak / legacy_peak) * 100:.1f}% of peak result memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark - L33t-Aware Dictionary Matching
+Times dictionary checks through l33t readings against a large wordlist as the
+password grows, next to the number of strings a naive expansion would need
+Run from the project root: python -m benchmarks.l33t_matching --words 100000
+"""
+
+import argparse
+import math
+import os
+import random
+import string
+import tempfile
+import time
+
+from modules.guess_estimator import DictionaryTable, dictionary_matches
+from modules.l33t import L33T_SUBSTITUTIONS, READINGS, l33t_readings
+from utils.rule_snapshot import build_snapshot, RuleSnapshot
+from utils.constants import COMMON_PASSWORDS, SQL_KEYWORDS
+
+
+def make_words(count, seed):
+    rng = random.Random(seed)
+    return sorted({''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+                   for _ in range(count)})
+
+
+def leetify(word, rng):
+    return ''.join(rng.choice(L33T_SUBSTITUTIONS[char]) if char in L33T_SUBSTITUTIONS and rng.random() < 0.6
+                   else char for char in word)
+
+
+def make_passwords(words, length, count, seed):
+    """Passwords of an exact length: one l33t dictionary word padded with l33t-heavy filler."""
+    rng = random.Random(seed)
+    filler = string.ascii_letters + string.digits + ''.join(READINGS)
+    passwords = []
+    for _ in range(count):
+        word = leetify(rng.choice(words), rng)[:length]
+        padding = ''.join(rng.choice(filler) for _ in range(length - len(word)))
+        split = rng.randint(0, len(padding))
+        passwords.append(padding[:split] + word + padding[split:])
+    return passwords
+
+
+def naive_expansions(password):
+    """Strings needed when each substitutable position is expanded on its own."""
+    return math.prod(1 + len(READINGS[char]) for char in password.lower() if char in READINGS)
+
+
+def time_per_item(func, items):
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="L33t-aware dictionary matching benchmark")
+    parser.add_argument("--words", type=int, default=100_000, help="dictionary words in the wordlist")
+    parser.add_argument("--lengths", default="8,16,32,64,128", help="comma-separated password lengths")
+    parser.add_argument("--count", type=int, default=500, help="passwords per length")
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    words = make_words(args.words, args.seed)
+    table = DictionaryTable({'english': words})
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "ruleset.bin")
+        build_snapshot(path, COMMON_PASSWORDS, words, SQL_KEYWORDS)
+        snapshot = RuleSnapshot(path)
+
+        def snapshot_check(password):
+            lowered = password.lower()
+            return any(snapshot.find_dictionary_words(candidate) for candidate in (lowered,) + l33t_readings(lowered))
+
+        print(f"{len(words):,} dictionary words, {args.count} passwords per length\n")
+        print(f"{'length':>6}  {'readings':>8}  {'naive strings':>13}  {'snapshot check':>14}  "
+              f"{'per char':>8}  {'estimator matcher':>17}  {'per char':>8}  {'found':>5}")
+        for length in (int(value) for value in args.lengths.split(',')):
+            passwords = make_passwords(words, length, args.count, args.seed + length)
+            readings = max(len(l33t_readings(password.lower())) for password in passwords)
+            naive = sum(naive_expansions(password) for password in passwords) / len(passwords)
+            found = sum(1 for password in passwords if snapshot_check(password)) / len(passwords)
+
+            check_us = time_per_item(snapshot_check, passwords)
+            match_us = time_per_item(lambda password: dictionary_matches(password, table), passwords)
+            print(f"{length:>6}  {readings:>8}  {naive:>13.3g}  {check_us:>11.1f} us  {check_us / length:>5.2f} us"
+                  f"  {match_us:>14.1f} us  {match_us / length:>5.2f} us  {found:>5.0%}")
+        snapshot.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Latency Benchmark - Sidebar Navigation
+Compares rebuilding each view on every click with switching between persistent views
+Needs a display. Run from the project root: python -m benchmarks.navigation_latency --clicks 60
+"""
+
+import argparse
+import statistics
+import time
+import tkinter as tk
+
+from ui.app import SecurityToolkit
+from ui.password_generator_view import PasswordGeneratorView
+from ui.password_assessor_view import PasswordAssessorView
+from ui.form_validator_view import FormValidatorView
+
+VIEWS = [
+    ("Password Generator", PasswordGeneratorView),
+    ("Password Assessor", PasswordAssessorView),
+    ("Form Validator", FormValidatorView),
+]
+
+
+def rebuild_navigation(app, name, view_class):
+    """The previous behaviour: destroy everything and construct the view again."""
+    app.clear_content()
+    app.update_nav_style(name)
+    view_class(app.content_frame)
+
+
+def persistent_navigation(app, name, view_class):
+    """The current behaviour: hide the old view and show the cached one."""
+    app.show_view(name, view_class)
+
+
+def measure(root, app, navigate, clicks):
+    """Time each click until Tk has finished drawing the new view."""
+    timings = []
+    for i in range(clicks):
+        name, view_class = VIEWS[i % len(VIEWS)]
+        start = time.perf_counter()
+        navigate(app, name, view_class)
+        root.update()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label, timings):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{label:<12} median {statistics.median(timings):>7.2f} ms   p95 {p95:>7.2f} ms   "
+          f"max {timings[-1]:>7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sidebar navigation latency benchmark")
+    parser.add_argument("--clicks", type=int, default=60, help="navigation clicks per mode")
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    app = SecurityToolkit(root)
+    root.update()
+
+    rebuild = measure(root, app, rebuild_navigation, args.clicks)
+
+    # Start the persistent run from a clean cache so first visits are included
+    app.clear_content()
+    persistent = measure(root, app, persistent_navigation, args.clicks)
+
+    report("rebuild", rebuild)
+    report("persistent", persistent)
+    print(f"Median speedup: {statistics.median(rebuild) / statistics.median(persistent):.1f}x")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Throughput Benchmark - Output Encoders
+Compares the translate-table encoders with equivalent chains of str.replace calls
+Run from the project root: python -m benchmarks.output_encoder_throughput
+"""
+
+import argparse
+import random
+import string
+import timeit
+
+from modules.output_encoder import (
+    encode_html, encode_html_attribute, encode_js_string, encode_url_component, encode_csv_cell,
+    HTML_ATTR_TABLE, JS_STRING_TABLE, URL_COMPONENT_TABLE
+)
+
+
+def make_corpus(count, seed=1234):
+    """Build reproducible form values with a realistic share of markup and punctuation."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + "     .,'\"<>&=/?-_@é"
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randint(10, 250))) for _ in range(count)]
+
+
+def replace_chain(table):
+    """Build a naive encoder applying one str.replace per ASCII entry of a translate table.
+
+    Used for timing only - later replacements can re-encode earlier output.
+    """
+    pairs = [(chr(codepoint), encoded) for codepoint, encoded in enumerate(table[:128])
+             if encoded != chr(codepoint)]
+
+    def encode(value):
+        for char, encoded in pairs:
+            value = value.replace(char, encoded)
+        return value
+
+    return encode
+
+
+def naive_html(value):
+    return (value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            .replace('"', '&quot;').replace("'", '&#x27;'))
+
+
+def naive_csv(value):
+    if value[:1] in ('=', '+', '-', '@', '\t', '\r'):
+        value = "'" + value
+    return '"' + value.replace('"', '""') + '"'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Output encoder throughput benchmark")
+    parser.add_argument("--values", type=int, default=10_000, help="number of values per run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.values)
+    total_chars = sum(len(value) for value in corpus)
+
+    cases = [
+        ("html", encode_html, naive_html),
+        ("html_attribute", encode_html_attribute, replace_chain(HTML_ATTR_TABLE)),
+        ("js_string", encode_js_string, replace_chain(JS_STRING_TABLE)),
+        ("url_component", encode_url_component, replace_chain(URL_COMPONENT_TABLE)),
+        ("csv", encode_csv_cell, naive_csv),
+    ]
+
+    print(f"{'context':<16} {'translate MB/s':>15} {'replace MB/s':>13} {'speedup':>8}")
+    for name, fast, naive in cases:
+        fast_time = min(timeit.repeat(lambda: [fast(value) for value in corpus], number=1, repeat=args.repeat))
+        naive_time = min(timeit.repeat(lambda: [naive(value) for value in corpus], number=1, repeat=args.repeat))
+
+        print(f"{name:<16} {total_chars / fast_time / 1e6:>15.1f} {total_chars / naive_time / 1e6:>13.1f} "
+              f"{naive_time / fast_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
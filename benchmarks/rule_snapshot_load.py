@@ -0,0 +1,74 @@
+"""
+Startup Benchmark - Rule Set Snapshot
+Compares compiling large word lists at startup with mapping a prebuilt snapshot
+Run from the project root: python -m benchmarks.rule_snapshot_load --common 100000 --words 20000
+"""
+
+import argparse
+import os
+import random
+import string
+import tempfile
+import time
+
+from utils.rule_snapshot import build_snapshot, load_snapshot, RuleSnapshot
+from utils.constants import SQL_KEYWORDS
+
+
+def make_lists(common_count, word_count, seed=1234):
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    common = [''.join(rng.choice(letters + string.digits) for _ in range(rng.randint(6, 14)))
+              for _ in range(common_count)]
+    words = [''.join(rng.choice(letters) for _ in range(rng.randint(4, 10))) for _ in range(word_count)]
+    return common, words, list(SQL_KEYWORDS)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rule snapshot build and load benchmark")
+    parser.add_argument("--common", type=int, default=100_000, help="common passwords in the list")
+    parser.add_argument("--words", type=int, default=20_000, help="dictionary words in the list")
+    parser.add_argument("--lookups", type=int, default=2_000, help="passwords checked per lookup timing")
+    args = parser.parse_args()
+
+    common, words, sql = make_lists(args.common, args.words)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "ruleset.bin")
+
+        build_ms, _ = timed(build_snapshot, path, common, words, sql)
+        print(f"Build (compile + write):       {build_ms:>9.1f} ms   {os.path.getsize(path) / 1e6:.1f} MB")
+
+        map_ms, snapshot = timed(RuleSnapshot, path)
+        print(f"Map without checksum:          {map_ms:>9.2f} ms")
+        snapshot.close()
+
+        load_ms, snapshot = timed(load_snapshot, path, common, words, sql)
+        print(f"Load with checksum validation: {load_ms:>9.2f} ms")
+
+        naive_ms, common_set = timed(lambda: {word.lower() for word in common})
+        print(f"Naive set of common passwords: {naive_ms:>9.2f} ms (no dictionary index)")
+
+        rng = random.Random(99)
+        passwords = [rng.choice(common) if rng.random() < 0.3 else
+                     ''.join(rng.choice(string.ascii_letters) for _ in range(12))
+                     for _ in range(args.lookups)]
+
+        lookup_ms, _ = timed(lambda: [snapshot.is_common_password(p) for p in passwords])
+        set_ms, _ = timed(lambda: [p.lower() in common_set for p in passwords])
+        print(f"Common lookup x{args.lookups}:          snapshot {lookup_ms:>7.2f} ms   set {set_ms:>7.2f} ms")
+
+        scan_ms, _ = timed(lambda: [snapshot.find_dictionary_words(p) for p in passwords])
+        naive_scan_ms, _ = timed(lambda: [[w for w in words if w in p.lower()] for p in passwords])
+        print(f"Dictionary scan x{args.lookups}:        automaton {scan_ms:>7.2f} ms   "
+              f"substring loop {naive_scan_ms:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Startup Benchmark - Desktop App
+Measures import cost with -X importtime and, when a display is available, cold start to first frame
+Run from the project root: python -m benchmarks.startup_time --runs 5
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Everything main.py imported before views became lazy
+EAGER_IMPORTS = ("import ui.app, ui.password_generator_view, "
+                 "ui.password_assessor_view, ui.form_validator_view")
+LAZY_IMPORTS = "import ui.app"
+
+FIRST_FRAME_SCRIPT = """
+import time
+start = time.perf_counter()
+import tkinter as tk
+from ui.app import SecurityToolkit
+root = tk.Tk()
+app = SecurityToolkit(root)
+def painted():
+    print((time.perf_counter() - start) * 1000)
+    root.destroy()
+root.after_idle(lambda: root.after(0, painted))
+root.mainloop()
+"""
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_python(args):
+    return subprocess.run([sys.executable] + args, cwd=PROJECT_ROOT,
+                          capture_output=True, text=True, check=True)
+
+
+def import_profile(statement):
+    """Return (total microseconds, [(cumulative us, module)]) for top-level project imports."""
+    result = run_python(["-X", "importtime", "-c", statement])
+    total = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, module = int(match.group(2)), match.group(3), match.group(4)
+        # Only top-level entries add up to the total without double counting
+        if len(indent) == 1:
+            total += cumulative
+            modules.append((cumulative, module))
+    return total, sorted(modules, reverse=True)
+
+
+def first_frame_ms(runs):
+    """Median milliseconds from interpreter start of the script to the first painted frame."""
+    timings = []
+    for _ in range(runs):
+        result = run_python(["-c", FIRST_FRAME_SCRIPT])
+        timings.append(float(result.stdout.strip()))
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Desktop startup benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="repetitions per measurement")
+    parser.add_argument("--top", type=int, default=8, help="slowest imports to list")
+    args = parser.parse_args()
+
+    for label, statement in (("eager", EAGER_IMPORTS), ("lazy", LAZY_IMPORTS)):
+        totals = [import_profile(statement)[0] for _ in range(args.runs)]
+        print(f"{label:<6} imports: median {statistics.median(totals) / 1000:.1f} ms")
+
+    _, modules = import_profile(LAZY_IMPORTS)
+    print("Slowest top-level imports at startup:")
+    for cumulative, module in modules[:args.top]:
+        print(f"  {cumulative / 1000:>7.2f} ms  {module}")
+
+    if os.name == 'nt' or os.environ.get('DISPLAY') or sys.platform == 'darwin':
+        print(f"Cold start to first frame: median {first_frame_ms(args.runs):.1f} ms")
+    else:
+        print("No display available; skipping first-frame measurement")
+
+
+if __name__ == "__main__":
+    main()
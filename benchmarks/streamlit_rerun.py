@@ -0,0 +1,55 @@
+"""
+Latency Benchmark - Streamlit Reruns
+Times button-press reruns of streamlit_app.py with Streamlit's headless AppTest harness
+Run from the project root: python -m benchmarks.streamlit_rerun --runs 20
+Check out an older commit and run it again to get the before numbers.
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from streamlit.testing.v1 import AppTest
+
+# AppTest resolves relative paths against the calling file, so name the app absolutely
+APP_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "streamlit_app.py")
+
+
+def time_clicks(page, button_label, runs, prepare=None):
+    """Return per-click rerun times in milliseconds for one page's button."""
+    app = AppTest.from_file(APP_FILE, default_timeout=30)
+    app.run()
+    app.sidebar.radio[0].set_value(page).run()
+    if prepare:
+        prepare(app)
+
+    timings = []
+    for _ in range(runs):
+        button = next(b for b in app.button if b.label == button_label)
+        start = time.perf_counter()
+        button.click().run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streamlit rerun latency benchmark")
+    parser.add_argument("--runs", type=int, default=20, help="clicks per page")
+    args = parser.parse_args()
+
+    cases = [
+        ("Password Assessor", "Analyze Strength",
+         lambda app: app.text_input[0].set_value("Password1!xxxx").run()),
+        ("Form Validator", "Validate & Sanitize", None),
+        ("Password Generator", "Generate Password", None),
+    ]
+
+    for page, button_label, prepare in cases:
+        timings = time_clicks(page, button_label, args.runs, prepare)
+        print(f"{page:<20} median {statistics.median(timings):>7.1f} ms   "
+              f"min {min(timings):>7.1f} ms   max {max(timings):>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,415 @@
+"""
+Benchmark Suite - End to End
+Measures throughput of every core operation on seeded corpora and checks it against a saved baseline
+Run from the project root:
+  python -m benchmarks.suite --save benchmarks/baseline.json
+  python -m benchmarks.suite --compare benchmarks/baseline.json --threshold 10
+Compare mode exits with status 1 when any case is slower than the baseline by more than the threshold,
+or when a baseline case selected by --only did not run.
+Every run first checks that a sanitized message decodes back to the original in each output context
+and that long repeated passwords rate WEAK, and exits with status 1 when either does not hold
+or when a file writer reports a failed write.
+Baselines are machine specific, so record one on the machine that runs the comparison.
+"""
+
+import argparse
+import csv
+import fnmatch
+import html
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from urllib.parse import unquote
+
+from modules.password_generator import generate_secure_password, generate_passphrase, hash_password
+from modules.password_assessor import assess_password_strength
+from modules.keyboard_patterns import find_walks
+from modules.password_similarity import SimilarityIndex
+from modules.entropy_generator import generate_for_entropy
+from modules.form_validator import FormValidator
+from modules.form_sanitizer import FormSanitizer
+from modules.form_results import FORM_FIELDS, form_record
+from modules.output_encoder import ENCODERS
+from utils.constants import COMMON_PASSWORDS, DICTIONARY_WORDS, SQL_KEYWORDS, SPECIAL_CHARACTERS
+from utils import file_handler
+from utils.wordlist import Wordlist, build_wordlist
+
+FIRST_NAMES = ["Maria", "James", "Aiko", "Olu", "Sofia", "Liam", "Chen", "Fatima", "Noah", "Ines", "Mary-Jane"]
+LAST_NAMES = ["Garcia", "Smith", "Tanaka", "Adeyemi", "Rossi", "O'Brien", "Wang", "Haddad", "Muller", "Silva"]
+DOMAINS = ["example.com", "mail.org", "company.co.uk", "uni.edu", "startup.io"]
+MESSAGE_WORDS = ("please update my account details and confirm the order was shipped "
+                 "thanks for the quick reply I will check again tomorrow morning").split()
+
+# Payloads mixed into a share of the forms so the threat checks do real work
+ATTACK_PAYLOADS = [
+    "<script>alert('x')</script>",
+    "<img src=x onerror=alert(1)>",
+    "'; DROP TABLE users; --",
+    "1 UNION SELECT password FROM accounts",
+    "<b onclick=steal()>hi</b>",
+    "javascript:alert(document.cookie)",
+]
+
+
+class Corpus:
+    """Reproducible passwords, forms and result records built from one seed."""
+
+    def __init__(self, size, seed):
+        rng = random.Random(seed)
+        self.seed = seed
+        self.passwords = [self.make_password(rng) for _ in range(size)]
+        self.forms = [self.make_form(rng) for _ in range(size)]
+        self.records = [
+            form_record(FormValidator.validate_all(form_data), FormSanitizer.sanitize_all(form_data))
+            for form_data in self.forms
+        ]
+        self.hashes = [hash_password(password) for password in self.passwords]
+
+    @staticmethod
+    def make_password(rng):
+        kind = rng.random()
+        if kind < 0.15:
+            return rng.choice(COMMON_PASSWORDS)
+        if kind < 0.4:
+            # Dictionary word with the usual decorations
+            word = rng.choice(DICTIONARY_WORDS)
+            return word.capitalize() + str(rng.randint(0, 9999)) + rng.choice(SPECIAL_CHARACTERS)
+        alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789" + SPECIAL_CHARACTERS
+        return ''.join(rng.choice(alphabet) for _ in range(rng.randint(6, 24)))
+
+    @staticmethod
+    def make_form(rng):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        message = ' '.join(rng.choice(MESSAGE_WORDS) for _ in range(rng.randint(5, 60)))
+        form_data = {
+            'full_name': f"{first} {last}",
+            'email': f"{first.lower()}.{last.lower()}{rng.randint(1, 99)}@{rng.choice(DOMAINS)}",
+            'username': f"{first.lower()}_{rng.randint(10, 9999)}",
+            'message': message,
+        }
+
+        # About one form in five carries an attack or a malformed value
+        roll = rng.random()
+        if roll < 0.1:
+            field = rng.choice(FORM_FIELDS)
+            form_data[field] = form_data[field] + " " + rng.choice(ATTACK_PAYLOADS)
+        elif roll < 0.15:
+            form_data['message'] = message.upper() + " " + rng.choice(SQL_KEYWORDS)
+        elif roll < 0.2:
+            form_data[rng.choice(FORM_FIELDS)] = "  " + rng.choice(["", "a", "@@", "x" * 300]) + "  "
+        return form_data
+
+
+def require_written(name, written):
+    """Fail the case when a writer reports an error, so a failed write is never timed as a fast one."""
+    if not written:
+        raise RuntimeError(f"{name} reported a failed write")
+
+
+def field_values(corpus, field):
+    return [form_data[field] for form_data in corpus.forms]
+
+
+def build_cases(corpus, workdir):
+    """Return [(name, items, prepare)] where prepare() builds the case's fixtures and
+    returns run(), which processes items values once.
+
+    Fixtures are only built for the cases selected, so --only skips the costly ones.
+    """
+    cases = []
+
+    def add(name, items, run):
+        cases.append((name, items, lambda: run))
+
+    def add_prepared(name, items, prepare):
+        cases.append((name, items, prepare))
+
+    # --- Password generator and assessor ---
+    def run_generate():
+        # The generator uses the module-level RNG, so seed it for a repeatable number of retries
+        random.seed(corpus.seed)
+        for _ in range(len(corpus.passwords)):
+            generate_secure_password(12)
+
+    add('generate_secure_password', len(corpus.passwords), run_generate)
+    add('generate_for_entropy', len(corpus.passwords),
+        lambda: [generate_for_entropy(80) for _ in corpus.passwords])
+
+    def prepare_passphrase():
+        # Sampling cost must not depend on the list size, so use a large one
+        words_file = os.path.join(workdir, "words.txt")
+        with open(words_file, "w", encoding="utf-8") as file:
+            file.writelines(f"word{number:07d}\n" for number in range(1_000_000))
+        build_wordlist(words_file, os.path.join(workdir, "wordlist.bin"))
+        wordlist = Wordlist(os.path.join(workdir, "wordlist.bin"))
+        return lambda: [generate_passphrase(6, wordlist) for _ in corpus.passwords]
+
+    add_prepared('generate_passphrase', len(corpus.passwords), prepare_passphrase)
+    add('hash_password', len(corpus.passwords), lambda: [hash_password(p) for p in corpus.passwords])
+    add('assess_password_strength', len(corpus.passwords),
+        lambda: [assess_password_strength(p) for p in corpus.passwords])
+    add('find_walks', len(corpus.passwords), lambda: [find_walks(p) for p in corpus.passwords])
+
+    # --- Form validator ---
+    for field in FORM_FIELDS:
+        validate = getattr(FormValidator, f"validate_{field}")
+        values = field_values(corpus, field)
+        add(f"FormValidator.validate_{field}", len(values),
+            lambda validate=validate, values=values: [validate(value) for value in values])
+    add('FormValidator.validate_field', len(corpus.forms) * len(FORM_FIELDS),
+        lambda: [FormValidator.validate_field(field, form_data[field])
+                 for form_data in corpus.forms for field in FORM_FIELDS])
+    add('FormValidator.validate_all', len(corpus.forms),
+        lambda: [FormValidator.validate_all(form_data) for form_data in corpus.forms])
+
+    # --- Form sanitizer ---
+    for field in FORM_FIELDS:
+        sanitize = getattr(FormSanitizer, f"sanitize_{field}")
+        values = field_values(corpus, field)
+        add(f"FormSanitizer.sanitize_{field}", len(values),
+            lambda sanitize=sanitize, values=values: [sanitize(value) for value in values])
+    messages = field_values(corpus, 'message')
+    for context in ENCODERS:
+        add(f"FormSanitizer.encode_output[{context}]", len(messages),
+            lambda context=context: [FormSanitizer.encode_output(value, context) for value in messages])
+    add('FormSanitizer.sanitize_field', len(corpus.forms) * len(FORM_FIELDS),
+        lambda: [FormSanitizer.sanitize_field(field, form_data[field])
+                 for form_data in corpus.forms for field in FORM_FIELDS])
+    add('FormSanitizer.sanitize_all', len(corpus.forms),
+        lambda: [FormSanitizer.sanitize_all(form_data) for form_data in corpus.forms])
+    html_contexts = dict.fromkeys(FORM_FIELDS, 'html')
+    add('FormSanitizer.sanitize_all[html]', len(corpus.forms),
+        lambda: [FormSanitizer.sanitize_all(form_data, html_contexts) for form_data in corpus.forms])
+
+    # --- File handler ---
+    # Writers get a fresh file per run so earlier runs don't change the cost
+    run_counter = iter(range(sys.maxsize))
+
+    def fresh_path(name):
+        return os.path.join(workdir, f"{next(run_counter)}_{name}")
+
+    def run_password_log():
+        log_file = fresh_path("log.txt")
+        for password, password_hash in zip(corpus.passwords, corpus.hashes):
+            require_written('save_password_to_log', file_handler.save_password_to_log(password, password_hash, log_file))
+
+    add('save_password_to_log', len(corpus.passwords), run_password_log)
+
+    similarity_key = os.path.join(workdir, "similarity.key")
+
+    def run_similarity_add():
+        index = SimilarityIndex(fresh_path("similarity.bin"), similarity_key)
+        for password in corpus.passwords:
+            index.add(password)
+
+    add('SimilarityIndex.add', len(corpus.passwords), run_similarity_add)
+
+    def prepare_similarity():
+        similarity_index = SimilarityIndex(os.path.join(workdir, "similarity.bin"), similarity_key)
+        for password in corpus.passwords:
+            similarity_index.add(password)
+        return lambda: [similarity_index.similarity(password) for password in corpus.passwords]
+
+    add_prepared('SimilarityIndex.similarity', len(corpus.passwords), prepare_similarity)
+
+    def prepare_history():
+        history_file = os.path.join(workdir, "history.txt")
+        for password, password_hash in zip(corpus.passwords, corpus.hashes):
+            file_handler.save_password_to_log(password, password_hash, history_file)
+        return lambda: file_handler.load_password_history(history_file)
+
+    add_prepared('load_password_history', len(corpus.passwords), prepare_history)
+
+    result_texts = [json.dumps(record) for record in corpus.records]
+
+    def run_validation_result():
+        result_file = fresh_path("results.txt")
+        for result_text in result_texts:
+            require_written('save_validation_result', file_handler.save_validation_result(result_text, result_file))
+
+    add('save_validation_result', len(result_texts), run_validation_result)
+    add('save_results_jsonl', len(corpus.records),
+        lambda: require_written('save_results_jsonl',
+                                file_handler.save_results_jsonl(corpus.records, fresh_path("results.jsonl"))))
+    add('append_results_csv', len(corpus.records),
+        lambda: require_written('append_results_csv',
+                                file_handler.append_results_csv(corpus.records, fresh_path("results.csv"))))
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("pyarrow is not installed; skipping the Arrow and Parquet writers", file=sys.stderr)
+    else:
+        add('save_results_arrow', len(corpus.records),
+            lambda: require_written('save_results_arrow',
+                                    file_handler.save_results_arrow(corpus.records, fresh_path("results.arrow"))))
+
+        def run_parquet():
+            writer = file_handler.ParquetResultWriter(fresh_path("results.parquet"))
+            for start in range(0, len(corpus.records), 500):
+                writer.write(corpus.records[start:start + 500])
+            writer.close()
+
+        add('ParquetResultWriter', len(corpus.records), run_parquet)
+
+    return cases
+
+
+# Inverse of each output encoder, for checking that sanitized values decode to what was submitted
+DECODERS = {
+    'html': html.unescape,
+    'html_attribute': html.unescape,
+    'js_string': lambda value: value.encode('ascii').decode('unicode_escape'),
+    'url_component': unquote,
+    'csv': lambda value: next(csv.reader([value]))[0],
+}
+ROUND_TRIP_MESSAGE = 'Fish & "chips"'
+
+
+def check_round_trip():
+    """Return the contexts whose sanitized message does not decode back to the submitted text."""
+    failures = []
+    for context, decode in DECODERS.items():
+        result = FormSanitizer.sanitize_all({'message': ROUND_TRIP_MESSAGE}, {'message': context})
+        decoded = decode(result.message.sanitized)
+        if decoded != ROUND_TRIP_MESSAGE:
+            print(f"Round trip failed for {context}: {ROUND_TRIP_MESSAGE!r} came back as {decoded!r}")
+            failures.append(context)
+    return failures
+
+
+# Long repeats that must rate WEAK however far they run past the estimator's matched length
+LONG_REPEATS = ('password' * 13, 'a' * 110, 'x' * 1024, 'ab' * 500, 'qwerty' * 50)
+
+
+def check_long_repeats():
+    """Return the long repeated passwords that are not rated WEAK."""
+    failures = []
+    for password in LONG_REPEATS:
+        rating = assess_password_strength(password)[0]
+        if rating != "WEAK":
+            print(f"{password[:16]!r}... ({len(password)} characters) rated {rating}, expected WEAK")
+            failures.append(password)
+    return failures
+
+
+def measure(run, items, repeat):
+    """Best-of-repeat throughput in items per second, after one warm-up run."""
+    run()
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return items / best
+
+
+def selected(name, patterns):
+    return not patterns or any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+def run_suite(size, seed, repeat, patterns):
+    corpus = Corpus(size, seed)
+    results = {}
+    failed = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, items, prepare in build_cases(corpus, workdir):
+            if not selected(name, patterns):
+                continue
+            try:
+                results[name] = {'ops_per_sec': measure(prepare(), items, repeat), 'items': items}
+            except RuntimeError as e:
+                print(f"{name:<44} FAILED: {e}")
+                failed.append(name)
+                continue
+            print(f"{name:<44} {results[name]['ops_per_sec']:>14,.0f} ops/s")
+    return {
+        'meta': {
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'size': size,
+            'seed': seed,
+            'repeat': repeat,
+        },
+        'results': results,
+        'failed': failed,
+    }
+
+
+def compare(current, baseline, threshold, patterns=()):
+    """Print the change per case and return (names that regressed past the threshold,
+    selected baseline cases the current run did not produce)."""
+    if current['meta']['size'] != baseline['meta']['size'] or current['meta']['seed'] != baseline['meta']['seed']:
+        print("Warning: corpus size or seed differs from the baseline; results are not directly comparable")
+
+    regressions = []
+    print(f"\n{'case':<44} {'baseline':>14} {'current':>14} {'change':>8}")
+    for name, result in current['results'].items():
+        if name not in baseline['results']:
+            print(f"{name:<44} {'-':>14} {result['ops_per_sec']:>14,.0f}      new")
+            continue
+        before = baseline['results'][name]['ops_per_sec']
+        change = (result['ops_per_sec'] - before) / before * 100
+        flag = ""
+        if change < -threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<44} {before:>14,.0f} {result['ops_per_sec']:>14,.0f} {change:>+7.1f}%{flag}")
+
+    # A case that stopped running (renamed, removed, or its dependency missing) must not pass silently
+    missing = [name for name in baseline['results'] if name not in current['results'] and selected(name, patterns)]
+    for name in missing:
+        print(f"{name:<44} {baseline['results'][name]['ops_per_sec']:>14,.0f} {'-':>14}  MISSING")
+    return regressions, missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end benchmark suite")
+    parser.add_argument("--size", type=int, default=2000, help="passwords and forms in the corpus")
+    parser.add_argument("--seed", type=int, default=1234, help="corpus seed")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case (best is kept)")
+    parser.add_argument("--only", action="append", default=[], metavar="PATTERN",
+                        help="run only cases matching this glob (repeatable)")
+    parser.add_argument("--save", metavar="FILE", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="allowed throughput drop in percent before compare fails")
+    args = parser.parse_args()
+
+    if check_round_trip() or check_long_repeats():
+        return 1
+
+    current = run_suite(args.size, args.seed, args.repeat, args.only)
+    if current['failed']:
+        print(f"\n{len(current['failed'])} case(s) failed: {', '.join(current['failed'])}")
+        return 1
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w") as file:
+            json.dump(current, file, indent=2)
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions, missing = compare(current, baseline, args.threshold, args.only)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:g}%: {', '.join(regressions)}")
+        if missing:
+            print(f"\n{len(missing)} baseline case(s) missing from this run: {', '.join(missing)}")
+        if regressions or missing:
+            return 1
+        print(f"\nNo case regressed by more than {args.threshold:g}%")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""
+Security Toolkit - Command Line
+Line-by-line batch tool for shell pipelines and cron jobs
+Each command imports only what it needs, so tkinter and streamlit are never loaded.
+
+  python cli.py generate --count 100 --length 16
+  python cli.py generate --count 100 --entropy 80
+  python cli.py passphrase --count 10 --words 6
+  python cli.py hash < passwords.txt
+  python cli.py assess passwords.txt --json
+  python cli.py validate forms.jsonl > results.jsonl
+"""
+
+import sys
+from types import SimpleNamespace
+
+
+def read_lines(path):
+    """Yield lines from a file or stdin ('-') without their line endings."""
+    file = sys.stdin if path == '-' else open(path, encoding='utf-8', errors='replace')
+    try:
+        for line in file:
+            yield line.rstrip('\r\n')
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+
+def cmd_generate(args):
+    from modules.password_generator import generate_secure_password, hash_password
+    from modules.security_policy import current_policy
+
+    # Same bounds the generator view enforces, taken from the security policy
+    policy = current_policy()
+    if args.entropy is not None:
+        from modules.entropy_generator import plan_password, character_space
+
+        if args.length is not None:
+            usage_error("--entropy and --length cannot be combined")
+        if args.entropy < 1:
+            usage_error("--entropy must be at least 1 bit")
+        try:
+            plan = plan_password(args.entropy, policy=policy)
+        except ValueError as e:
+            usage_error(str(e))
+        print(f"{plan.length} characters, {plan.entropy:.1f} bits each", file=sys.stderr)
+        space = character_space(plan.classes)
+        generate = lambda: space.draw(plan.length)
+    else:
+        length = policy.default_length if args.length is None else args.length
+        if not policy.min_length <= length <= policy.max_length:
+            usage_error(f"--length must be between {policy.min_length} and {policy.max_length}")
+        generate = lambda: generate_secure_password(length)
+
+    write = sys.stdout.write
+    for _ in range(args.count):
+        password = generate()
+        if args.hash:
+            write(f"{password}\t{hash_password(password)}\n")
+        else:
+            write(password + "\n")
+    return 0
+
+
+def cmd_passphrase(args):
+    from modules.password_generator import generate_passphrase
+    from utils.constants import PASSPHRASE_MIN_WORDS, PASSPHRASE_MAX_WORDS, PASSPHRASE_DEFAULT_WORDS
+    from utils.wordlist import get_wordlist
+
+    words = PASSPHRASE_DEFAULT_WORDS if args.words is None else args.words
+    if not PASSPHRASE_MIN_WORDS <= words <= PASSPHRASE_MAX_WORDS:
+        usage_error(f"--words must be between {PASSPHRASE_MIN_WORDS} and {PASSPHRASE_MAX_WORDS}")
+    try:
+        wordlist = get_wordlist()
+    except (OSError, ValueError) as e:
+        print(f"Error: no usable passphrase wordlist ({e}); build one with: python -m utils.wordlist build WORDS.txt",
+              file=sys.stderr)
+        return 1
+
+    write = sys.stdout.write
+    for _ in range(args.count):
+        passphrase, entropy = generate_passphrase(words, wordlist)
+        write(f"{passphrase}\t{entropy:.1f}\n")
+    return 0
+
+
+def cmd_hash(args):
+    from modules.password_generator import hash_password
+
+    write = sys.stdout.write
+    for password in read_lines(args.file):
+        write(hash_password(password) + "\n")
+    return 0
+
+
+def cmd_assess(args):
+    from modules.password_assessor import assess_password_strength
+
+    if args.json:
+        import json
+
+    write = sys.stdout.write
+    for password in read_lines(args.file):
+        rating, _, feedback = assess_password_strength(password)
+        if args.json:
+            write(json.dumps({'rating': rating, 'feedback': feedback}) + "\n")
+        else:
+            write(f"{rating}\t{'; '.join(feedback)}\n")
+    return 0
+
+
+def cmd_validate(args):
+    import json
+    from modules.form_validator import FormValidator
+
+    write = sys.stdout.write
+    status = 0
+    for number, line in enumerate(read_lines(args.file), 1):
+        if not line.strip():
+            continue
+        try:
+            form_data = json.loads(line)
+            if not isinstance(form_data, dict):
+                raise ValueError("expected a JSON object")
+        except ValueError as e:
+            # Emit a line anyway so output rows stay aligned with input rows
+            print(f"Line {number}: invalid JSON ({e})", file=sys.stderr)
+            write(json.dumps({'error': "Invalid JSON"}) + "\n")
+            status = 1
+            continue
+
+        form_data = {field: '' if value is None else str(value) for field, value in form_data.items()}
+        results = FormValidator.validate_all(form_data)
+        write(json.dumps({
+            'valid': all(is_valid for is_valid, _ in results.values()),
+            'fields': {field: {'valid': is_valid, 'error': error}
+                       for field, (is_valid, error) in results.items()},
+        }) + "\n")
+    return status
+
+
+USAGE = """usage: cli.py COMMAND [options]
+
+commands:
+  generate [--count N] [--length N] [--hash]   print secure passwords, one per line
+           [--entropy BITS]                    (--hash appends a tab and the SHA-256 hash;
+                                               --entropy picks the shortest length reaching
+                                               BITS that the assessor rates STRONG)
+  passphrase [--count N] [--words N]           print diceware-style passphrases, one per line,
+                                               each followed by a tab and its entropy in bits
+  hash [FILE]                                  print the SHA-256 hash of each input line
+  assess [FILE] [--json]                       rate the strength of each input line
+  validate [FILE]                              validate each JSON-lines form
+
+FILE defaults to stdin ('-').
+"""
+
+COMMANDS = {
+    # command: (handler, flags, options with integer values; None means the policy default)
+    'generate': (cmd_generate, {'--hash'}, {'--count': 1, '--length': None, '--entropy': None}),
+    'passphrase': (cmd_passphrase, set(), {'--count': 1, '--words': None}),
+    'hash': (cmd_hash, set(), {}),
+    'assess': (cmd_assess, {'--json'}, {}),
+    'validate': (cmd_validate, set(), {}),
+}
+
+
+def usage_error(message):
+    sys.stderr.write(USAGE + f"\ncli.py: error: {message}\n")
+    sys.exit(2)
+
+
+def parse_args(argv):
+    """Parse the command line into (handler, namespace).
+
+    argparse alone costs more to import than the rest of a command, so the
+    handful of options here are parsed by hand.
+    """
+    if not argv or argv[0] in ('-h', '--help'):
+        sys.stdout.write(USAGE)
+        sys.exit(0 if argv else 2)
+
+    command, rest = argv[0], argv[1:]
+    if command not in COMMANDS:
+        usage_error(f"unknown command '{command}'")
+    handler, flags, options = COMMANDS[command]
+
+    args = SimpleNamespace(file='-', **{flag[2:]: False for flag in flags},
+                           **{option[2:]: default for option, default in options.items()})
+    positional = []
+    rest = iter(rest)
+    for arg in rest:
+        name, _, value = arg.partition('=')
+        if arg in ('-h', '--help'):
+            sys.stdout.write(USAGE)
+            sys.exit(0)
+        elif arg in flags:
+            setattr(args, arg[2:], True)
+        elif name in options:
+            value = value or next(rest, None)
+            try:
+                setattr(args, name[2:], int(value))
+            except (TypeError, ValueError):
+                usage_error(f"{name} expects an integer")
+        elif arg.startswith('--'):
+            usage_error(f"unrecognized option '{arg}' for {command}")
+        else:
+            positional.append(arg)
+
+    if command in ('generate', 'passphrase'):
+        if positional:
+            usage_error(f"{command} takes no input file")
+        if args.count < 0:
+            usage_error("--count cannot be negative")
+    elif len(positional) > 1:
+        usage_error(f"{command} takes at most one input file")
+    elif positional:
+        args.file = positional[0]
+
+    return handler, args
+
+
+def main(argv=None):
+    handler, args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    try:
+        return handler(args)
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); silence the flush at exit too
+        sys.stdout = None
+        return 0
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
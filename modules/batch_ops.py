@@ -0,0 +1,58 @@
+"""
+Batch Operations
+Plain-data wrappers around the toolkit functions, shared by the HTTP API and the CLI.
+Everything here takes and returns JSON-serializable values so it can run in worker processes.
+"""
+
+from modules.password_generator import generate_secure_password, hash_password
+from modules.password_assessor import assess_password_strength
+from modules.form_validator import FormValidator
+from modules.form_sanitizer import FormSanitizer
+
+
+def generate_one(length):
+    password = generate_secure_password(length)
+    return {'password': password, 'hash': hash_password(password)}
+
+
+def hash_one(password):
+    return {'hash': hash_password(password)}
+
+
+def assess_one(password):
+    rating, color, feedback = assess_password_strength(password)
+    return {'rating': rating, 'color': color, 'feedback': feedback}
+
+
+def validate_one(form_data):
+    return {
+        field: {'valid': is_valid, 'error': error}
+        for field, (is_valid, error) in FormValidator.validate_all(form_data).items()
+    }
+
+
+def sanitize_one(form_data, contexts=None):
+    return {
+        field: result.to_dict()
+        for field, result in FormSanitizer.sanitize_all(form_data, contexts).items()
+    }
+
+
+def generate_batch(lengths):
+    return [generate_one(length) for length in lengths]
+
+
+def hash_batch(passwords):
+    return [hash_one(password) for password in passwords]
+
+
+def assess_batch(passwords):
+    return [assess_one(password) for password in passwords]
+
+
+def validate_batch(forms):
+    return [validate_one(form_data) for form_data in forms]
+
+
+def sanitize_batch(forms, contexts=None):
+    return [sanitize_one(form_data, contexts) for form_data in forms]
@@ -0,0 +1,149 @@
+import csv
+import json
+import os
+
+from modules.form_results import FORM_FIELDS, form_record
+from modules.form_validator import FormValidator
+from modules.form_sanitizer import FormSanitizer
+from utils.file_handler import save_results_jsonl
+
+
+class ByteCountingLines:
+    """Iterates a binary file as decoded lines while tracking how many bytes were consumed."""
+
+    def __init__(self, file, encoding='utf-8-sig'):
+        self.file = file
+        self.encoding = encoding
+        self.bytes_read = 0
+
+    def __iter__(self):
+        for line in self.file:
+            self.bytes_read += len(line)
+            yield line.decode(self.encoding, 'replace')
+
+
+class TextFormSource:
+    """Reads forms from a CSV (with a header row) or JSON lines file object."""
+
+    def __init__(self, file, name):
+        self.lines = ByteCountingLines(file)
+        self.is_jsonl = name.lower().endswith(('.jsonl', '.ndjson', '.json'))
+
+    def bytes_read(self):
+        return self.lines.bytes_read
+
+    def __iter__(self):
+        if not self.is_jsonl:
+            yield from csv.DictReader(self.lines)
+            return
+
+        for line in self.lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Keep the row so it is counted as invalid rather than silently dropped
+                record = {}
+            yield record if isinstance(record, dict) else {}
+
+
+class ParquetFormSource:
+    """Reads forms from a Parquet file object one record batch at a time."""
+
+    def __init__(self, file, total_bytes, batch_size):
+        import pyarrow.parquet as pq
+
+        self.parquet = pq.ParquetFile(file)
+        self.total_bytes = total_bytes
+        self.total_rows = self.parquet.metadata.num_rows or 1
+        self.batch_size = batch_size
+        self.rows_read = 0
+
+    def bytes_read(self):
+        # Row groups are compressed, so progress is estimated from rows
+        return int(self.total_bytes * self.rows_read / self.total_rows)
+
+    def __iter__(self):
+        columns = [field for field in FORM_FIELDS if field in self.parquet.schema_arrow.names]
+        for batch in self.parquet.iter_batches(batch_size=self.batch_size, columns=columns):
+            for record in batch.to_pylist():
+                self.rows_read += 1
+                yield record
+
+
+def form_status(validation_results, sanitization_results):
+    """Classify a whole form as 'invalid', 'sanitized' or 'valid'."""
+    if not all(result[0] for result in validation_results.values()):
+        return 'invalid'
+    if any(result['was_modified'] for result in sanitization_results.values()):
+        return 'sanitized'
+    return 'valid'
+
+
+def new_summary(total_bytes=0):
+    return {'forms': 0, 'valid': 0, 'sanitized': 0, 'invalid': 0, 'bytes_read': 0, 'total_bytes': total_bytes}
+
+
+def validate_stream(file, name, total_bytes, chunk_size=500, progress=None, is_cancelled=None, on_chunk=None):
+    """Validate and sanitize every form in an open binary CSV/JSONL/Parquet file, keeping only running counts.
+
+    progress(summary) is called after each chunk with a copy of the counts and
+    is_cancelled() is checked between chunks. on_chunk(records) receives each
+    chunk's flattened result records, which are dropped afterwards, so at most
+    chunk_size records are held at once. The input is only as lazy as the file
+    object: a Streamlit upload is already entirely in memory.
+    """
+    if name.lower().endswith('.parquet'):
+        source = ParquetFormSource(file, total_bytes, chunk_size)
+    else:
+        source = TextFormSource(file, name)
+
+    summary = new_summary(total_bytes)
+    records = []
+    reported = None
+
+    for form_data in source:
+        # Only the known fields are checked; extra columns are ignored
+        form_data = {field: '' if form_data[field] is None else str(form_data[field])
+                     for field in FORM_FIELDS if field in form_data}
+
+        validation_results = FormValidator.validate_all(form_data)
+        sanitization_results = FormSanitizer.sanitize_all(form_data)
+
+        summary['forms'] += 1
+        summary[form_status(validation_results, sanitization_results)] += 1
+        if on_chunk:
+            records.append(form_record(validation_results, sanitization_results))
+
+        if summary['forms'] % chunk_size == 0:
+            if on_chunk:
+                on_chunk(records)
+                records = []
+            summary['bytes_read'] = source.bytes_read()
+            if progress:
+                reported = dict(summary)
+                progress(reported)
+            if is_cancelled and is_cancelled():
+                summary['cancelled'] = True
+                return summary
+
+    if on_chunk and records:
+        on_chunk(records)
+
+    summary['bytes_read'] = summary['total_bytes']
+    # Skip it when the last chunk ended exactly at the end of the file and already reported these counts
+    if progress and summary != reported:
+        progress(dict(summary))
+
+    return summary
+
+
+def validate_file(path, chunk_size=500, progress=None, is_cancelled=None, output_file=None):
+    """Validate a CSV/JSONL/Parquet file on disk, optionally appending results to a JSON lines file."""
+    on_chunk = (lambda records: save_results_jsonl(records, output_file)) if output_file else None
+
+    with open(path, "rb") as file:
+        return validate_stream(file, os.path.basename(path), os.path.getsize(path),
+                               chunk_size, progress, is_cancelled, on_chunk)
@@ -0,0 +1,203 @@
+"""
+Target-Entropy Password Generator
+Passwords sized for a requested entropy and drawn so the assessor rates them STRONG
+
+For a target in bits and a set of required character classes, plan_password()
+counts exactly how many strings of each length the generator can produce and
+takes the shortest length whose count reaches the target, but never shorter
+than the policy and the strong rating need. generate_for_entropy() then draws
+one of those strings uniformly, a character at a time, weighting each candidate
+by the number of valid completions it leaves. Every draw succeeds, so there is
+no retry loop, and the entropy reported is exact: log2 of the count.
+
+The strings counted are the ones the guess estimator has no shortcut for: every
+required class appears, and no two neighbouring characters are equal, a step
+on a keyboard or alphabet, two digits, or a digit then a date separator. Walks,
+sequences, single-character repeats, years and dates therefore never occur, and
+the estimator prices a pattern-free string of n characters at 10^n guesses.
+PATTERN_HEADROOM extra characters keep the estimate above the strong threshold
+should a short dictionary word or a repeated pair turn up by chance.
+"""
+
+import math
+import secrets
+import string
+import threading
+from functools import lru_cache
+
+from modules.keyboard_patterns import STEPS
+from modules.security_policy import current_policy
+from utils.metrics import timed
+
+CHARACTER_CLASSES = ('lower', 'upper', 'digits', 'special')
+
+# Characters the estimator accepts between the numbers of a date, e.g. "1/2/99" or "1.2.99"
+DATE_SEPARATORS = frozenset(" /\\_.-")
+
+# Characters beyond the strong threshold, covering one short dictionary word or repeated pair
+PATTERN_HEADROOM = 2
+
+
+def character_classes(policy, classes=CHARACTER_CLASSES):
+    """Return ((name, characters), ...) for the requested classes, specials taken from the policy."""
+    available = {
+        'lower': string.ascii_lowercase,
+        'upper': string.ascii_uppercase,
+        'digits': string.digits,
+        'special': ''.join(sorted(policy.special_characters)),
+    }
+    selected = []
+    for name in dict.fromkeys(classes):
+        if name not in available:
+            raise ValueError(f"Unknown character class: {name}")
+        if not available[name]:
+            raise ValueError(f"The security policy defines no characters for class '{name}'")
+        selected.append((name, available[name]))
+    if not selected:
+        raise ValueError("At least one character class is required")
+    return tuple(selected)
+
+
+def _may_follow(previous, char):
+    """True unless the pair would start a pattern the estimator prices below brute force."""
+    if previous == char or (previous, char) in STEPS:
+        return False
+    if previous.isdigit():
+        return not char.isdigit() and char not in DATE_SEPARATORS
+    return True
+
+
+class CharacterSpace:
+    """Exact completion counts for the strings one set of character classes can produce.
+
+    counts[k][c][mask] is the number of ways to append k more characters after
+    alphabet[c], with the classes in mask already used, that end with every
+    class used. Rows are added on demand up to the longest length asked for.
+    """
+
+    def __init__(self, classes):
+        self.classes = classes
+        self.alphabet = ''.join(chars for _, chars in classes)
+        self.bits = [1 << index for index, (_, chars) in enumerate(classes) for _ in chars]
+        self.full = (1 << len(classes)) - 1
+        self.allowed = [tuple(d for d, char in enumerate(self.alphabet) if _may_follow(previous, char))
+                        for previous in self.alphabet]
+        self.forbidden = [tuple(d for d in range(len(self.alphabet)) if d not in set(allowed))
+                          for allowed in self.allowed]
+        masks = range(self.full + 1)
+        self.counts = [[[1 if mask == self.full else 0 for mask in masks] for _ in self.alphabet]]
+        self._lock = threading.Lock()
+
+    def _extend(self, rows):
+        """Add count rows until counts[rows - 1] exists."""
+        with self._lock:
+            masks = range(self.full + 1)
+            while len(self.counts) < rows:
+                previous = self.counts[-1]
+                # after[d][mask]: completions once d is placed on top of mask
+                after = [[row[mask | bit] for mask in masks] for row, bit in zip(previous, self.bits)]
+                totals = [sum(column) for column in zip(*after)]
+                current = []
+                for forbidden in self.forbidden:
+                    row = totals[:]
+                    for d in forbidden:
+                        excluded = after[d]
+                        for mask in masks:
+                            row[mask] -= excluded[mask]
+                    current.append(row)
+                self.counts.append(current)
+
+    def count(self, length):
+        """Number of distinct strings of this length the generator can produce."""
+        if length < 1:
+            return 0
+        self._extend(length)
+        last = self.counts[length - 1]
+        return sum(row[bit] for row, bit in zip(last, self.bits))
+
+    def draw(self, length):
+        """Return one of the count(length) strings, each equally likely."""
+        self._extend(length)
+        bits = self.bits
+        chars = []
+        mask = 0
+        candidates = range(len(self.alphabet))
+        for remaining in range(length - 1, -1, -1):
+            table = self.counts[remaining]
+            weights = [table[d][mask | bits[d]] for d in candidates]
+            pick = secrets.randbelow(sum(weights))
+            for d, weight in zip(candidates, weights):
+                if pick < weight:
+                    break
+                pick -= weight
+            chars.append(self.alphabet[d])
+            mask |= bits[d]
+            candidates = self.allowed[d]
+        return ''.join(chars)
+
+
+@lru_cache(maxsize=8)
+def character_space(classes):
+    """Compile a class selection once; counts grow with the longest length requested."""
+    return CharacterSpace(classes)
+
+
+class PasswordPlan:
+    """The length and classes that meet an entropy target, and the exact entropy they give."""
+
+    __slots__ = ('length', 'classes', 'entropy')
+
+    def __init__(self, length, classes, entropy):
+        self.length = length
+        self.classes = classes
+        self.entropy = entropy
+
+    def __repr__(self):
+        return f"PasswordPlan(length={self.length}, classes={[name for name, _ in self.classes]}, entropy={self.entropy:.1f})"
+
+
+def minimum_length(policy, class_count):
+    """Shortest length the policy allows that the assessor will rate STRONG when pattern-free."""
+    return max(policy.min_length, policy.strong_length,
+               policy.strong_min_guesses_log10 + PATTERN_HEADROOM, class_count)
+
+
+def max_entropy(classes=CHARACTER_CLASSES, policy=None):
+    """Most bits plan_password() can reach: the count at the policy's maximum length.
+
+    Raises ValueError for an empty or unknown class selection.
+    """
+    policy = policy or current_policy()
+    count = character_space(character_classes(policy, classes)).count(policy.max_length)
+    return math.log2(count) if count else 0.0
+
+
+def plan_password(target_bits, classes=CHARACTER_CLASSES, policy=None):
+    """Return the PasswordPlan with the shortest length reaching target_bits.
+
+    Raises ValueError when even the policy's maximum length falls short.
+    """
+    policy = policy or current_policy()
+    selected = character_classes(policy, classes)
+    space = character_space(selected)
+
+    best = 0
+    for length in range(minimum_length(policy, len(selected)), policy.max_length + 1):
+        count = space.count(length)
+        # Zero when the classes cannot avoid every pattern, e.g. digits alone
+        if not count:
+            continue
+        entropy = math.log2(count)
+        if entropy >= target_bits:
+            return PasswordPlan(length, selected, entropy)
+        best = entropy
+
+    raise ValueError(f"{target_bits} bits needs more than {policy.max_length} characters with these classes "
+                     f"(at most {best:.1f} bits)")
+
+
+@timed("generate_for_entropy")
+def generate_for_entropy(target_bits, classes=CHARACTER_CLASSES, policy=None):
+    """Return (password, entropy in bits) for the shortest password reaching target_bits."""
+    plan = plan_password(target_bits, classes, policy)
+    return character_space(plan.classes).draw(plan.length), plan.entropy
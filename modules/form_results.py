@@ -0,0 +1,129 @@
+FORM_FIELDS = ('full_name', 'email', 'username', 'message')
+
+
+class ValidationResult:
+    """Outcome of validating a single field, unpackable like an (is_valid, error) tuple"""
+
+    __slots__ = ('is_valid', 'error')
+
+    def __init__(self, is_valid, error=None):
+        self.is_valid = is_valid
+        self.error = error
+
+    def __iter__(self):
+        return iter((self.is_valid, self.error))
+
+    def __getitem__(self, index):
+        return (self.is_valid, self.error)[index]
+
+    def __len__(self):
+        return 2
+
+    def __eq__(self, other):
+        if isinstance(other, (ValidationResult, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ValidationResult({self.is_valid!r}, {self.error!r})"
+
+
+class SanitizationResult:
+    """Outcome of sanitizing a single field, readable like the old four-key dict"""
+
+    __slots__ = ('original', 'sanitized', 'was_modified', 'notes')
+
+    def __init__(self, original, sanitized, was_modified, notes):
+        self.original = original
+        self.sanitized = sanitized
+        self.was_modified = was_modified
+        self.notes = notes
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def keys(self):
+        return self.__slots__
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.__slots__]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"SanitizationResult({self.to_dict()!r})"
+
+
+class FormResults:
+    """Per-field results for one form, with a read-only dict view over the fields that are set"""
+
+    __slots__ = FORM_FIELDS
+
+    def __getitem__(self, field):
+        try:
+            return getattr(self, field)
+        except (AttributeError, TypeError):
+            raise KeyError(field) from None
+
+    def __setitem__(self, field, result):
+        if field not in FORM_FIELDS:
+            raise KeyError(field)
+        setattr(self, field, result)
+
+    def __contains__(self, field):
+        return field in FORM_FIELDS and hasattr(self, field)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def get(self, field, default=None):
+        return self[field] if field in self else default
+
+    def keys(self):
+        return [field for field in FORM_FIELDS if hasattr(self, field)]
+
+    def values(self):
+        return [getattr(self, field) for field in self.keys()]
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in self.keys()]
+
+    def copy(self):
+        """Return a shallow copy; field results are immutable once built, so this is a consistent snapshot."""
+        duplicate = FormResults()
+        for field, result in self.items():
+            setattr(duplicate, field, result)
+        return duplicate
+
+    def __repr__(self):
+        return f"FormResults({dict(self.items())!r})"
+
+
+def form_record(validation_results, sanitization_results):
+    """Flatten one form's validation and sanitization results into a single row."""
+    record = {}
+
+    for field in FORM_FIELDS:
+        is_valid, error = validation_results.get(field, (False, None))
+        record[f'{field}_valid'] = is_valid
+        record[f'{field}_error'] = error
+
+        sanitized = sanitization_results.get(field)
+        record[f'{field}_sanitized'] = sanitized['sanitized'] if sanitized else None
+        record[f'{field}_modified'] = sanitized['was_modified'] if sanitized else False
+
+    return record
@@ -1,19 +1,23 @@
 import re
-import html
+from modules.form_results import FormResults, SanitizationResult
+from modules.output_encoder import CONTEXT_LABELS, encode_for_context
+from utils.metrics import timed, timed_pattern
 
 
 class FormSanitizer:
     """Sanitizes web form inputs by removing or neutralizing dangerous content"""
 
     # Patterns for detection and removal
-    SCRIPT_PATTERN = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
-    HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
-    SQL_INJECTION_PATTERN = re.compile(
+    SCRIPT_PATTERN = timed_pattern(
+        "strip_script_tag", re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL))
+    HTML_TAG_PATTERN = timed_pattern("strip_html_tag", re.compile(r'<[^>]+>'))
+    SQL_INJECTION_PATTERN = timed_pattern("strip_sql_injection", re.compile(
         r"(\bOR\b|\bAND\b)\s*['\"]?\d+['\"]?\s*=\s*['\"]?\d+['\"]?|'\s*OR\s*'1'\s*=\s*'1|--|\bUNION\b.*\bSELECT\b",
         re.IGNORECASE
-    )
+    ))
 
     @staticmethod
+    @timed("sanitize_full_name")
     def sanitize_full_name(name):
         """Sanitize a full name by allowing only letters, spaces, hyphens, and apostrophes."""
         if not name:
@@ -43,6 +47,7 @@ class FormSanitizer:
         return sanitized, was_modified, notes
 
     @staticmethod
+    @timed("sanitize_email")
     def sanitize_email(email):
         """Sanitize an email by trimming spaces and normalizing."""
         if not email:
@@ -69,6 +74,7 @@ class FormSanitizer:
         return sanitized, was_modified, notes
 
     @staticmethod
+    @timed("sanitize_username")
     def sanitize_username(username):
         """Sanitize a username by allowing only letters, numbers, and underscores."""
         if not username:
@@ -92,8 +98,12 @@ class FormSanitizer:
         return sanitized, was_modified, notes
 
     @staticmethod
-    def sanitize_message(message):
-        """Sanitize a message by removing scripts, HTML tags, SQL patterns, and escaping special characters."""
+    @timed("sanitize_message")
+    def sanitize_message(message, context='html'):
+        """Sanitize a message by removing scripts, HTML tags, SQL patterns, and escaping special characters.
+
+        Special characters are encoded once, for the output context given (HTML content by default).
+        """
         if not message:
             return "", False, []
 
@@ -118,14 +128,15 @@ class FormSanitizer:
             sanitized = FormSanitizer.SQL_INJECTION_PATTERN.sub('', sanitized)
             notes.append("SQL injection patterns removed")
 
-        # Step 4: Escape special HTML characters
-        escaped = html.escape(sanitized)
+        # Step 4: Clean up whitespace
+        sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+
+        # Step 5: Escape special characters for the output context
+        escaped = encode_for_context(sanitized, context)
         if escaped != sanitized:
             sanitized = escaped
-            notes.append("Special characters escaped")
-
-        # Step 5: Clean up whitespace
-        sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+            notes.append("Special characters escaped" if context == 'html'
+                         else f"Encoded for {CONTEXT_LABELS[context]}")
 
         # Check if any modifications were made
         was_modified = (sanitized != original)
@@ -133,45 +144,67 @@ class FormSanitizer:
         return sanitized, was_modified, notes
 
     @staticmethod
-    def sanitize_all(form_data):
-        """Sanitize all form fields in a dictionary at once."""
-        results = {}
+    @timed("encode_output")
+    def encode_output(value, context):
+        """Encode a sanitized value for the output context it will be written into."""
+        if not value:
+            return "", False, []
+
+        encoded = encode_for_context(value, context)
+        was_modified = (encoded != value)
+        notes = [f"Encoded for {CONTEXT_LABELS[context]}"] if was_modified else []
+
+        return encoded, was_modified, notes
+
+    @staticmethod
+    def _sanitize_field(value, sanitizer, context):
+        """Run a field sanitizer and, when a context is given, encode its output.
+
+        Sanitizers that escape their own output take the context instead, so the value is encoded only once.
+        """
+        if context and sanitizer is FormSanitizer.sanitize_message:
+            return SanitizationResult(value, *sanitizer(value, context))
+
+        sanitized, modified, notes = sanitizer(value)
+
+        if context:
+            sanitized, encoded, encode_notes = FormSanitizer.encode_output(sanitized, context)
+            modified = modified or encoded
+            notes = notes + encode_notes
+
+        return SanitizationResult(value, sanitized, modified, notes)
+
+    @staticmethod
+    @timed("sanitize_field")
+    def sanitize_field(field, value, context=None):
+        """Sanitize a single form field by name, optionally encoding it for an output context."""
+        sanitizer = getattr(FormSanitizer, f'sanitize_{field}', None)
+        if sanitizer is None or field == 'all':
+            raise ValueError(f"Unknown form field: {field}")
+        return FormSanitizer._sanitize_field(value, sanitizer, context)
+
+    @staticmethod
+    @timed("sanitize_all")
+    def sanitize_all(form_data, contexts=None):
+        """Sanitize all form fields in a dictionary at once, optionally encoding each for its output context."""
+        results = FormResults()
+        contexts = contexts or {}
 
         # Sanitize each field
         if 'full_name' in form_data:
-            sanitized, modified, notes = FormSanitizer.sanitize_full_name(form_data['full_name'])
-            results['full_name'] = {
-                'original': form_data['full_name'],
-                'sanitized': sanitized,
-                'was_modified': modified,
-                'notes': notes
-            }
+            results.full_name = FormSanitizer._sanitize_field(
+                form_data['full_name'], FormSanitizer.sanitize_full_name, contexts.get('full_name'))
 
         if 'email' in form_data:
-            sanitized, modified, notes = FormSanitizer.sanitize_email(form_data['email'])
-            results['email'] = {
-                'original': form_data['email'],
-                'sanitized': sanitized,
-                'was_modified': modified,
-                'notes': notes
-            }
+            results.email = FormSanitizer._sanitize_field(
+                form_data['email'], FormSanitizer.sanitize_email, contexts.get('email'))
 
         if 'username' in form_data:
-            sanitized, modified, notes = FormSanitizer.sanitize_username(form_data['username'])
-            results['username'] = {
-                'original': form_data['username'],
-                'sanitized': sanitized,
-                'was_modified': modified,
-                'notes': notes
-            }
+            results.username = FormSanitizer._sanitize_field(
+                form_data['username'], FormSanitizer.sanitize_username, contexts.get('username'))
 
         if 'message' in form_data:
-            sanitized, modified, notes = FormSanitizer.sanitize_message(form_data['message'])
-            results['message'] = {
-                'original': form_data['message'],
-                'sanitized': sanitized,
-                'was_modified': modified,
-                'notes': notes
-            }
+            results.message = FormSanitizer._sanitize_field(
+                form_data['message'], FormSanitizer.sanitize_message, contexts.get('message'))
 
         return results
\ No newline at end of file
@@ -1,23 +1,29 @@
 import re
+from modules.form_results import FormResults, ValidationResult
+from modules.security_policy import current_policy
+from utils.metrics import timed, timed_pattern
 
 
 class FormValidator:
-    """Validates web form inputs against security and format requirements"""
+    """Validates web form inputs against security and format requirements
+
+    Lengths, the username pattern and the SQL keyword set come from the
+    security policy, so they follow security_policy.json as it is reloaded.
+    """
 
     # Validation patterns - Strict and comprehensive
-    FULL_NAME_PATTERN = re.compile(r"^[a-zA-Z](?:[a-zA-Z\s\-'])*[a-zA-Z]$")
-    USERNAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]{3,15}$")
-    EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*@[a-zA-Z0-9][a-zA-Z0-9.-]*\.[a-zA-Z]{2,}$")
+    FULL_NAME_PATTERN = timed_pattern("full_name_pattern", re.compile(r"^[a-zA-Z](?:[a-zA-Z\s\-'])*[a-zA-Z]$"))
+    EMAIL_PATTERN = timed_pattern(
+        "email_pattern", re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*@[a-zA-Z0-9][a-zA-Z0-9.-]*\.[a-zA-Z]{2,}$"))
 
     # Security threat patterns
-    SQL_KEYWORDS = [
-        'SELECT', 'DROP', 'INSERT', 'DELETE', 'UPDATE',
-        'UNION', 'EXEC', 'EXECUTE', 'ALTER', 'CREATE', 'TABLE'
-    ]
-    SCRIPT_PATTERN = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
-    IMG_SUSPICIOUS_PATTERN = re.compile(r'<img[^>]*(onerror|onload|onclick)[^>]*>', re.IGNORECASE)
+    SCRIPT_PATTERN = timed_pattern(
+        "script_tag", re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL))
+    IMG_SUSPICIOUS_PATTERN = timed_pattern(
+        "img_suspicious", re.compile(r'<img[^>]*(onerror|onload|onclick)[^>]*>', re.IGNORECASE))
 
     @staticmethod
+    @timed("validate_full_name")
     def validate_full_name(name):
         """Validate a full name allowing only letters, spaces, hyphens, and apostrophes."""
         # Check if empty or None
@@ -26,10 +32,11 @@ class FormValidator:
 
         # Trim whitespace
         name = name.strip()
+        policy = current_policy()
 
         # Check minimum length
-        if len(name) < 2:
-            return False, "Full name must be at least 2 characters long"
+        if len(name) < policy.name_min_length:
+            return False, f"Full name must be at least {policy.name_min_length} characters long"
 
         # Check for numbers
         if any(char.isdigit() for char in name):
@@ -42,6 +49,7 @@ class FormValidator:
         return True, None
 
     @staticmethod
+    @timed("validate_email")
     def validate_email(email):
         """Validate an email address for proper format and allowed characters."""
         # Check if empty or None
@@ -94,6 +102,7 @@ class FormValidator:
         return True, None
 
     @staticmethod
+    @timed("validate_username")
     def validate_username(username):
         """Validate a username allowing letters, numbers, and underscores with length and format rules."""
         # Check if empty or None
@@ -102,26 +111,28 @@ class FormValidator:
 
         # Trim whitespace
         username = username.strip()
+        policy = current_policy()
 
         # Check minimum length
-        if len(username) < 4:
-            return False, "Username must be at least 4 characters long"
+        if len(username) < policy.username_min_length:
+            return False, f"Username must be at least {policy.username_min_length} characters long"
 
         # Check maximum length
-        if len(username) > 16:
-            return False, "Username cannot exceed 16 characters"
+        if len(username) > policy.username_max_length:
+            return False, f"Username cannot exceed {policy.username_max_length} characters"
 
         # Check if starts with a number
         if username[0].isdigit():
             return False, "Username cannot start with a number"
 
         # Check for invalid characters
-        if not FormValidator.USERNAME_PATTERN.match(username):
+        if not policy.username_pattern.match(username):
             return False, "Username can only contain letters, numbers, and underscores"
 
         return True, None
 
     @staticmethod
+    @timed("validate_message")
     def validate_message(message):
         """Validate a message ensuring length limits and absence of harmful patterns."""
         # Check if empty or None
@@ -135,9 +146,11 @@ class FormValidator:
         if not message:
             return False, "Message cannot be empty"
 
+        policy = current_policy()
+
         # Check maximum length
-        if len(message) > 250:
-            return False, "Message cannot exceed 250 characters"
+        if len(message) > policy.message_max_length:
+            return False, f"Message cannot exceed {policy.message_max_length} characters"
 
         # Check for script tags
         if FormValidator.SCRIPT_PATTERN.search(message):
@@ -147,39 +160,47 @@ class FormValidator:
         if FormValidator.IMG_SUSPICIOUS_PATTERN.search(message):
             return False, "Message contains prohibited HTML tags with suspicious attributes"
 
-        # Check for SQL injection keywords
-        message_upper = message.upper()
-        for keyword in FormValidator.SQL_KEYWORDS:
-            # Use word boundaries to avoid false positives
-            if re.search(r'\b' + keyword + r'\b', message_upper):
-                return False, f"Message contains prohibited SQL keyword: {keyword}"
+        # Check for SQL injection keywords; whole words only, so "UPDATED" is allowed
+        keyword = policy.first_sql_keyword(message)
+        if keyword is not None:
+            return False, f"Message contains prohibited SQL keyword: {keyword}"
 
         return True, None
 
     @staticmethod
+    @timed("validate_field")
+    def validate_field(field, value):
+        """Validate a single form field by name, e.g. 'email'."""
+        validator = getattr(FormValidator, f'validate_{field}', None)
+        if validator is None or field == 'all':
+            raise ValueError(f"Unknown form field: {field}")
+        return ValidationResult(*validator(value))
+
+    @staticmethod
+    @timed("validate_all")
     def validate_all(form_data):
         """Validate all form fields in a dictionary at once."""
-        results = {}
+        results = FormResults()
 
         # Validate each field
         if 'full_name' in form_data:
-            results['full_name'] = FormValidator.validate_full_name(form_data['full_name'])
+            results.full_name = ValidationResult(*FormValidator.validate_full_name(form_data['full_name']))
         else:
-            results['full_name'] = (False, "Full name field is missing")
+            results.full_name = ValidationResult(False, "Full name field is missing")
 
         if 'email' in form_data:
-            results['email'] = FormValidator.validate_email(form_data['email'])
+            results.email = ValidationResult(*FormValidator.validate_email(form_data['email']))
         else:
-            results['email'] = (False, "Email field is missing")
+            results.email = ValidationResult(False, "Email field is missing")
 
         if 'username' in form_data:
-            results['username'] = FormValidator.validate_username(form_data['username'])
+            results.username = ValidationResult(*FormValidator.validate_username(form_data['username']))
         else:
-            results['username'] = (False, "Username field is missing")
+            results.username = ValidationResult(False, "Username field is missing")
 
         if 'message' in form_data:
-            results['message'] = FormValidator.validate_message(form_data['message'])
+            results.message = ValidationResult(*FormValidator.validate_message(form_data['message']))
         else:
-            results['message'] = (False, "Message field is missing")
+            results.message = ValidationResult(False, "Message field is missing")
 
         return results
\ No newline at end of file
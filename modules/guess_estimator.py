@@ -0,0 +1,473 @@
+"""
+Password Guess Estimator
+Estimates how many guesses an attacker needs for a password, in the style of zxcvbn
+
+Every pattern an attacker would try first is matched: ranked dictionary words
+(plain, reversed and l33t), keyboard walks on the QWERTY, AZERTY and keypad
+layouts, repeats, sequences, dates and years. A dynamic-programming pass then
+picks the run of non-overlapping matches with the fewest total guesses;
+characters no pattern covers count as brute force.
+
+Only the first MAX_MATCHED_LENGTH characters are rated, as zxcvbn does: the
+search grows faster than the square of the length, so the rest is cut off.
+Nothing is added for it, or a long enough repeat would rate strong whatever
+it repeats.
+
+The matching tables (keyboard graphs and sequence steps in keyboard_patterns,
+l33t translate tables in l33t, regexes) are built once at import. The ranked
+dictionaries are compiled into a DictionaryTable by each security policy engine
+as it is built, so a reload pays for it on the reload thread.
+"""
+
+import math
+import re
+from datetime import date
+from functools import lru_cache
+from itertools import accumulate
+
+from modules.keyboard_patterns import LAYOUTS_BY_NAME, find_walks
+from modules.l33t import AMBIGUOUS, L33T_CHARACTERS, l33t_readings
+from modules.security_policy import current_policy
+
+# Guesses per brute-forced character, and floors for matches shorter than the password
+BRUTEFORCE_CARDINALITY = 10
+MIN_SUBMATCH_GUESSES_SINGLE_CHAR = 10
+MIN_SUBMATCH_GUESSES_MULTI_CHAR = 50
+# Characters rated; the rest of a longer password is ignored
+MAX_MATCHED_LENGTH = 72
+# Penalty that keeps the search from splitting a password into many tiny matches
+MIN_GUESSES_BEFORE_GROWING_SEQUENCE = 10000
+
+REFERENCE_YEAR = date.today().year
+MIN_YEAR_SPACE = 20
+DATE_MIN_YEAR = 1000
+DATE_MAX_YEAR = 2050
+# Where to split 4-8 digit runs into day, month and year candidates
+DATE_SPLITS = {
+    4: ((1, 2), (2, 3)),
+    5: ((1, 3), (2, 3)),
+    6: ((1, 2), (2, 4), (4, 5)),
+    7: ((1, 3), (2, 3), (4, 5), (4, 6)),
+    8: ((2, 4), (4, 6)),
+}
+DATE_WITH_SEPARATOR = re.compile(r'^([0-9]{1,4})([\s/\\_.-])([0-9]{1,2})\2([0-9]{1,4})$')
+SEPARATED_DIGITS = re.compile(r'[0-9][\s/\\_.-][0-9]')
+DIGIT_RUN = re.compile(r'[0-9]{4,}')
+RECENT_YEAR = re.compile(r'19[0-9][0-9]|20[0-9][0-9]')
+
+REPEAT_GREEDY = re.compile(r'(.+)\1+', re.DOTALL)
+REPEAT_LAZY = re.compile(r'(.+?)\1+', re.DOTALL)
+REPEAT_LAZY_ANCHORED = re.compile(r'^(.+?)\1+$', re.DOTALL)
+
+
+class Match:
+    """One pattern found in a password, covering password[i:j + 1]."""
+
+    __slots__ = ('pattern', 'i', 'j', 'token', 'guesses', 'details')
+
+    def __init__(self, pattern, i, j, token, guesses, **details):
+        self.pattern = pattern
+        self.i = i
+        self.j = j
+        self.token = token
+        self.guesses = guesses
+        self.details = details
+
+    def __repr__(self):
+        return f"Match({self.pattern!r}, {self.i}, {self.j}, guesses={self.guesses})"
+
+
+class GuessEstimate:
+    """Estimated guesses for a password and the cheapest sequence of matches explaining it.
+
+    walks lists every keyboard walk and sequence found, including those the
+    cheapest sequence explains some other way.
+    """
+
+    __slots__ = ('guesses', 'sequence', 'walks')
+
+    def __init__(self, guesses, sequence, walks):
+        self.guesses = guesses
+        self.sequence = sequence
+        self.walks = walks
+
+    @property
+    def guesses_log10(self):
+        return math.log10(self.guesses)
+
+    def patterns(self):
+        """Return the set of pattern names in the sequence, brute force excluded."""
+        return {match.pattern for match in self.sequence if match.pattern != 'bruteforce'}
+
+    def __repr__(self):
+        return f"GuessEstimate(10^{self.guesses_log10:.2f}, {self.sequence!r})"
+
+
+@lru_cache(maxsize=4096)
+def variations(changed, unchanged):
+    """Ways to place `changed` marked characters among `changed + unchanged` (at least 2)."""
+    if not changed or not unchanged:
+        return 2
+    return sum(math.comb(changed + unchanged, k) for k in range(1, min(changed, unchanged) + 1))
+
+
+def uppercase_variations(token):
+    if token.islower() or token.lower() == token:
+        return 1
+    # Capitalized, trailing capital and all caps are what people actually do
+    upper = sum(1 for char in token if char.isupper())
+    lower = sum(1 for char in token if char.islower())
+    if not lower or (upper == 1 and (token[0].isupper() or token[-1].isupper())):
+        return 2
+    return variations(upper, lower)
+
+
+# --- Matchers ---
+class DictionaryTable:
+    """Every ranked word and reversed word in one lookup, with the word lengths worth trying.
+
+    Built from {name: words, most common first}. Each entry packs one ranking
+    into an int, rank << 8 | dictionary index << 1 | reversed, and a word in
+    several dictionaries maps to a tuple of them; plain ints keep the table for
+    a list of a million words to a fraction of the size of (name, rank) tuples.
+    """
+
+    __slots__ = ('names', 'entries', 'lengths')
+
+    def __init__(self, dictionaries):
+        self.names = tuple(dictionaries)
+        entries = {}
+
+        def add(word, packed):
+            found = entries.get(word)
+            if found is None:
+                entries[word] = packed
+            elif type(found) is int:
+                entries[word] = (found, packed)
+            else:
+                entries[word] = found + (packed,)
+
+        for index, words in enumerate(dictionaries.values()):
+            ranked = set()
+            for word in words:
+                word = word.lower()
+                if word in ranked:
+                    continue
+                ranked.add(word)
+                packed = len(ranked) << 8 | index << 1
+                add(word, packed)
+                if len(word) > 1 and word[::-1] != word:
+                    add(word[::-1], packed | 1)
+
+        self.entries = entries
+        self.lengths = tuple(sorted({len(word) for word in entries}))
+
+    def rankings(self, found):
+        """Yield (dictionary name, rank, reversed) for an entry of the table."""
+        for packed in (found,) if type(found) is int else found:
+            yield self.names[packed >> 1 & 0x7F], packed >> 8, bool(packed & 1)
+
+
+def dictionary_matches(password, table):
+    """Ranked dictionary words in the password, read forwards, backwards and through l33t."""
+    lowered = password.lower()
+    length = len(password)
+    # At most a handful of readings, each as long as the password, so matching stays linear
+    readings = l33t_readings(lowered)
+    if readings:
+        # Prefix counts of substituted and ambiguous characters: windows without any
+        # need no l33t lookup, and windows without ambiguous ones need only one reading
+        l33t_before = list(accumulate((char in L33T_CHARACTERS for char in lowered), initial=0))
+        ambiguous_before = list(accumulate((char in AMBIGUOUS for char in lowered), initial=0))
+    entries = table.entries
+    matches = []
+
+    for word_length in table.lengths:
+        if word_length > length:
+            break
+        for i in range(length - word_length + 1):
+            j = i + word_length - 1
+            word = lowered[i:j + 1]
+            found = entries.get(word)
+            if found:
+                token = password[i:j + 1]
+                upper = uppercase_variations(token)
+                for name, rank, is_reversed in table.rankings(found):
+                    matches.append(Match('dictionary', i, j, token, rank * upper * (2 if is_reversed else 1),
+                                         dictionary=name, rank=rank, word=word[::-1] if is_reversed else word,
+                                         reversed=is_reversed, l33t=False))
+
+            if not readings or word_length < 2 or l33t_before[j + 1] == l33t_before[i]:
+                continue
+            if ambiguous_before[j + 1] == ambiguous_before[i]:
+                subbed_words = (readings[0][i:j + 1],)
+            else:
+                subbed_words = {reading[i:j + 1] for reading in readings}
+            for subbed_word in subbed_words:
+                found = entries.get(subbed_word)
+                if found:
+                    token = password[i:j + 1]
+                    guesses = uppercase_variations(token) * l33t_variations(word, subbed_word)
+                    for name, rank, is_reversed in table.rankings(found):
+                        if not is_reversed:
+                            matches.append(Match('dictionary', i, j, token, rank * guesses,
+                                                 dictionary=name, rank=rank, word=subbed_word,
+                                                 reversed=False, l33t=True))
+    return matches
+
+
+def l33t_variations(word, subbed_word):
+    """Ways an attacker could have applied the substitutions seen in this word."""
+    total = 1
+    for subbed, letter in {(char, subbed_char) for char, subbed_char in zip(word, subbed_word) if char != subbed_char}:
+        total *= variations(word.count(subbed), word.count(letter))
+    return total
+
+
+def walk_matches(password):
+    """Keyboard walks on every layout and sequences, from one pass of the walk detector."""
+    walks = find_walks(password)
+    matches = []
+    for walk in walks:
+        token = password[walk.i:walk.j + 1]
+        if walk.kind == 'spatial':
+            layout = LAYOUTS_BY_NAME[walk.name]
+            guesses = spatial_guesses(len(token), walk.turns, walk.shifted,
+                                      layout.starting_positions, layout.average_degree)
+            matches.append(Match('spatial', walk.i, walk.j, token, guesses,
+                                 graph=walk.name, turns=walk.turns, shifted=walk.shifted))
+        else:
+            matches.append(Match('sequence', walk.i, walk.j, token, sequence_guesses(token, walk.delta),
+                                 alphabet=walk.name, ascending=walk.delta > 0))
+    return matches, walks
+
+
+def spatial_guesses(length, turns, shifted, starting_positions, average_degree):
+    guesses = 0
+    for i in range(2, length + 1):
+        for j in range(1, min(turns, i - 1) + 1):
+            guesses += math.comb(i - 1, j - 1) * starting_positions * average_degree ** j
+    if shifted:
+        guesses *= variations(shifted, length - shifted) if shifted < length else 2
+    return int(guesses)
+
+
+def repeat_matches(password, table):
+    """Repeated blocks such as "aaaa" or "abcabc", priced as the block times the repeat count."""
+    matches = []
+    last_index = 0
+    while last_index < len(password):
+        greedy = REPEAT_GREEDY.search(password, last_index)
+        if greedy is None:
+            break
+        lazy = REPEAT_LAZY.search(password, last_index)
+        if len(greedy.group(0)) > len(lazy.group(0)):
+            # "aabaab": the greedy match is longer, its shortest repeating unit is the base
+            match = greedy
+            base = REPEAT_LAZY_ANCHORED.match(greedy.group(0)).group(1)
+        else:
+            match = lazy
+            base = lazy.group(1)
+
+        repeat_count = len(match.group(0)) // len(base)
+        base_guesses = _estimate(base, table).guesses
+        matches.append(Match('repeat', match.start(), match.end() - 1, match.group(0), base_guesses * repeat_count,
+                             base=base, repeat_count=repeat_count))
+        last_index = match.end()
+    return matches
+
+
+def sequence_guesses(token, delta):
+    first = token[0]
+    if first in 'aAzZ019':
+        base = 4
+    elif first.isdigit():
+        base = 10
+    else:
+        base = 26
+    return base * len(token) * (1 if delta > 0 else 2)
+
+
+def _day_month(first, second):
+    for day, month in ((first, second), (second, first)):
+        if 1 <= day <= 31 and 1 <= month <= 12:
+            return day, month
+    return None
+
+
+def _two_to_four_digit_year(year):
+    if year > 99:
+        return year
+    return 1900 + year if year > 50 else 2000 + year
+
+
+def _to_date(numbers):
+    """Read three integers as (year, month, day), or None when no reading is plausible."""
+    if not 0 < numbers[1] <= 31:
+        return None
+    over_12 = over_31 = under_1 = 0
+    for number in numbers:
+        if 99 < number < DATE_MIN_YEAR or number > DATE_MAX_YEAR:
+            return None
+        over_31 += number > 31
+        over_12 += number > 12
+        under_1 += number <= 0
+    if over_31 >= 2 or over_12 == 3 or under_1 >= 2:
+        return None
+
+    splits = ((numbers[2], numbers[0], numbers[1]), (numbers[0], numbers[1], numbers[2]))
+    for year, first, second in splits:
+        if DATE_MIN_YEAR <= year <= DATE_MAX_YEAR:
+            day_month = _day_month(first, second)
+            return (year, day_month[1], day_month[0]) if day_month else None
+    for year, first, second in splits:
+        day_month = _day_month(first, second)
+        if day_month:
+            return _two_to_four_digit_year(year), day_month[1], day_month[0]
+    return None
+
+
+def date_guesses(year, separator):
+    return max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE) * 365 * (4 if separator else 1)
+
+
+def date_matches(password):
+    """Dates with or without separators, e.g. "13.5.1991" or "051391", and recent years."""
+    matches = []
+    length = len(password)
+
+    for run in DIGIT_RUN.finditer(password):
+        for i in range(run.start(), run.end() - 3):
+            for j in range(i + 3, min(run.end(), i + 8)):
+                token = password[i:j + 1]
+                candidates = [_to_date((int(token[:k]), int(token[k:l]), int(token[l:])))
+                              for k, l in DATE_SPLITS[len(token)]]
+                candidates = [candidate for candidate in candidates if candidate]
+                if not candidates:
+                    continue
+                year, month, day = min(candidates, key=lambda candidate: abs(candidate[0] - REFERENCE_YEAR))
+                matches.append(Match('date', i, j, token, date_guesses(year, ''),
+                                     separator='', year=year, month=month, day=day))
+
+    # Only worth scanning when a separator sits between two digits somewhere
+    if SEPARATED_DIGITS.search(password):
+        for i in range(length - 5):
+            for j in range(i + 5, min(length, i + 10)):
+                token = password[i:j + 1]
+                found = DATE_WITH_SEPARATOR.match(token)
+                if found is None:
+                    continue
+                parsed = _to_date((int(found.group(1)), int(found.group(3)), int(found.group(4))))
+                if parsed is None:
+                    continue
+                year, month, day = parsed
+                matches.append(Match('date', i, j, token, date_guesses(year, found.group(2)),
+                                     separator=found.group(2), year=year, month=month, day=day))
+
+    # "1991" inside "13051991" is already explained by the longer date
+    matches = [match for match in matches
+               if not any(other is not match and other.i <= match.i and other.j >= match.j for other in matches)]
+
+    for found in RECENT_YEAR.finditer(password):
+        year = int(found.group(0))
+        matches.append(Match('year', found.start(), found.end() - 1, found.group(0),
+                             max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE), year=year))
+    return matches
+
+
+def omnimatch(password, table):
+    """Return (every match, the keyboard walks and sequences found)."""
+    matches, walks = walk_matches(password)
+    matches += dictionary_matches(password, table) + repeat_matches(password, table) + date_matches(password)
+    return matches, walks
+
+
+# --- Search ---
+def estimate(password, policy=None):
+    """Return the GuessEstimate for a password under a policy engine (the current one by default).
+
+    Only the first MAX_MATCHED_LENGTH characters are rated.
+    """
+    table = (policy or current_policy()).dictionary_table
+    return _estimate(password[:MAX_MATCHED_LENGTH], table)
+
+
+def _estimate(password, table):
+    length = len(password)
+    if not length:
+        return GuessEstimate(1, [], [])
+
+    matches, walks = omnimatch(password, table)
+    matches_by_end = [[] for _ in range(length)]
+    for match in matches:
+        matches_by_end[match.j].append(match)
+
+    # best[k][l]: cheapest way to explain password[:k + 1] with l matches, as (total, product, match)
+    best = [{} for _ in range(length)]
+
+    def guesses_for(match):
+        if match.j - match.i + 1 == length:
+            return match.guesses
+        floor = MIN_SUBMATCH_GUESSES_SINGLE_CHAR if match.i == match.j else MIN_SUBMATCH_GUESSES_MULTI_CHAR
+        return max(match.guesses, floor)
+
+    # Brute force over the whole password costs about 10^length, and every extra match
+    # adds MIN_GUESSES_BEFORE_GROWING_SEQUENCE times more, so longer sequences never win
+    max_count = 1
+    while MIN_GUESSES_BEFORE_GROWING_SEQUENCE ** max_count <= BRUTEFORCE_CARDINALITY ** length:
+        max_count += 1
+
+    def update(match, count):
+        if count > max_count:
+            return
+        k = match.j
+        product = guesses_for(match)
+        if count > 1:
+            product *= best[match.i - 1][count - 1][1]
+        total = math.factorial(count) * product + MIN_GUESSES_BEFORE_GROWING_SEQUENCE ** (count - 1)
+        # Skip when a sequence with no more matches is already at least as cheap
+        for other_count, (other_total, _, _) in best[k].items():
+            if other_count <= count and other_total <= total:
+                return
+        best[k][count] = (total, product, match)
+
+    # (i, counts): brute force may start at i after `count` matches whose last one is not brute force
+    open_starts = []
+    for k in range(length):
+        for match in matches_by_end[k]:
+            if match.i > 0:
+                for count in list(best[match.i - 1]):
+                    update(match, count + 1)
+            else:
+                update(match, 1)
+
+        # Brute force over password[i:k + 1], joined to anything that did not itself end in brute force
+        update(bruteforce_match(password, 0, k), 1)
+        for i, counts in open_starts:
+            match = bruteforce_match(password, i, k)
+            for count in counts:
+                update(match, count + 1)
+
+        # best[k] is final now; only positions after a pattern match can start a brute-force run
+        counts = [count for count, (_, _, previous) in best[k].items() if previous.pattern != 'bruteforce']
+        if counts:
+            open_starts.append((k + 1, counts))
+
+    # Walk back from the cheapest full explanation
+    final = best[length - 1]
+    count = min(final, key=lambda c: final[c][0])
+    guesses = final[count][0]
+    sequence = []
+    k = length - 1
+    while k >= 0:
+        match = best[k][count][2]
+        sequence.append(match)
+        k = match.i - 1
+        count -= 1
+    sequence.reverse()
+    return GuessEstimate(guesses, sequence, walks)
+
+
+def bruteforce_match(password, i, j):
+    token = password[i:j + 1]
+    return Match('bruteforce', i, j, token, BRUTEFORCE_CARDINALITY ** len(token))
@@ -0,0 +1,52 @@
+from modules.form_results import FORM_FIELDS, FormResults
+from modules.form_validator import FormValidator
+from modules.form_sanitizer import FormSanitizer
+from modules.security_policy import current_policy
+
+
+class IncrementalFormValidator:
+    """Validates and sanitizes a form, recomputing only the fields whose input changed since the last run
+    or every field once the security policy version changes"""
+
+    def __init__(self, contexts=None):
+        self.contexts = contexts or {}
+        self.last_inputs = {}
+        self.policy_version = None
+        self.validation_results = FormResults()
+        self.sanitization_results = FormResults()
+
+    def update(self, form_data):
+        """Refresh results for changed fields and return the list of fields that were recomputed."""
+        changed = []
+
+        # Results computed under an older policy are stale even where the input is not
+        version = current_policy().version
+        if version != self.policy_version:
+            self.reset()
+            self.policy_version = version
+
+        for field in FORM_FIELDS:
+            if field not in form_data:
+                continue
+
+            value = form_data[field]
+            if field in self.last_inputs and self.last_inputs[field] == value:
+                continue
+
+            self.validation_results[field] = FormValidator.validate_field(field, value)
+            self.sanitization_results[field] = FormSanitizer.sanitize_field(
+                field, value, self.contexts.get(field))
+            self.last_inputs[field] = value
+            changed.append(field)
+
+        return changed
+
+    def snapshot(self):
+        """Return copies of the remembered inputs and results, safe to hand to another thread."""
+        return dict(self.last_inputs), self.validation_results.copy(), self.sanitization_results.copy()
+
+    def reset(self):
+        """Forget all remembered inputs so the next update recomputes every field."""
+        self.last_inputs.clear()
+        self.validation_results = FormResults()
+        self.sanitization_results = FormResults()
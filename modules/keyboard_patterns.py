@@ -0,0 +1,217 @@
+"""
+Keyboard Walks and Sequences
+Adjacency graphs for the QWERTY, AZERTY and numeric keypad layouts and ordered
+sequence tables, with a detector that finds every walk in one pass
+
+All tables are built at import. They are folded into a single lookup from a
+pair of consecutive characters to the steps that pair takes on each layout or
+alphabet, so finding walks costs one dictionary lookup per character no matter
+how many layouts are tracked.
+"""
+
+# Slanted layouts as (offset in half keys, keys); each key is its unshifted then shifted character
+QWERTY_ROWS = (
+    (0, "`~ 1! 2@ 3# 4$ 5% 6^ 7& 8* 9( 0) -_ =+"),
+    (3, "qQ wW eE rR tT yY uU iI oO pP [{ ]} \\|"),
+    (4, "aA sS dD fF gG hH jJ kK lL ;: '\""),
+    (5, "zZ xX cC vV bB nN mM ,< .> /?"),
+)
+
+AZERTY_ROWS = (
+    (0, "²³ &1 é2 \"3 '4 (5 -6 è7 _8 ç9 à0 )° =+"),
+    (3, "aA zZ eE rR tT yY uU iI oO pP ^¨ $£"),
+    (4, "qQ sS dD fF gG hH jJ kK lL mM ù% *µ"),
+    (3, "<> wW xX cC vV bB nN ,? ;. :/ !§"),
+)
+
+# Aligned layouts as rows of single keys; None is a gap
+KEYPAD_ROWS = (
+    (None, '/', '*', '-'),
+    ('7', '8', '9', '+'),
+    ('4', '5', '6', None),
+    ('1', '2', '3', None),
+    (None, '0', '.', None),
+)
+
+# Alphabets read as sequences, e.g. "abcd", "zyx" or "7890"; cyclic ones wrap around
+SEQUENCE_ALPHABETS = (
+    ('lower', "abcdefghijklmnopqrstuvwxyz", False),
+    ('upper', "ABCDEFGHIJKLMNOPQRSTUVWXYZ", False),
+    ('digits', "1234567890", True),
+)
+
+# Largest step still read as a sequence, e.g. "aceg" or "9630"
+MAX_SEQUENCE_DELTA = 5
+
+
+class Layout:
+    """One keyboard layout: its adjacency graph and the numbers used to price a walk on it."""
+
+    def __init__(self, name, label, graph, shifted):
+        self.name = name
+        self.label = label
+        self.graph = graph
+        self.shifted = frozenset(shifted)
+        self.starting_positions = len(graph)
+        self.average_degree = sum(
+            sum(1 for neighbour in neighbours if neighbour) for neighbours in graph.values()) / len(graph)
+
+
+def build_slanted_graph(rows):
+    """Map every character to its neighbouring keys in six fixed directions.
+
+    A key's neighbours are the keys either side of it and the two overlapping
+    it above and below. Missing neighbours are None, so a direction index
+    always points the same way.
+    """
+    positions = {}
+    for y, (offset, keys) in enumerate(rows):
+        for column, key in enumerate(keys.split()):
+            positions[(offset + 2 * column, y)] = key
+
+    graph = {}
+    for (x, y), key in positions.items():
+        neighbours = [positions.get(position) for position in (
+            (x - 2, y), (x - 1, y - 1), (x + 1, y - 1), (x + 2, y), (x + 1, y + 1), (x - 1, y + 1))]
+        for char in key:
+            graph[char] = neighbours
+    return graph
+
+
+def build_aligned_graph(rows):
+    """Map every key of a grid layout to its neighbours in eight fixed directions."""
+    positions = {(x, y): key for y, row in enumerate(rows) for x, key in enumerate(row) if key}
+
+    graph = {}
+    for (x, y), key in positions.items():
+        graph[key] = [positions.get(position) for position in (
+            (x - 1, y), (x - 1, y - 1), (x, y - 1), (x + 1, y - 1),
+            (x + 1, y), (x + 1, y + 1), (x, y + 1), (x - 1, y + 1))]
+    return graph
+
+
+def _shifted_keys(rows):
+    return [key[1] for _, keys in rows for key in keys.split()]
+
+
+LAYOUTS = (
+    Layout('qwerty', "QWERTY", build_slanted_graph(QWERTY_ROWS), _shifted_keys(QWERTY_ROWS)),
+    Layout('azerty', "AZERTY", build_slanted_graph(AZERTY_ROWS), _shifted_keys(AZERTY_ROWS)),
+    Layout('keypad', "keypad", build_aligned_graph(KEYPAD_ROWS), ()),
+)
+LAYOUTS_BY_NAME = {layout.name: layout for layout in LAYOUTS}
+
+
+def _build_steps():
+    """Return {(previous, current): ((track, direction, shifted), ...)} for every layout and alphabet.
+
+    Tracks are numbered layouts first, then alphabets. For a layout, direction
+    is the neighbour slot and shifted says the current character needs Shift;
+    for an alphabet, direction is the signed step.
+    """
+    steps = {}
+    for track, layout in enumerate(LAYOUTS):
+        for char, neighbours in layout.graph.items():
+            for direction, neighbour in enumerate(neighbours):
+                if not neighbour:
+                    continue
+                for index, adjacent in enumerate(neighbour):
+                    steps.setdefault((char, adjacent), []).append((track, direction, index == 1))
+
+    for offset, (_, alphabet, cyclic) in enumerate(SEQUENCE_ALPHABETS):
+        track = len(LAYOUTS) + offset
+        size = len(alphabet)
+        # Smallest steps first, so a cyclic pair such as "16" reads as +5 rather than -5
+        deltas = sorted(range(-MAX_SEQUENCE_DELTA, MAX_SEQUENCE_DELTA + 1), key=lambda delta: (abs(delta), delta < 0))
+        for i, char in enumerate(alphabet):
+            for delta in deltas:
+                j = i + delta
+                if delta == 0 or (not cyclic and not 0 <= j < size):
+                    continue
+                found = steps.setdefault((char, alphabet[j % size]), [])
+                if all(step[0] != track for step in found):
+                    found.append((track, delta, False))
+
+    return {pair: tuple(found) for pair, found in steps.items()}
+
+
+STEPS = _build_steps()
+SEQUENCE_TRACK_START = len(LAYOUTS)
+TRACK_NAMES = tuple(layout.name for layout in LAYOUTS) + tuple(name for name, _, _ in SEQUENCE_ALPHABETS)
+
+
+class Walk:
+    """A keyboard walk or sequence covering password[i:j + 1].
+
+    For a walk, turns counts direction changes and shifted counts keys that
+    need Shift; for a sequence, delta is the step between characters.
+    """
+
+    __slots__ = ('kind', 'name', 'i', 'j', 'turns', 'shifted', 'delta')
+
+    def __init__(self, kind, name, i, j, turns=0, shifted=0, delta=0):
+        self.kind = kind
+        self.name = name
+        self.i = i
+        self.j = j
+        self.turns = turns
+        self.shifted = shifted
+        self.delta = delta
+
+    def __repr__(self):
+        return f"Walk({self.kind!r}, {self.name!r}, {self.i}, {self.j})"
+
+
+def _close(walks, track, start, end, state):
+    length = end - start + 1
+    if track < SEQUENCE_TRACK_START:
+        # Walks need three keys; two adjacent keys are too common to mean anything
+        if length > 2:
+            walks.append(Walk('spatial', TRACK_NAMES[track], start, end, turns=state[1], shifted=state[2]))
+    elif length > 2 or abs(state[1]) == 1:
+        walks.append(Walk('sequence', TRACK_NAMES[track], start, end, delta=state[1]))
+
+
+def find_walks(password):
+    """Return every keyboard walk and sequence in the password, found in one left-to-right pass."""
+    walks = []
+    # track -> [start, turns or delta, shifted, last direction] for runs of two or more characters
+    active = {}
+    steps_for = STEPS.get
+
+    for k in range(1, len(password)):
+        steps = steps_for((password[k - 1], password[k]))
+        if steps is None:
+            # Most pairs in a random password: every run ends here
+            for track, state in active.items():
+                _close(walks, track, state[0], k - 1, state)
+            active = {}
+            continue
+
+        extended = {}
+        for track, direction, shifted in steps:
+            state = active.pop(track, None)
+            if track < SEQUENCE_TRACK_START:
+                if state is None:
+                    layout = LAYOUTS[track]
+                    state = [k - 1, 1, (password[k - 1] in layout.shifted) + shifted, direction]
+                else:
+                    if direction != state[3]:
+                        state[1] += 1
+                        state[3] = direction
+                    state[2] += shifted
+            elif state is not None and state[1] != direction:
+                # A sequence keeps one step; a new step starts a new sequence at the shared character
+                _close(walks, track, state[0], k - 1, state)
+                state = [k - 1, direction, 0, None]
+            elif state is None:
+                state = [k - 1, direction, 0, None]
+            extended[track] = state
+
+        for track, state in active.items():
+            _close(walks, track, state[0], k - 1, state)
+        active = extended
+
+    for track, state in active.items():
+        _close(walks, track, state[0], len(password) - 1, state)
+    return walks
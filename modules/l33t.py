@@ -0,0 +1,67 @@
+"""
+L33t Normalization
+Reads common character substitutions back as letters, e.g. "dr4g0n" as "dragon"
+
+Expanding every substitutable position independently needs up to 2^n strings
+for n substituted characters. Instead every character is read the same way
+throughout the password, so only the three characters that can stand for two
+letters ('1' for i or l, '7' for l or t, '|' for i or l) multiply the readings.
+That caps a password at 8 readings whatever its length, each produced by one
+str.translate call with a table prepared at import.
+"""
+
+from itertools import product
+
+# Letter -> characters commonly typed in its place
+L33T_SUBSTITUTIONS = {
+    'a': '4@', 'b': '8', 'c': '({[<', 'e': '3', 'g': '69', 'i': '1!|',
+    'l': '1|7', 'o': '0', 's': '$5', 't': '+7', 'x': '%', 'z': '2',
+}
+
+
+def _readings():
+    readings = {}
+    for letter, chars in L33T_SUBSTITUTIONS.items():
+        for char in chars:
+            readings.setdefault(char, []).append(letter)
+    return readings
+
+
+READINGS = _readings()
+L33T_CHARACTERS = frozenset(READINGS)
+AMBIGUOUS = tuple(sorted(char for char, letters in READINGS.items() if len(letters) > 1))
+_UNAMBIGUOUS = {char: letters[0] for char, letters in READINGS.items() if len(letters) == 1}
+
+
+def _build_tables():
+    """Return {mask: (table, ...)}: one translate table per reading of the ambiguous characters in mask.
+
+    Bit k of mask is set when AMBIGUOUS[k] occurs in the text; ambiguous
+    characters outside the mask keep their first reading, so every table
+    for a mask yields a different string.
+    """
+    tables = {}
+    for mask in range(1 << len(AMBIGUOUS)):
+        options = [READINGS[char] if mask & (1 << k) else READINGS[char][:1] for k, char in enumerate(AMBIGUOUS)]
+        tables[mask] = tuple(str.maketrans({**_UNAMBIGUOUS, **dict(zip(AMBIGUOUS, choice))})
+                             for choice in product(*options))
+    return tables
+
+
+TABLES = _build_tables()
+MAX_READINGS = max(map(len, TABLES.values()))
+
+
+def l33t_readings(text):
+    """Return the l33t readings of lowercase text, e.g. ('dragon',) for 'dr4g0n'.
+
+    Empty when the text has no substitutable characters; never more than
+    MAX_READINGS strings, each the same length as text.
+    """
+    if L33T_CHARACTERS.isdisjoint(text):
+        return ()
+    mask = 0
+    for k, char in enumerate(AMBIGUOUS):
+        if char in text:
+            mask |= 1 << k
+    return tuple(text.translate(table) for table in TABLES[mask])
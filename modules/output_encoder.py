@@ -0,0 +1,93 @@
+import html
+import string
+
+# Characters that never need encoding in any output context
+SAFE_CHARACTERS = frozenset(string.ascii_letters + string.digits)
+URL_SAFE_CHARACTERS = SAFE_CHARACTERS | frozenset('-_.~')
+
+# Characters that may start a spreadsheet formula when a CSV cell is opened
+CSV_FORMULA_TRIGGERS = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _build_table(encode_char, safe=SAFE_CHARACTERS):
+    """Build a 256-entry translate table indexed by codepoint.
+
+    A list is used instead of a dict because str.translate indexes it directly,
+    and codepoints past the end raise IndexError, which leaves them unchanged.
+    """
+    return [
+        chr(codepoint) if chr(codepoint) in safe else encode_char(codepoint)
+        for codepoint in range(256)
+    ]
+
+
+# Translate tables - computed once at import
+HTML_ATTR_TABLE = _build_table(lambda codepoint: f'&#x{codepoint:02X};')
+JS_STRING_TABLE = _build_table(lambda codepoint: f'\\x{codepoint:02X}')
+URL_COMPONENT_TABLE = _build_table(lambda byte: f'%{byte:02X}', safe=URL_SAFE_CHARACTERS)
+
+
+def encode_html(value):
+    """Encode a value for use as HTML element content."""
+    # html.escape already runs five C-level replaces, which beats a translate table for so few characters
+    return html.escape(value)
+
+
+def encode_html_attribute(value):
+    """Encode a value for use inside a quoted or unquoted HTML attribute."""
+    return value.translate(HTML_ATTR_TABLE)
+
+
+def encode_js_string(value):
+    """Encode a value for use inside a single- or double-quoted JavaScript string literal."""
+    encoded = value.translate(JS_STRING_TABLE)
+
+    # Line and paragraph separators terminate string literals in older engines
+    if not encoded.isascii():
+        encoded = encoded.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+
+    return encoded
+
+
+def encode_url_component(value):
+    """Percent-encode a value for use as a URL path segment or query parameter."""
+    # Decoding the UTF-8 bytes as Latin-1 maps each byte to one codepoint below 256
+    return value.encode('utf-8').decode('latin-1').translate(URL_COMPONENT_TABLE)
+
+
+def neutralize_csv_formula(value):
+    """Prefix a value that a spreadsheet would otherwise evaluate as a formula."""
+    if value.startswith(CSV_FORMULA_TRIGGERS):
+        return "'" + value
+    return value
+
+
+def encode_csv_cell(value):
+    """Quote a value as a CSV cell and neutralize leading spreadsheet formula characters."""
+    return '"' + neutralize_csv_formula(value).replace('"', '""') + '"'
+
+
+ENCODERS = {
+    'html': encode_html,
+    'html_attribute': encode_html_attribute,
+    'js_string': encode_js_string,
+    'url_component': encode_url_component,
+    'csv': encode_csv_cell,
+}
+
+CONTEXT_LABELS = {
+    'html': "HTML content",
+    'html_attribute': "HTML attribute",
+    'js_string': "JavaScript string",
+    'url_component': "URL component",
+    'csv': "CSV cell",
+}
+
+
+def encode_for_context(value, context):
+    """Encode a value for the named output context."""
+    try:
+        encoder = ENCODERS[context]
+    except KeyError:
+        raise ValueError(f"Unknown output context: {context}") from None
+    return encoder(value)
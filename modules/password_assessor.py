@@ -1,55 +1,112 @@
-def assess_password_strength(password):
-    """Assess password strength and provide rating, color, and feedback."""
-    # Security checks
-    common_passwords = ["password", "123456", "qwerty", "admin", "letmein", "welcome"]
-    dictionary_words = ["apple", "computer", "dragon", "monkey"]
+from modules.guess_estimator import estimate
+from modules.keyboard_patterns import LAYOUTS_BY_NAME
+from modules.password_similarity import get_similarity_index
+from modules.security_policy import current_policy
+from utils.metrics import timed
+
+# Shorter walks and sequences are only reported when they are part of the cheapest explanation
+MIN_REPORTED_WALK = 4
+
+# Feedback for each pattern the cheapest explanation of the password relies on;
+# keyboard walks and sequences are reported from the walk detector instead
+PATTERN_FEEDBACK = {
+    'repeat': "- Repeated characters detected",
+    'date': "- Date detected",
+    'year': "- Recent year detected",
+}
+
+
+def reported_walks(guess_estimate):
+    """Walks worth mentioning: long ones and those the estimate relies on, minus any inside a longer one."""
+    used = {(match.i, match.j) for match in guess_estimate.sequence if match.pattern in ('spatial', 'sequence')}
+    walks = [walk for walk in guess_estimate.walks
+             if walk.j - walk.i + 1 >= MIN_REPORTED_WALK or (walk.i, walk.j) in used]
+    return [walk for walk in walks
+            if not any(other.i <= walk.i and other.j >= walk.j and other.j - other.i > walk.j - walk.i
+                       for other in walks)]
+
 
-    # Criteria checks
-    has_length = len(password) >= 12
-    has_upper = any(c.isupper() for c in password)
-    has_lower = any(c.islower() for c in password)
-    has_num = any(c.isdigit() for c in password)
+def pattern_feedback(guess_estimate):
+    """Feedback lines for the patterns in a GuessEstimate, in password order."""
+    feedback = []
+    whole = len(guess_estimate.sequence) == 1
+    for match in guess_estimate.sequence:
+        if match.pattern == 'dictionary':
+            if match.details['dictionary'] != 'passwords':
+                line = "- Dictionary word detected"
+            elif whole:
+                line = "- Common password detected"
+            else:
+                line = "- Contains a common password"
+            if match.details['l33t']:
+                line += " (substitutions like '@' for 'a' are guessed too)"
+            elif match.details['reversed']:
+                line += " (reversed words are guessed too)"
+        else:
+            line = PATTERN_FEEDBACK.get(match.pattern)
+        if line and line not in feedback:
+            feedback.append(line)
+
+    for walk in reported_walks(guess_estimate):
+        if walk.kind == 'spatial':
+            line = f"- Keyboard walk detected ({LAYOUTS_BY_NAME[walk.name].label} layout)"
+        else:
+            line = "- Sequence detected (e.g. abc, 123)"
+        if line not in feedback:
+            feedback.append(line)
+    return feedback
 
-    special_chars = "!@#$%^&*()_+-=[]{};:'\",.<>?/\\|"
-    has_special = any(c in special_chars for c in password)
 
-    is_common = password.lower() in common_passwords
-    has_dict_word = any(word in password.lower() for word in dictionary_words)
+@timed("assess_password_strength")
+def assess_password_strength(password):
+    """Assess password strength and provide rating, color, and feedback.
 
-    # Calculate score
-    score = sum([has_length, has_upper, has_lower, has_num, has_special, not is_common, not has_dict_word])
+    The rating comes from the estimated number of guesses an attacker needs;
+    the character-class checks only shape the advice given for weaker passwords.
+    """
+    # One engine for the whole call, so a policy reload cannot mix old and new rules
+    policy = current_policy()
+    guess_estimate = estimate(password, policy)
+    guesses_log10 = guess_estimate.guesses_log10
+
+    # Determine rating
+    if policy.is_common_password(password) or guesses_log10 < policy.moderate_min_guesses_log10:
+        rating = "WEAK"
+        color = "#FF4444"
+    elif guesses_log10 >= policy.strong_min_guesses_log10:
+        return "STRONG", "#00C853", ["+ Excellent security!"]
+    else:
+        rating = "MODERATE"
+        color = "#FF9800"
 
     # Generate feedback
     feedback = []
-    if not has_length:
-        feedback.append("- Minimum 12 characters")
-    if not has_upper:
+    if len(password) < policy.strong_length:
+        feedback.append(f"- Minimum {policy.strong_length} characters")
+    if not any(c.isupper() for c in password):
         feedback.append("- Missing uppercase letter")
-    if not has_lower:
+    if not any(c.islower() for c in password):
         feedback.append("- Missing lowercase letter")
-    if not has_num:
+    if not any(c.isdigit() for c in password):
         feedback.append("- Missing a number")
-    if not has_special:
+    if not any(c in policy.special_characters for c in password):
         feedback.append("- Missing a special character")
+    feedback.extend(pattern_feedback(guess_estimate))
+    feedback.append(f"- Could be guessed in about 10^{int(guesses_log10)} attempts")
 
-    # Determine rating
-    if is_common or has_dict_word or score <= 4:
-        rating = "WEAK"
-        color = "#FF4444"
-        if is_common:
-            feedback.append("- Common password detected")
-        if has_dict_word:
-            feedback.append("- Dictionary word detected")
+    return rating, color, feedback
 
-    elif score >= 6 and has_special:
-        rating = "STRONG"
-        color = "#00C853"
-        feedback = ["+ Excellent security!"]
 
-    else:
-        rating = "MODERATE"
-        color = "#FF9800"
-        if not has_special:
-            feedback.append("- Note: Missing special characters")
+def check_password_reuse(password, assessment, index=None):
+    """Downgrade an assessment to WEAK when the password is a near-duplicate of one already issued.
+
+    Kept apart from assess_password_strength, whose results are cached and so
+    must not depend on the issued-password history.
+    """
+    index = index or get_similarity_index()
+    if not index.is_near_duplicate(password):
+        return assessment
 
-    return rating, color, feedback
\ No newline at end of file
+    _, _, feedback = assessment
+    feedback = [line for line in feedback if not line.startswith("+")]
+    return "WEAK", "#FF4444", ["- Too similar to a previously issued password"] + feedback
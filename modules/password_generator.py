@@ -1,8 +1,14 @@
 import hashlib
+import math
 import random
+import secrets
 import string
 
+from utils.constants import GENERATE_DISTINCT_ATTEMPTS, PASSPHRASE_SEPARATOR
+from utils.metrics import timed
 
+
+@timed("generate_secure_password")
 def generate_secure_password(length):
     """Generate a password containing uppercase, lowercase, digits, and special characters."""
     # Define character sets
@@ -27,6 +33,42 @@ def generate_secure_password(length):
             return password
 
 
+def generate_distinct_password(length, index=None):
+    """Generate a password that is not a near-duplicate of any already issued.
+
+    Returns None if every attempt came out too similar, which for random
+    passwords of the allowed lengths only happens when the index is broken.
+    """
+    if index is None:
+        from modules.password_similarity import get_similarity_index
+
+        index = get_similarity_index()
+
+    for _ in range(GENERATE_DISTINCT_ATTEMPTS):
+        password = generate_secure_password(length)
+        if not index.is_near_duplicate(password):
+            return password
+    return None
+
+
+@timed("generate_passphrase")
+def generate_passphrase(word_count, wordlist=None, separator=PASSPHRASE_SEPARATOR):
+    """Return (passphrase, entropy in bits) for word_count words drawn from the wordlist.
+
+    Every word is an independent uniform draw, so the phrase carries exactly
+    word_count * log2(wordlist size) bits whichever words come out.
+    """
+    if wordlist is None:
+        from utils.wordlist import get_wordlist
+
+        wordlist = get_wordlist()
+
+    size = len(wordlist)
+    words = [wordlist[secrets.randbelow(size)] for _ in range(word_count)]
+    return separator.join(words), word_count * math.log2(size)
+
+
+@timed("hash_password")
 def hash_password(password):
     """Return the SHA-256 hash of a password."""
     password_bytes = password.encode('utf-8')
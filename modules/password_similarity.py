@@ -0,0 +1,239 @@
+"""
+Password Similarity
+Near-duplicate detection for issued passwords using MinHash sketches with LSH banding
+
+Each password is reduced to the set of its lowercase character n-grams, and
+that set to a MinHash signature: for every one of MINHASH_BANDS * MINHASH_ROWS
+keyed hash functions, the smallest hash of any n-gram. The share of equal
+positions in two signatures estimates the Jaccard similarity of their n-gram
+sets, so "Summer2024!" lands close to "Summer2023!" while unrelated passwords
+share almost nothing.
+
+Signatures are cut into bands of MINHASH_ROWS values and each band is bucketed
+by its hash. A query only compares signatures sharing at least one bucket, so
+its cost follows the number of near neighbours rather than the history size.
+
+No password is stored. The n-gram hashes are keyed with a secret kept in its
+own file, and only the signatures are written to the index file, appended one
+fixed-size record per issued password.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+from array import array
+
+from utils.constants import (
+    SIMILARITY_INDEX_FILE, SIMILARITY_KEY_FILE, MINHASH_NGRAM, MINHASH_BANDS, MINHASH_ROWS,
+    NEAR_DUPLICATE_SIMILARITY
+)
+
+MAGIC = b"OGMH"
+FORMAT_VERSION = 1
+
+# magic, format version, n-gram size, bands, rows, key fingerprint; padded to 8 bytes
+HEADER = struct.Struct("<4sHHHH16s4x")
+
+# Mark the start and end so "pass" and "password" differ at the boundary
+START, END = '\x02', '\x03'
+
+
+def load_key(key_file=SIMILARITY_KEY_FILE):
+    """Return the index secret, creating it (readable by the owner only) on first use."""
+    try:
+        with open(key_file, "rb") as file:
+            return file.read()
+    except FileNotFoundError:
+        pass
+
+    os.makedirs(os.path.dirname(key_file) or ".", exist_ok=True)
+    key = os.urandom(32)
+    try:
+        fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        # Another process created it first; use theirs
+        with open(key_file, "rb") as file:
+            return file.read()
+    with os.fdopen(fd, "wb") as file:
+        file.write(key)
+    return key
+
+
+def ngrams(password, size=MINHASH_NGRAM):
+    """Return the set of lowercase character n-grams of the password, boundaries included."""
+    text = START + password.lower() + END
+    return {text[k:k + size] for k in range(max(len(text) - size + 1, 1))}
+
+
+class MinHasher:
+    """Keyed MinHash: the same key always gives the same signature for the same password.
+
+    The num_perm hash functions are the consecutive 64-bit words of one
+    SHAKE-256 output over the key and the n-gram, so each n-gram costs a single
+    hash call however long the signature is.
+    """
+
+    __slots__ = ('key', 'num_perm', 'fingerprint')
+
+    def __init__(self, key, num_perm):
+        self.key = key
+        self.num_perm = num_perm
+        # Identifies the key in the index header without revealing it
+        self.fingerprint = hashlib.blake2b(b"", key=key, digest_size=16, person=b"minhash-key").digest()
+
+    def signature(self, password):
+        """Return the signature of a password as an array of num_perm uint64 values."""
+        size = self.num_perm * 8
+        columns = []
+        for gram in ngrams(password):
+            values = array('Q')
+            values.frombytes(hashlib.shake_256(self.key + gram.encode('utf-8')).digest(size))
+            columns.append(values)
+        return array('Q', map(min, zip(*columns)))
+
+
+class SimilarityIndex:
+    """Append-only LSH index of MinHash signatures for every issued password.
+
+    The whole file is read into memory on load; add() appends one record to
+    the file and the in-memory buckets. Safe to share between threads.
+    """
+
+    def __init__(self, index_file=SIMILARITY_INDEX_FILE, key_file=SIMILARITY_KEY_FILE,
+                 bands=MINHASH_BANDS, rows=MINHASH_ROWS):
+        self.index_file = index_file
+        self.bands = bands
+        self.rows = rows
+        self.num_perm = bands * rows
+        self.hasher = MinHasher(load_key(key_file), self.num_perm)
+        self.header = HEADER.pack(MAGIC, FORMAT_VERSION, MINHASH_NGRAM, bands, rows, self.hasher.fingerprint)
+        # Signatures of every entry back to back, num_perm values each
+        self.signatures = array('Q')
+        # One {band hash: entry or [entry, ...]} table per band
+        self.buckets = [{} for _ in range(bands)]
+        self._lock = threading.Lock()
+        self.load()
+
+    def __len__(self):
+        return len(self.signatures) // self.num_perm
+
+    def load(self):
+        """Read the index file; one written with another key or layout is discarded."""
+        try:
+            with open(self.index_file, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return True
+        except Exception as e:
+            print(f"Error reading similarity index: {e}")
+            return False
+
+        if data[:HEADER.size] != self.header:
+            print(f"Similarity index {self.index_file} was built with another key or layout; starting a new one")
+            self._reset()
+            return False
+
+        record_size = self.num_perm * 8
+        body = data[HEADER.size:]
+        complete = len(body) - len(body) % record_size
+        if complete != len(body):
+            # A crash mid-append left a partial last record; drop it so later appends stay aligned
+            os.truncate(self.index_file, HEADER.size + complete)
+        signatures = array('Q')
+        signatures.frombytes(body[:complete])
+        with self._lock:
+            self.signatures = signatures
+            self.buckets = [{} for _ in range(self.bands)]
+            for entry, start in enumerate(range(0, complete, record_size)):
+                self._bucket(entry, body[start:start + record_size])
+        return True
+
+    def _reset(self):
+        os.makedirs(os.path.dirname(self.index_file) or ".", exist_ok=True)
+        temp_file = f"{self.index_file}.{os.getpid()}.tmp"
+        with open(temp_file, "wb") as file:
+            file.write(self.header)
+        os.replace(temp_file, self.index_file)
+
+    def _signature_at(self, entry):
+        start = entry * self.num_perm
+        return self.signatures[start:start + self.num_perm]
+
+    def _band_keys(self, record):
+        """Return one bucket key per band of a signature given as bytes."""
+        # bytes hashes are salted per process; fine, as the buckets are rebuilt on every load
+        width = self.rows * 8
+        return [hash(record[start:start + width]) for start in range(0, len(record), width)]
+
+    def _bucket(self, entry, record):
+        for table, band_key in zip(self.buckets, self._band_keys(record)):
+            found = table.get(band_key)
+            # Almost every bucket holds one entry, so it is stored bare until a second arrives
+            if found is None:
+                table[band_key] = entry
+            elif type(found) is int:
+                table[band_key] = [found, entry]
+            else:
+                found.append(entry)
+
+    def similarity(self, password):
+        """Return the highest estimated Jaccard similarity to any issued password, 0.0 if none is close."""
+        if not len(self):
+            return 0.0
+
+        signature = self.hasher.signature(password)
+        with self._lock:
+            candidates = set()
+            for table, band_key in zip(self.buckets, self._band_keys(signature.tobytes())):
+                found = table.get(band_key)
+                if found is None:
+                    continue
+                if type(found) is int:
+                    candidates.add(found)
+                else:
+                    candidates.update(found)
+
+            best = 0
+            for entry in candidates:
+                other = self._signature_at(entry)
+                best = max(best, sum(1 for mine, theirs in zip(signature, other) if mine == theirs))
+        return best / self.num_perm
+
+    def is_near_duplicate(self, password, threshold=NEAR_DUPLICATE_SIMILARITY):
+        """True when the password is at least threshold similar to one already issued."""
+        return self.similarity(password) >= threshold
+
+    def add(self, password):
+        """Record an issued password's signature; returns False if it could not be written."""
+        signature = self.hasher.signature(password)
+        record = signature.tobytes()
+        try:
+            with self._lock:
+                os.makedirs(os.path.dirname(self.index_file) or ".", exist_ok=True)
+                with open(self.index_file, "ab") as file:
+                    if file.tell() == 0:
+                        file.write(self.header)
+                    file.write(record)
+
+                entry = len(self)
+                self.signatures.extend(signature)
+                self._bucket(entry, record)
+            return True
+        except Exception as e:
+            print(f"Error saving to similarity index: {e}")
+            return False
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_similarity_index():
+    """Return the process-wide similarity index, loading it on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = SimilarityIndex()
+    return _index
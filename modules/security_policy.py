@@ -0,0 +1,259 @@
+"""
+Security Policy
+Lengths, word lists, keyword sets and score thresholds loaded from an external
+JSON file, compiled into an immutable engine and hot-reloaded when the file changes
+
+Callers take one engine with current_policy() and use it for the whole operation,
+so a reload never changes the rules halfway through a request. A reload builds the
+new engine in a background thread and swaps it in with a single assignment;
+until then the previous engine keeps serving.
+"""
+
+import copy
+import hashlib
+import os
+import re
+import threading
+import time
+
+from utils.constants import (
+    POLICY_FILE, POLICY_CHECK_INTERVAL, SNAPSHOT_MIN_WORDS, RULESET_FILE,
+    PASSWORD_MIN_LENGTH, PASSWORD_MAX_LENGTH, PASSWORD_DEFAULT_LENGTH,
+    STRONG_PASSWORD_LENGTH, MODERATE_MIN_GUESSES_LOG10, STRONG_MIN_GUESSES_LOG10,
+    NAME_MIN_LENGTH, USERNAME_MIN_LENGTH, USERNAME_MAX_LENGTH, MESSAGE_MAX_LENGTH,
+    COMMON_PASSWORDS, DICTIONARY_WORDS, SQL_KEYWORDS, SPECIAL_CHARACTERS
+)
+from utils.metrics import timed_pattern
+
+# Used whenever the policy file is missing; a file only needs the keys it overrides
+DEFAULT_POLICY = {
+    'password': {
+        'min_length': PASSWORD_MIN_LENGTH,
+        'max_length': PASSWORD_MAX_LENGTH,
+        'default_length': PASSWORD_DEFAULT_LENGTH,
+        'strong_length': STRONG_PASSWORD_LENGTH,
+        'moderate_min_guesses_log10': MODERATE_MIN_GUESSES_LOG10,
+        'strong_min_guesses_log10': STRONG_MIN_GUESSES_LOG10,
+        'special_characters': SPECIAL_CHARACTERS,
+        'common_passwords': COMMON_PASSWORDS,
+        'dictionary_words': DICTIONARY_WORDS,
+    },
+    'form': {
+        'name_min_length': NAME_MIN_LENGTH,
+        'username_min_length': USERNAME_MIN_LENGTH,
+        'username_max_length': USERNAME_MAX_LENGTH,
+        'message_max_length': MESSAGE_MAX_LENGTH,
+        'sql_keywords': SQL_KEYWORDS,
+    },
+}
+
+
+def _check_value(section, key, value, default):
+    """Raise ValueError unless value has the same shape as the default."""
+    if isinstance(default, bool) or not isinstance(default, (int, str, list)):
+        raise TypeError(f"Unsupported default for {section}.{key}")
+    if isinstance(default, int):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise ValueError(f"{section}.{key} must be a non-negative integer")
+    elif isinstance(default, str):
+        if not isinstance(value, str):
+            raise ValueError(f"{section}.{key} must be a string")
+    elif not isinstance(value, list) or not all(isinstance(item, str) and item for item in value):
+        raise ValueError(f"{section}.{key} must be a list of non-empty strings")
+
+
+def parse_policy(data):
+    """Merge a decoded policy file over the defaults, validating every value."""
+    if not isinstance(data, dict):
+        raise ValueError("Policy file must contain a JSON object")
+
+    policy = copy.deepcopy(DEFAULT_POLICY)
+    for section, values in data.items():
+        if section not in policy:
+            raise ValueError(f"Unknown policy section: {section}")
+        if not isinstance(values, dict):
+            raise ValueError(f"Policy section '{section}' must be an object")
+        for key, value in values.items():
+            if key not in policy[section]:
+                raise ValueError(f"Unknown policy setting: {section}.{key}")
+            _check_value(section, key, value, policy[section][key])
+            policy[section][key] = value
+
+    password, form = policy['password'], policy['form']
+    if not password['min_length'] <= password['default_length'] <= password['max_length']:
+        raise ValueError("password.default_length must lie between min_length and max_length")
+    if password['moderate_min_guesses_log10'] > password['strong_min_guesses_log10']:
+        raise ValueError("password.moderate_min_guesses_log10 cannot exceed strong_min_guesses_log10")
+    if not 1 <= form['username_min_length'] <= form['username_max_length']:
+        raise ValueError("form.username_min_length must be at least 1 and at most username_max_length")
+    return policy
+
+
+def load_policy(path=POLICY_FILE):
+    """Read and validate the policy file, returning (policy, version)."""
+    if not os.path.exists(path):
+        policy = copy.deepcopy(DEFAULT_POLICY)
+        raw = b""
+    else:
+        import json
+
+        with open(path, "rb") as file:
+            raw = file.read()
+        try:
+            data = json.loads(raw)
+        except ValueError as e:
+            raise ValueError(f"Policy file is not valid JSON: {e}") from None
+        policy = parse_policy(data)
+
+    version = hashlib.sha256(raw).hexdigest()[:12] if raw else "defaults"
+    return policy, version
+
+
+class PolicyEngine:
+    """Compiled, read-only form of one policy. Never mutated after construction."""
+
+    def __init__(self, policy, version="defaults", snapshot_file=RULESET_FILE):
+        self.version = version
+        password, form = policy['password'], policy['form']
+
+        self.min_length = password['min_length']
+        self.max_length = password['max_length']
+        self.default_length = password['default_length']
+        self.strong_length = password['strong_length']
+        self.moderate_min_guesses_log10 = password['moderate_min_guesses_log10']
+        self.strong_min_guesses_log10 = password['strong_min_guesses_log10']
+        self.special_characters = frozenset(password['special_characters'])
+
+        self.name_min_length = form['name_min_length']
+        self.username_min_length = form['username_min_length']
+        self.username_max_length = form['username_max_length']
+        self.message_max_length = form['message_max_length']
+        self.username_pattern = timed_pattern("username_pattern", re.compile(
+            rf"^[a-zA-Z_][a-zA-Z0-9_]{{{self.username_min_length - 1},{self.username_max_length - 1}}}$"))
+
+        common = password['common_passwords']
+        dictionary = password['dictionary_words']
+        # Ranked lookup for the guess estimator, built here so a reload pays for it on the reload thread
+        from modules.guess_estimator import DictionaryTable
+
+        self.dictionary_table = DictionaryTable({'passwords': common, 'english': dictionary})
+
+        # First match wins, so keep the policy's order for the error message
+        self.sql_keywords = tuple(dict.fromkeys(keyword.upper() for keyword in form['sql_keywords']))
+
+        if max(len(common), len(dictionary), len(self.sql_keywords)) >= SNAPSHOT_MIN_WORDS:
+            # Large lists are served from the memory-mapped snapshot instead of Python structures
+            from utils.rule_snapshot import load_snapshot
+
+            self.snapshot = load_snapshot(snapshot_file, common, dictionary, list(self.sql_keywords))
+            self.common_passwords = None
+            self.sql_keyword_patterns = None
+        else:
+            self.snapshot = None
+            self.common_passwords = frozenset(word.lower() for word in common)
+            self.sql_keyword_patterns = tuple(
+                (keyword, timed_pattern(f"sql_keyword.{keyword}", re.compile(r'\b' + re.escape(keyword) + r'\b')))
+                for keyword in self.sql_keywords
+            )
+
+    def is_common_password(self, password):
+        if self.snapshot is not None:
+            return self.snapshot.is_common_password(password)
+        return password.lower() in self.common_passwords
+
+    def first_sql_keyword(self, text):
+        """Return the first policy SQL keyword found as a whole word in the text, or None."""
+        if self.snapshot is not None:
+            found = set(self.snapshot.find_sql_keywords(text))
+            return next((keyword for keyword in self.sql_keywords if keyword in found), None)
+
+        text_upper = text.upper()
+        for keyword, pattern in self.sql_keyword_patterns:
+            if pattern.search(text_upper):
+                return keyword
+        return None
+
+
+class PolicyManager:
+    """Holds the current PolicyEngine and rebuilds it in the background when the file changes.
+
+    current() checks the file's modification stamp at most once per check
+    interval, so the hot path is a clock read and an attribute load.
+    """
+
+    def __init__(self, path=POLICY_FILE, check_interval=POLICY_CHECK_INTERVAL):
+        self.path = path
+        self.check_interval = check_interval
+        self.stamp = self._stamp()
+        self.next_check = time.monotonic() + check_interval
+        self.reloading = False
+        self.lock = threading.Lock()
+
+        try:
+            self.engine = PolicyEngine(*load_policy(path))
+        except Exception as e:
+            print(f"Error loading security policy, using defaults: {e}")
+            self.engine = PolicyEngine(copy.deepcopy(DEFAULT_POLICY))
+
+    def _stamp(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def current(self):
+        """Return the engine to use for one whole operation."""
+        now = time.monotonic()
+        if now >= self.next_check:
+            self.next_check = now + self.check_interval
+            stamp = self._stamp()
+            if stamp != self.stamp:
+                self._start_reload(stamp)
+        return self.engine
+
+    def _start_reload(self, stamp):
+        with self.lock:
+            if self.reloading:
+                return
+            self.reloading = True
+        threading.Thread(target=self._reload, args=(stamp,), name='octoguard-policy-reload', daemon=True).start()
+
+    def _reload(self, stamp):
+        try:
+            self.reload()
+        finally:
+            self.stamp = stamp
+            with self.lock:
+                self.reloading = False
+
+    def reload(self):
+        """Rebuild the engine from the file now; a broken file keeps the current engine."""
+        try:
+            engine = PolicyEngine(*load_policy(self.path))
+        except Exception as e:
+            print(f"Error reloading security policy, keeping version {self.engine.version}: {e}")
+            return False
+
+        # A single reference assignment: callers see either the old engine or the new one
+        self.engine = engine
+        return True
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_policy_manager():
+    """Return the process-wide policy manager, loading the policy on first use."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = PolicyManager()
+    return _manager
+
+
+def current_policy():
+    """Return the current PolicyEngine."""
+    return (_manager or get_policy_manager()).current()
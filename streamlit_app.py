@@ -1,9 +1,51 @@
+import math
+import os
+import tempfile
 import streamlit as st
 from st_copy_to_clipboard import st_copy_to_clipboard # Run: pip install st-copy-to-clipboard
-from modules.password_generator import generate_secure_password, hash_password
-from modules.password_assessor import assess_password_strength
+from modules.password_generator import generate_distinct_password, generate_passphrase, hash_password
+from modules.password_assessor import assess_password_strength, check_password_reuse
+from modules.password_similarity import get_similarity_index
+from modules.entropy_generator import CHARACTER_CLASSES, generate_for_entropy, max_entropy
 from modules.form_validator import FormValidator
 from modules.form_sanitizer import FormSanitizer
+from modules.output_encoder import encode_js_string
+from modules.security_policy import current_policy
+from utils.constants import (
+    LOG_FILE, VALIDATION_RESULTS_FILE, LIVE_LOG_MAX_LINES, CACHE_MAX_ENTRIES, BULK_CHUNK_SIZE,
+    PASSPHRASE_MIN_WORDS, PASSPHRASE_MAX_WORDS, PASSPHRASE_DEFAULT_WORDS,
+    TARGET_ENTROPY_DEFAULT_BITS
+)
+from utils.log_watcher import LogFeed
+from utils.file_handler import append_results_csv, ParquetResultWriter
+from modules.bulk_validator import validate_stream
+
+# --- CACHING ---
+# The heavy objects (policy engine, similarity index, wordlist) are already
+# process-wide singletons behind current_policy(), get_similarity_index() and
+# get_wordlist(), loaded once per server process and shared by every session,
+# so st.cache_resource would add nothing.
+# Pure results are memoized with a bounded number of entries per function.
+# Policy-dependent results take the policy version so a reload misses the old entries.
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_assess(password, policy_version):
+    return assess_password_strength(password)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_validate(form_data, policy_version):
+    return FormValidator.validate_all(form_data)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_sanitize(form_data):
+    return FormSanitizer.sanitize_all(form_data)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_hash(password):
+    return hash_password(password)
+
 
 # --- PAGE SETUP ---
 st.set_page_config(page_title="OctoGuard", page_icon="🐙", layout="wide")
@@ -128,7 +170,7 @@ with st.sidebar:
     st.markdown("<h1 style='color: #FF4B4B;'>🐙 OCTOGUARD</h1>", unsafe_allow_html=True)
     st.caption("Swiss Knife Of Web Security")
     st.markdown("---")
-    page = st.radio("TOOLS", ["Password Generator", "Password Assessor", "Form Validator"])
+    page = st.radio("TOOLS", ["Password Generator", "Password Assessor", "Form Validator", "Bulk Upload", "Live Logs"])
 
     st.markdown("---")
     st.markdown("""
@@ -139,17 +181,62 @@ with st.sidebar:
     """, unsafe_allow_html=True)
 
 # --- TAB 1: PASSWORD GENERATOR ---
-if page == "Password Generator":
+@st.fragment
+def password_generator_page():
     st.markdown("## Password Generator <span style='font-size:12px; color:#00C853;'>● READY</span>", unsafe_allow_html=True)
     
     with st.container(border=True):
         st.markdown("### Configuration <div class='accent-line'></div>", unsafe_allow_html=True)
-        length = st.number_input("Password Length (8-16 CHARACTERS)", 8, 16, 12)
+        mode = st.radio("Mode", ["Random characters", "Passphrase", "Target entropy"], horizontal=True)
+        if mode == "Passphrase":
+            word_count = st.number_input(f"Words ({PASSPHRASE_MIN_WORDS}-{PASSPHRASE_MAX_WORDS})",
+                                         PASSPHRASE_MIN_WORDS, PASSPHRASE_MAX_WORDS, PASSPHRASE_DEFAULT_WORDS)
+        elif mode == "Target entropy":
+            classes = st.multiselect("Required Character Classes", CHARACTER_CLASSES, default=list(CHARACTER_CLASSES))
+            # The ceiling is what these classes reach at the policy's maximum length
+            try:
+                max_bits = math.floor(max_entropy(classes))
+            except ValueError as e:
+                max_bits = 0
+                st.error(str(e))
+            if max_bits >= 1:
+                target_bits = st.number_input(f"Target Entropy (1-{max_bits} BITS)",
+                                              1, max_bits, min(TARGET_ENTROPY_DEFAULT_BITS, max_bits))
+            else:
+                target_bits = None
+                if classes:
+                    st.error("These classes cannot form a pattern-free password; add another class")
+        else:
+            policy = current_policy()
+            length = st.number_input(f"Password Length ({policy.min_length}-{policy.max_length} CHARACTERS)",
+                                     policy.min_length, policy.max_length, policy.default_length)
         generate_clicked = st.button("Generate Password")
 
     if generate_clicked:
-        pwd = generate_secure_password(length)
-        st.session_state['current_pwd'] = pwd
+        index = get_similarity_index()
+        entropy = None
+        if mode == "Passphrase":
+            try:
+                pwd, entropy = generate_passphrase(word_count)
+            except (OSError, ValueError) as e:
+                pwd = None
+                st.error(f"No usable passphrase wordlist ({e}). Build one with: python -m utils.wordlist build WORDS.txt")
+        elif mode == "Target entropy" and target_bits is None:
+            pwd = None
+        elif mode == "Target entropy":
+            try:
+                pwd, entropy = generate_for_entropy(target_bits, classes)
+            except ValueError as e:
+                pwd = None
+                st.error(str(e))
+        else:
+            pwd = generate_distinct_password(length, index)
+            if pwd is None:
+                st.error("Could not generate a password distinct from those already issued")
+        if pwd is not None:
+            index.add(pwd)
+            st.session_state['current_pwd'] = pwd
+            st.session_state['current_entropy'] = entropy
 
     if 'current_pwd' in st.session_state:
         current_p = st.session_state['current_pwd']
@@ -158,6 +245,8 @@ if page == "Password Generator":
             
             # 1. The Password Display
             st.text_input("Password", value=current_p)
+            if st.session_state.get('current_entropy') is not None:
+                st.caption(f"Entropy: {st.session_state['current_entropy']:.1f} bits")
             
 # 2. THE COPY BUTTON
         if st.button("Copy Password"):
@@ -186,16 +275,17 @@ if page == "Password Generator":
                         document.body.removeChild(textArea);
                     }}
                 }}
-                copyToClipboard('{current_p}');
+                copyToClipboard('{encode_js_string(current_p)}');
                 </script>
             """, height=0)
             st.toast("Password copied to clipboard!")
 
             # 3. The Hash Display
-            st.text_input("SHA-256 Hash", value=hash_password(current_p))
+            st.text_input("SHA-256 Hash", value=cached_hash(current_p))
 
 # --- TAB 2: PASSWORD ASSESSOR ---
-elif page == "Password Assessor":
+@st.fragment
+def password_assessor_page():
     st.markdown("## Password Strength Assessor <span style='font-size:12px; color:#00CCFF;'>● ANALYZING</span>", unsafe_allow_html=True)
     
     with st.container(border=True):
@@ -205,7 +295,8 @@ elif page == "Password Assessor":
         analyze_btn = st.button("Analyze Strength")
 
     if analyze_btn and input_pwd:
-        rating, color, feedback = assess_password_strength(input_pwd)
+        # The reuse check reads the issued-password history, so it runs outside the cache
+        rating, color, feedback = check_password_reuse(input_pwd, cached_assess(input_pwd, current_policy().version))
         with st.container(border=True):
             st.markdown("### Security Analysis <div class='accent-line'></div>", unsafe_allow_html=True)
             st.markdown(f"<h1 style='text-align:center; color:{color};'>{rating}</h1>", unsafe_allow_html=True)
@@ -221,7 +312,8 @@ elif page == "Password Assessor":
                     st.info(item)
 
 # --- TAB 3: FORM VALIDATOR ---
-elif page == "Form Validator":
+@st.fragment
+def form_validator_page():
     st.markdown("## Form Input Validator <span style='font-size:12px; color:#FFA500;'>● VALIDATING</span>", unsafe_allow_html=True)
     col_l, col_r = st.columns(2)
     
@@ -240,8 +332,8 @@ elif page == "Form Validator":
             st.markdown("### Validation Results <div class='accent-line'></div>", unsafe_allow_html=True)
             if st.session_state.get('run_val'):
                 f_data = {'full_name': name, 'email': email, 'username': user, 'message': msg}
-                v_res = FormValidator.validate_all(f_data)
-                s_res = FormSanitizer.sanitize_all(f_data)
+                v_res = cached_validate(f_data, current_policy().version)
+                s_res = cached_sanitize(f_data)
                 
                 # Perfect Text Formatting
                 out = "VALIDATION RESULTS\n" + "─"*50 + "\n\n"
@@ -254,4 +346,142 @@ elif page == "Form Validator":
                     out += f"{f.replace('_',' ').title()}: {s_res[f]['sanitized']}\n\n"
                 
                 out += "─"*50 + "\nProcess Complete."
-                st.code(out, language="text")
\ No newline at end of file
+                st.code(out, language="text")
+
+# --- TAB 4: BULK UPLOAD ---
+def process_upload(uploaded, chunk_size, progress_bar):
+    """Validate an upload chunk by chunk, streaming results to CSV and Parquet files on disk.
+
+    Streamlit already holds the whole upload in memory; chunking bounds only the
+    result records, which are written out and dropped after each chunk. The
+    output files live in a TemporaryDirectory kept in the returned result, so
+    they are deleted once the result is replaced in session_state or the
+    server exits.
+    """
+    out_dir = tempfile.TemporaryDirectory(prefix="octoguard_")
+    name = os.path.splitext(uploaded.name)[0]
+    csv_path = os.path.join(out_dir.name, f"{name}_results.csv")
+    parquet_path = os.path.join(out_dir.name, f"{name}_results.parquet")
+
+    def write_chunk(records):
+        append_results_csv(records, csv_path)
+        if parquet_writer:
+            parquet_writer.write(records)
+
+    def show_progress(summary):
+        fraction = summary['bytes_read'] / summary['total_bytes'] if summary['total_bytes'] else 1.0
+        progress_bar.progress(min(fraction, 1.0), text=f"{summary['forms']:,} forms processed")
+
+    parquet_writer = None
+    try:
+        try:
+            import pyarrow  # noqa: F401 - Parquet output is skipped without it
+            parquet_writer = ParquetResultWriter(parquet_path)
+        except ImportError:
+            pass
+
+        uploaded.seek(0)
+        summary = validate_stream(uploaded, uploaded.name, uploaded.size, chunk_size,
+                                  progress=show_progress, on_chunk=write_chunk)
+        if parquet_writer:
+            parquet_writer.close()
+    except BaseException:
+        out_dir.cleanup()
+        raise
+
+    return {
+        'file_id': uploaded.file_id,
+        'out_dir': out_dir,
+        'chunk_size': chunk_size,
+        'summary': summary,
+        'csv': csv_path if os.path.exists(csv_path) else None,
+        'parquet': parquet_path if parquet_writer and os.path.exists(parquet_path) else None,
+    }
+
+
+@st.fragment
+def bulk_upload_page():
+    st.markdown("## Bulk Upload <span style='font-size:12px; color:#FFA500;'>● CHUNKED</span>", unsafe_allow_html=True)
+
+    with st.container(border=True):
+        st.markdown("### Upload Forms <div class='accent-line'></div>", unsafe_allow_html=True)
+        uploaded = st.file_uploader("CSV, JSON lines or Parquet with full_name, email, username and message columns",
+                                    type=["csv", "jsonl", "ndjson", "parquet"])
+        chunk_size = st.number_input("Chunk size (forms)", 100, 100000, BULK_CHUNK_SIZE, step=100)
+        process_clicked = st.button("Validate File", disabled=uploaded is None)
+
+    result = st.session_state.get('bulk_result')
+
+    # Results are kept per upload, so reruns never parse the same file again
+    if uploaded is not None and process_clicked:
+        progress_bar = st.progress(0.0, text="Starting...")
+        if result:
+            # Only one result is kept per session; remove the previous output files now
+            result['out_dir'].cleanup()
+            del st.session_state['bulk_result']
+        result = process_upload(uploaded, chunk_size, progress_bar)
+        st.session_state['bulk_result'] = result
+
+    if uploaded is None or not result or result['file_id'] != uploaded.file_id:
+        return
+
+    summary = result['summary']
+    with st.container(border=True):
+        st.markdown("### Results <div class='accent-line'></div>", unsafe_allow_html=True)
+        col_forms, col_valid, col_sanitized, col_invalid = st.columns(4)
+        col_forms.metric("Forms", f"{summary['forms']:,}")
+        col_valid.metric("Valid", f"{summary['valid']:,}")
+        col_sanitized.metric("Sanitized", f"{summary['sanitized']:,}")
+        col_invalid.metric("Invalid", f"{summary['invalid']:,}")
+
+        name = os.path.splitext(uploaded.name)[0]
+        col_csv, col_parquet = st.columns(2)
+        with col_csv:
+            if result['csv']:
+                with open(result['csv'], "rb") as file:
+                    st.download_button("Download CSV", file, file_name=f"{name}_results.csv", mime="text/csv")
+        with col_parquet:
+            if result['parquet']:
+                with open(result['parquet'], "rb") as file:
+                    st.download_button("Download Parquet", file, file_name=f"{name}_results.parquet",
+                                       mime="application/octet-stream")
+            else:
+                st.caption("Install pyarrow to enable Parquet downloads")
+
+
+# --- TAB 5: LIVE LOGS ---
+def live_logs_page():
+    st.markdown("## Live Logs <span style='font-size:12px; color:#00C853;'>● WATCHING</span>", unsafe_allow_html=True)
+
+    # One watchdog feed per server process; it reads only appended bytes when the files change
+    @st.cache_resource
+    def get_log_feed():
+        return LogFeed([LOG_FILE, VALIDATION_RESULTS_FILE], max_lines=LIVE_LOG_MAX_LINES)
+
+    feed = get_log_feed()
+
+    # The fragment only re-renders the in-memory buffers; it never re-reads the files
+    @st.fragment(run_every=1)
+    def show_live_logs():
+        col_l, col_r = st.columns(2)
+        with col_l:
+            with st.container(border=True):
+                st.markdown("### Password Log <div class='accent-line'></div>", unsafe_allow_html=True)
+                st.code("\n".join(feed.recent(LOG_FILE)) or "No password history yet.", language="text")
+        with col_r:
+            with st.container(border=True):
+                st.markdown("### Validation Results <div class='accent-line'></div>", unsafe_allow_html=True)
+                st.code("\n".join(feed.recent(VALIDATION_RESULTS_FILE)) or "No validation results yet.", language="text")
+
+    show_live_logs()
+
+
+# Only the selected page runs; button presses inside a page rerun just its fragment
+PAGES = {
+    "Password Generator": password_generator_page,
+    "Password Assessor": password_assessor_page,
+    "Form Validator": form_validator_page,
+    "Bulk Upload": bulk_upload_page,
+    "Live Logs": live_logs_page,
+}
+PAGES[page]()
@@ -2,12 +2,25 @@
 Main Application Window
 """
 
+import importlib
 import tkinter as tk
 from tkinter import ttk
+from ui.profiling import CallbackMonitor
 from utils.constants import *
-from ui.password_generator_view import PasswordGeneratorView
-from ui.password_assessor_view import PasswordAssessorView
-from ui.form_validator_view import FormValidatorView
+
+# Views are imported on first visit so startup only pays for the window chrome
+VIEW_REGISTRY = {
+    "Password Generator": ("ui.password_generator_view", "PasswordGeneratorView"),
+    "Password Assessor": ("ui.password_assessor_view", "PasswordAssessorView"),
+    "Form Validator": ("ui.form_validator_view", "FormValidatorView"),
+    "Password History": ("ui.password_history_view", "PasswordHistoryView"),
+}
+
+
+def load_view_class(name):
+    """Import a registered view module and return its view class"""
+    module_name, class_name = VIEW_REGISTRY[name]
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 class ModernButton(tk.Canvas):
@@ -55,9 +68,17 @@ class SecurityToolkit:
         self.root.geometry(WINDOW_SIZE)
         self.root.configure(bg=COLORS['bg_primary'])
 
+        # Time every Tk callback from here on; must be installed before widgets bind their handlers
+        self.monitor = CallbackMonitor(self.root, on_status=self.update_profile_status)
+        self.monitor.install()
+
         # Remove default window styling
         self.root.resizable(True, True)
 
+        # Views are built on first visit and kept alive between visits
+        self.views = {}
+        self.current_view = None
+
         # Setup styles
         self.setup_styles()
 
@@ -66,8 +87,8 @@ class SecurityToolkit:
         self.create_sidebar()
         self.create_content_area()
 
-        # Show password generator by default
-        self.show_password_generator()
+        # Show password generator by default, after the window chrome has been painted
+        self.root.after_idle(lambda: self.root.after(0, self.show_password_generator))
 
     def setup_styles(self):
         """Configure UI styles"""
@@ -125,6 +146,21 @@ class SecurityToolkit:
                                 padx=10, pady=4)
         version_label.pack()
 
+        # Debug toggle - profiles the next few actions into data/
+        self.profile_label = tk.Label(header, text="PROFILE",
+                                      font=FONTS.get('small', FONT_FALLBACKS['small']),
+                                      bg=COLORS['bg_header'],
+                                      fg=COLORS['text_muted'],
+                                      cursor='hand2')
+        self.profile_label.pack(side=tk.RIGHT, pady=20)
+        self.profile_label.bind('<Button-1>', lambda e: self.monitor.toggle_capture(PROFILE_ACTIONS))
+
+    def update_profile_status(self, text):
+        """Show the profiler state on the header toggle"""
+        active = self.monitor.capture is not None
+        self.profile_label.config(text=text.upper() if active else f"PROFILE  ({text})",
+                                  fg=COLORS['warning'] if active else COLORS['text_muted'])
+
     def create_sidebar(self):
         """Sidebar navigation"""
         sidebar = tk.Frame(self.root, bg=COLORS['nav_bg'], width=SIDEBAR_WIDTH)
@@ -145,7 +181,8 @@ class SecurityToolkit:
         nav_items = [
             ("Password Generator", self.show_password_generator),
             ("Password Assessor", self.show_password_assessor),
-            ("Form Validator", self.show_form_validator)
+            ("Form Validator", self.show_form_validator),
+            ("Password History", self.show_password_history)
         ]
 
         for text, command in nav_items:
@@ -214,9 +251,11 @@ class SecurityToolkit:
         self.content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=25, pady=25)
 
     def clear_content(self):
-        """Clear current content"""
+        """Destroy all views so they are rebuilt on their next visit"""
         for widget in self.content_frame.winfo_children():
             widget.destroy()
+        self.views = {}
+        self.current_view = None
 
     def update_nav_style(self, active_button):
         """Update navigation button styles"""
@@ -230,20 +269,43 @@ class SecurityToolkit:
                 btn.config(bg=COLORS['nav_bg'], fg=COLORS['nav_text'])
                 accent.config(bg=COLORS['nav_bg'])
 
+    def show_view(self, name, view_class=None):
+        """Show a view, importing and building it on first visit and keeping its state afterwards"""
+        if name == self.current_view:
+            return
+
+        # Build the new view before touching the current one, so a failed import or
+        # constructor leaves the current view on screen
+        if name not in self.views:
+            if view_class is None:
+                view_class = load_view_class(name)
+            frame = tk.Frame(self.content_frame, bg=COLORS['bg_primary'])
+            try:
+                self.views[name] = (frame, view_class(frame))
+            except Exception:
+                frame.destroy()
+                raise
+
+        # Hide the current view instead of destroying it
+        if self.current_view is not None:
+            self.views[self.current_view][0].pack_forget()
+
+        self.views[name][0].pack(fill=tk.BOTH, expand=True)
+        self.current_view = name
+        self.update_nav_style(name)
+
     def show_password_generator(self):
         """Display password generator view"""
-        self.clear_content()
-        self.update_nav_style("🔐 Password Generator")
-        PasswordGeneratorView(self.content_frame)
+        self.show_view("Password Generator")
 
     def show_password_assessor(self):
         """Display password assessor view"""
-        self.clear_content()
-        self.update_nav_style("📊 Password Assessor")
-        PasswordAssessorView(self.content_frame)
+        self.show_view("Password Assessor")
 
     def show_form_validator(self):
         """Display form validator view"""
-        self.clear_content()
-        self.update_nav_style("✓ Form Validator")
-        FormValidatorView(self.content_frame)
\ No newline at end of file
+        self.show_view("Form Validator")
+
+    def show_password_history(self):
+        """Display password history view"""
+        self.show_view("Password History")
\ No newline at end of file
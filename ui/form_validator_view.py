@@ -1,7 +1,12 @@
+import os
 import tkinter as tk
-from tkinter import scrolledtext
-from modules.form_validator import FormValidator
-from modules.form_sanitizer import FormSanitizer
+from datetime import datetime
+from functools import partial
+from tkinter import filedialog, scrolledtext, ttk
+from modules.form_results import FORM_FIELDS
+from modules.incremental_validator import IncrementalFormValidator
+from modules.bulk_validator import validate_file
+from ui.task_runner import BackgroundTaskRunner
 from utils.constants import *
 
 
@@ -9,9 +14,15 @@ class FormValidatorView:
 
     def __init__(self, parent):
         self.parent = parent
-        self.validation_results = {}
-        self.sanitization_results = {}
+        self.validator = IncrementalFormValidator()
+        self.validation_results = self.validator.validation_results
+        self.sanitization_results = self.validator.sanitization_results
+        self.rendered_inputs = {}
         self.create_view()
+        self.task_runner = BackgroundTaskRunner(self.parent)
+        # Bulk imports get their own worker so single-form checks never cancel them
+        self.bulk_runner = BackgroundTaskRunner(self.parent)
+        self.status_badge.bind('<Destroy>', lambda e: self.shutdown_workers())
 
     def create_view(self):
         """Create form validator interface"""
@@ -111,6 +122,40 @@ class FormValidatorView:
                                           self.validate_form)
         validate_btn.pack()
 
+        # === LEFT PANEL: BULK IMPORT ===
+        bulk_card = self.create_card(left_panel, "Bulk Import")
+
+        bulk_actions = tk.Frame(bulk_card, bg=COLORS['bg_secondary'])
+        bulk_actions.pack(fill=tk.X, pady=(5, 10))
+
+        choose_btn = tk.Label(bulk_actions, text="Import CSV / JSONL / Parquet",
+                              font=FONTS.get('small', FONT_FALLBACKS['small']),
+                              bg=COLORS['bg_tertiary'],
+                              fg=COLORS['text_secondary'],
+                              padx=12, pady=8,
+                              cursor='hand2')
+        choose_btn.pack(side=tk.LEFT, padx=(0, 10))
+        choose_btn.bind('<Button-1>', lambda e: self.choose_bulk_file())
+
+        self.cancel_bulk_btn = tk.Label(bulk_actions, text="Cancel",
+                                        font=FONTS.get('small', FONT_FALLBACKS['small']),
+                                        bg=COLORS['bg_tertiary'],
+                                        fg=COLORS['text_muted'],
+                                        padx=12, pady=8,
+                                        cursor='hand2')
+        self.cancel_bulk_btn.pack(side=tk.LEFT)
+        self.cancel_bulk_btn.bind('<Button-1>', lambda e: self.cancel_bulk())
+
+        self.bulk_progress = ttk.Progressbar(bulk_card, mode='determinate', maximum=100)
+        self.bulk_progress.pack(fill=tk.X, pady=(0, 8))
+
+        self.bulk_summary = tk.Label(bulk_card, text="No file imported",
+                                     font=FONTS.get('small', FONT_FALLBACKS['small']),
+                                     bg=COLORS['bg_secondary'],
+                                     fg=COLORS['text_muted'],
+                                     anchor=tk.W)
+        self.bulk_summary.pack(fill=tk.X)
+
         # === RIGHT PANEL: RESULTS ===
 
         # Validation summary card
@@ -339,10 +384,9 @@ class FormValidatorView:
             self.char_counter.config(fg=COLORS['text_muted'])
 
     def validate_form(self):
-        """Handle form validation with visual feedback"""
+        """Handle form validation with visual feedback, running the checks off the main thread"""
         # Update status badge
         self.status_badge.config(text="● VALIDATING", fg=COLORS['warning'])
-        self.parent.update()
 
         # Get input values
         full_name = self.name_entry.get()
@@ -358,23 +402,37 @@ class FormValidatorView:
             'message': message
         }
 
-        # Validate all fields
-        self.validation_results = FormValidator.validate_all(form_data)
+        # A newer click supersedes any run still in flight
+        self.task_runner.submit(self.run_validation, form_data,
+                                on_done=self.show_validation,
+                                on_error=self.show_validation_error)
+
+    def run_validation(self, form_data):
+        """Validate and sanitize changed fields; runs in the worker thread"""
+        self.validator.update(form_data)
+        return self.validator.snapshot()
 
-        # Sanitize all fields
-        self.sanitization_results = FormSanitizer.sanitize_all(form_data)
+    def show_validation(self, snapshot):
+        """Apply a finished validation run to the widgets; runs on the Tk main thread"""
+        inputs, self.validation_results, self.sanitization_results = snapshot
+
+        # Only redraw fields whose input differs from what is on screen
+        changed_fields = [field for field in FORM_FIELDS
+                          if field in inputs and self.rendered_inputs.get(field) != inputs[field]]
+        for field in changed_fields:
+            self.rendered_inputs[field] = inputs[field]
 
         # Update indicators
-        self.update_field_indicators()
+        self.update_field_indicators(changed_fields)
 
         # Update summary
-        self.update_summary()
+        self.update_summary(changed_fields)
 
         # Display validation results
-        self.display_validation_results()
+        self.display_validation_results(changed_fields)
 
         # Display sanitization results
-        self.display_sanitization_results()
+        self.display_sanitization_results(changed_fields)
 
         # Update status badge
         all_valid = all(result[0] for result in self.validation_results.values())
@@ -383,16 +441,22 @@ class FormValidatorView:
         else:
             self.status_badge.config(text="● ISSUES FOUND", fg=COLORS['error'])
 
-    def update_field_indicators(self):
-        """Update visual indicators for each field"""
-        indicators = [
-            (self.name_indicator, 'full_name'),
-            (self.email_indicator, 'email'),
-            (self.username_indicator, 'username'),
-            (self.message_indicator, 'message')
-        ]
+    def show_validation_error(self, error):
+        """Report a validation run that raised; runs on the Tk main thread"""
+        self.status_badge.config(text="● ERROR", fg=COLORS['error'])
+        print(f"Error validating form: {error}")
+
+    def update_field_indicators(self, fields=FORM_FIELDS):
+        """Update visual indicators for the given fields"""
+        indicators = {
+            'full_name': self.name_indicator,
+            'email': self.email_indicator,
+            'username': self.username_indicator,
+            'message': self.message_indicator
+        }
 
-        for indicator, field in indicators:
+        for field in fields:
+            indicator = indicators[field]
             is_valid, _ = self.validation_results[field]
             was_sanitized = self.sanitization_results[field]['was_modified']
 
@@ -403,8 +467,8 @@ class FormValidatorView:
             else:
                 indicator.config(fg=COLORS['error'])
 
-    def update_summary(self):
-        """Update validation summary"""
+    def update_summary(self, fields=FORM_FIELDS):
+        """Update validation summary for the given fields"""
         summary_map = {
             'full_name': self.summary_full_name,
             'email': self.summary_email,
@@ -412,7 +476,8 @@ class FormValidatorView:
             'message': self.summary_message
         }
 
-        for field, label in summary_map.items():
+        for field in fields:
+            label = summary_map[field]
             is_valid, error = self.validation_results[field]
             was_sanitized = self.sanitization_results[field]['was_modified']
 
@@ -423,44 +488,121 @@ class FormValidatorView:
             else:
                 label.config(text="✗ Invalid", fg=COLORS['error'])
 
-    def display_validation_results(self):
-        """Display detailed validation results"""
+    def replace_field_block(self, view, field, segments):
+        """Replace the text region of one field, inserting it in form order on first render"""
+        block_tag = f'block_{field}'
+        ranges = view.tag_ranges(block_tag)
+
+        if ranges:
+            index = view.index(ranges[0])
+            view.delete(ranges[0], ranges[-1])
+        else:
+            index = view.index(tk.END + '-1c')
+
+        for text, style in segments:
+            view.insert(index, text, (style, block_tag) if style else (block_tag,))
+            index = view.index(f'{index}+{len(text)}c')
+
+    def display_validation_results(self, fields=FORM_FIELDS):
+        """Display detailed validation results for the given fields"""
         self.validation_view.configure(state='normal')
-        self.validation_view.delete("1.0", tk.END)
 
-        for field_name, (is_valid, error_msg) in self.validation_results.items():
+        for field_name in fields:
+            is_valid, error_msg = self.validation_results[field_name]
+
             # Field header
             display_name = field_name.replace('_', ' ').title()
-            self.validation_view.insert(tk.END, f"{display_name}\n", 'header')
+            segments = [(f"{display_name}\n", 'header')]
 
             if is_valid:
-                self.validation_view.insert(tk.END, "  ✓ Validation passed\n", 'valid')
+                segments.append(("  ✓ Validation passed\n", 'valid'))
             else:
-                self.validation_view.insert(tk.END, f"  ✗ {error_msg}\n", 'invalid')
+                segments.append((f"  ✗ {error_msg}\n", 'invalid'))
 
-            self.validation_view.insert(tk.END, "\n")
+            segments.append(("\n", None))
+            self.replace_field_block(self.validation_view, field_name, segments)
 
         self.validation_view.configure(state='disabled')
 
-    def display_sanitization_results(self):
-        """Display detailed sanitization results"""
+    def display_sanitization_results(self, fields=FORM_FIELDS):
+        """Display detailed sanitization results for the given fields"""
         self.sanitization_view.configure(state='normal')
-        self.sanitization_view.delete("1.0", tk.END)
 
-        for field_name, data in self.sanitization_results.items():
+        for field_name in fields:
+            data = self.sanitization_results[field_name]
             display_name = field_name.replace('_', ' ').title()
-            self.sanitization_view.insert(tk.END, f"{display_name}\n", 'header')
+            segments = [(f"{display_name}\n", 'header')]
 
             # Original value
-            self.sanitization_view.insert(tk.END, f"  Original: {data['original']}\n", 'field')
+            segments.append((f"  Original: {data['original']}\n", 'field'))
 
             # Sanitized value
             if data['was_modified']:
-                self.sanitization_view.insert(tk.END, f"  Sanitized: {data['sanitized']}\n", 'warning')
-                self.sanitization_view.insert(tk.END, f"  Changes: {', '.join(data['notes'])}\n", 'warning')
+                segments.append((f"  Sanitized: {data['sanitized']}\n", 'warning'))
+                segments.append((f"  Changes: {', '.join(data['notes'])}\n", 'warning'))
             else:
-                self.sanitization_view.insert(tk.END, f"  No changes needed\n", 'valid')
-
-            self.sanitization_view.insert(tk.END, "\n")
-
-        self.sanitization_view.configure(state='disabled')
\ No newline at end of file
+                segments.append(("  No changes needed\n", 'valid'))
+
+            segments.append(("\n", None))
+            self.replace_field_block(self.sanitization_view, field_name, segments)
+
+        self.sanitization_view.configure(state='disabled')
+
+    def choose_bulk_file(self):
+        """Pick a CSV/JSONL file and validate it in the background"""
+        path = filedialog.askopenfilename(
+            parent=self.parent,
+            title="Import forms",
+            filetypes=[("Form files", "*.csv *.jsonl *.ndjson *.parquet"), ("All files", "*.*")])
+        if path:
+            self.start_bulk(path)
+
+    def start_bulk(self, path):
+        """Validate every form in path, streaming results to a JSON lines file next to the log"""
+        name = os.path.splitext(os.path.basename(path))[0]
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.bulk_output_file = os.path.join(os.path.dirname(VALIDATION_RESULTS_FILE),
+                                             f"{name}_results_{timestamp}.jsonl")
+
+        self.bulk_progress['value'] = 0
+        self.bulk_summary.config(text=f"Validating {os.path.basename(path)}...", fg=COLORS['warning'])
+        self.cancel_bulk_btn.config(fg=COLORS['text_secondary'])
+
+        self.bulk_runner.submit(partial(validate_file, output_file=self.bulk_output_file), path,
+                                on_progress=self.show_bulk_progress,
+                                on_done=self.finish_bulk,
+                                on_error=self.show_bulk_error)
+
+    def show_bulk_progress(self, summary):
+        """Update the progress bar and running counts after each chunk"""
+        if summary['total_bytes']:
+            self.bulk_progress['value'] = summary['bytes_read'] * 100 / summary['total_bytes']
+        self.bulk_summary.config(
+            text=f"{summary['forms']:,} forms  ·  ✓ {summary['valid']:,} valid  ·  "
+                 f"⚠ {summary['sanitized']:,} sanitized  ·  ✗ {summary['invalid']:,} invalid",
+            fg=COLORS['text_secondary'])
+
+    def finish_bulk(self, summary):
+        """Show the final counts of a completed import"""
+        self.show_bulk_progress(summary)
+        self.cancel_bulk_btn.config(fg=COLORS['text_muted'])
+        color = COLORS['success'] if not summary['invalid'] else COLORS['warning']
+        self.bulk_summary.config(text=self.bulk_summary['text'] + f"\nSaved to {self.bulk_output_file}",
+                                 fg=color)
+
+    def show_bulk_error(self, error):
+        self.cancel_bulk_btn.config(fg=COLORS['text_muted'])
+        self.bulk_summary.config(text=f"Import failed: {error}", fg=COLORS['error'])
+
+    def cancel_bulk(self):
+        """Stop the running import; the worker exits after its current chunk"""
+        if not self.bulk_runner.is_busy():
+            return
+        self.bulk_runner.cancel()
+        self.cancel_bulk_btn.config(fg=COLORS['text_muted'])
+        self.bulk_summary.config(text=self.bulk_summary['text'] + "  ·  cancelled", fg=COLORS['error'])
+
+    def shutdown_workers(self):
+        """Stop background work when the view is destroyed"""
+        self.task_runner.shutdown()
+        self.bulk_runner.shutdown()
\ No newline at end of file
@@ -1,7 +1,17 @@
 import tkinter as tk
 from tkinter import messagebox
-from modules.password_assessor import assess_password_strength
+from modules.password_assessor import assess_password_strength, check_password_reuse
+from modules.security_policy import current_policy
 from utils.constants import *
+from utils.result_cache import ResultCache
+
+# Every keystroke re-assesses the entry, so backspacing and retyping hits the cache
+assessment_cache = ResultCache(max_size=256)
+
+
+def assess_password_cached(password):
+    # The policy version is part of the key, so a reloaded policy never serves old ratings
+    return assessment_cache.get_or_compute(f'assess:{current_policy().version}', password, assess_password_strength)
 
 
 class PasswordAssessorView:
@@ -206,7 +216,8 @@ class PasswordAssessorView:
             return
 
         # Assess password strength
-        rating, color, feedback = assess_password_strength(password)
+        # The reuse check reads the issued-password history, so it runs outside the cache
+        rating, color, feedback = check_password_reuse(password, assess_password_cached(password))
 
         # Map rating to strength percentage
         strength_map = {"WEAK": 33, "MODERATE": 66, "STRONG": 100}
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import messagebox
-from modules.password_generator import generate_secure_password, hash_password
+from modules.password_generator import generate_distinct_password, hash_password
+from modules.password_similarity import get_similarity_index
+from modules.security_policy import current_policy
 from utils.file_handler import save_password_to_log
 from utils.constants import *
 
@@ -68,8 +70,9 @@ class PasswordGeneratorView:
                 bg=COLORS['bg_secondary'],
                 fg=COLORS['text_secondary']).pack(side=tk.LEFT)
 
+        policy = current_policy()
         tk.Label(length_label_frame,
-                text=f"({PASSWORD_MIN_LENGTH}-{PASSWORD_MAX_LENGTH} CHARACTERS)",
+                text=f"({policy.min_length}-{policy.max_length} CHARACTERS)",
                 font=FONTS.get('small', FONT_FALLBACKS['small']),
                 bg=COLORS['bg_secondary'],
                 fg=COLORS['text_muted']).pack(side=tk.RIGHT)
@@ -78,7 +81,7 @@ class PasswordGeneratorView:
         length_input_frame = tk.Frame(length_frame, bg=COLORS['bg_secondary'])
         length_input_frame.pack(fill=tk.X)
 
-        self.length_var = tk.StringVar(value=str(PASSWORD_DEFAULT_LENGTH))
+        self.length_var = tk.StringVar(value=str(policy.default_length))
         length_entry = ModernEntry(length_input_frame,
                                   textvariable=self.length_var,
                                   font=FONTS.get('body', FONT_FALLBACKS['body']),
@@ -204,19 +207,27 @@ class PasswordGeneratorView:
         """Handle password generation"""
         try:
             length = int(self.length_var.get())
+            policy = current_policy()
 
-            if length < PASSWORD_MIN_LENGTH or length > PASSWORD_MAX_LENGTH:
+            if length < policy.min_length or length > policy.max_length:
                 messagebox.showerror("Invalid Length",
-                    f"Password length must be between {PASSWORD_MIN_LENGTH} and {PASSWORD_MAX_LENGTH}",
+                    f"Password length must be between {policy.min_length} and {policy.max_length}",
                     parent=self.parent)
                 return
 
-            # Generate password and hash
-            password = generate_secure_password(length)
+            # Generate password and hash, skipping near-duplicates of passwords already issued
+            index = get_similarity_index()
+            password = generate_distinct_password(length, index)
+            if password is None:
+                messagebox.showerror("Error",
+                    "Could not generate a password distinct from those already issued",
+                    parent=self.parent)
+                return
             password_hash = hash_password(password)
 
-            # Save to log
+            # Save to log and remember it for later similarity checks
             save_password_to_log(password, password_hash)
+            index.add(password)
 
             # Display results
             self.password_display.configure(state='normal')
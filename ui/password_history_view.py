@@ -0,0 +1,297 @@
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+from utils.constants import *
+from utils.log_index import PasswordLogIndex
+from utils.log_watcher import LogWatcher
+from ui.task_runner import BackgroundTaskRunner
+
+
+class PasswordHistoryView:
+    """Virtualized browser for the password log: only the visible page of records is read and drawn"""
+
+    def __init__(self, parent, log_file=LOG_FILE, results_file=VALIDATION_RESULTS_FILE):
+        self.parent = parent
+        self.index = PasswordLogIndex(log_file)
+        self.first_record = 0
+        self.matches = []
+        self.match_position = 0
+        self.create_view()
+        self.task_runner = BackgroundTaskRunner(self.parent)
+        self.refresh_index()
+
+        # Watchdog threads only flag changes; the Tk side picks them up without touching the files
+        self.log_changed = threading.Event()
+        self.new_results = queue.Queue()
+        self.log_watcher = LogWatcher()
+        self.log_watcher.on_change(log_file, self.log_changed.set)
+        self.log_watcher.watch(results_file, self.new_results.put, backlog=8 * 1024)
+        self.log_watcher.start()
+        self.poll_log_events()
+
+        self.status_badge.bind('<Destroy>', lambda e: self.stop())
+
+    def create_view(self):
+        """Create the password history interface"""
+        # Header section
+        header_frame = tk.Frame(self.parent, bg=COLORS['bg_primary'])
+        header_frame.pack(fill=tk.X, pady=(0, 20))
+
+        title = tk.Label(header_frame, text="Password History",
+                         font=FONTS.get('heading', FONT_FALLBACKS['heading']),
+                         bg=COLORS['bg_primary'],
+                         fg=COLORS['text_primary'])
+        title.pack(anchor=tk.W, side=tk.LEFT)
+
+        # Status indicator
+        self.status_badge = tk.Label(header_frame, text="● INDEXING",
+                                     font=FONTS.get('small', FONT_FALLBACKS['small']),
+                                     bg=COLORS['bg_tertiary'],
+                                     fg=COLORS['warning'],
+                                     padx=10, pady=4)
+        self.status_badge.pack(side=tk.RIGHT)
+
+        desc = tk.Label(self.parent,
+                        text="Browse generated passwords and search the log by SHA-256 hash prefix",
+                        font=FONTS.get('small', FONT_FALLBACKS['small']),
+                        bg=COLORS['bg_primary'],
+                        fg=COLORS['text_tertiary'])
+        desc.pack(anchor=tk.W, pady=(0, 25))
+
+        # Search card
+        search_card = self.create_card(self.parent, "Search", expand=False)
+
+        search_frame = tk.Frame(search_card, bg=COLORS['bg_tertiary'])
+        search_frame.pack(fill=tk.X, pady=(10, 0))
+
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(search_frame,
+                                textvariable=self.search_var,
+                                bg=COLORS['bg_tertiary'],
+                                fg=COLORS['input_text'],
+                                font=FONTS.get('code', FONT_FALLBACKS['code']),
+                                relief=tk.FLAT,
+                                insertbackground=COLORS['accent_primary'])
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=12, pady=10)
+        search_entry.bind('<Return>', lambda e: self.search())
+
+        next_btn = tk.Label(search_frame, text="Next Match",
+                            font=FONTS.get('small', FONT_FALLBACKS['small']),
+                            bg=COLORS['bg_secondary'],
+                            fg=COLORS['text_secondary'],
+                            padx=12, pady=6,
+                            cursor='hand2')
+        next_btn.pack(side=tk.RIGHT, padx=(0, 10))
+        next_btn.bind('<Button-1>', lambda e: self.next_match())
+
+        self.search_status = tk.Label(search_card, text="Enter a hash prefix and press Enter",
+                                      font=FONTS.get('small', FONT_FALLBACKS['small']),
+                                      bg=COLORS['bg_secondary'],
+                                      fg=COLORS['text_muted'])
+        self.search_status.pack(anchor=tk.W, pady=(8, 0))
+
+        # Records card
+        records_card = self.create_card(self.parent, "Log Records")
+
+        records_frame = tk.Frame(records_card, bg=COLORS['bg_tertiary'])
+        records_frame.pack(fill=tk.BOTH, expand=True)
+
+        # The Text widget only ever holds one page; the scrollbar spans the whole log
+        self.records_view = tk.Text(records_frame,
+                                    bg=COLORS['bg_tertiary'],
+                                    fg=COLORS['text_primary'],
+                                    font=FONTS.get('code_small', FONT_FALLBACKS['code_small']),
+                                    relief=tk.FLAT,
+                                    wrap=tk.NONE,
+                                    height=HISTORY_PAGE_SIZE,
+                                    state='disabled')
+        self.records_view.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(12, 0), pady=10)
+        self.records_view.tag_config('number', foreground=COLORS['text_muted'])
+        self.records_view.tag_config('hash', foreground=COLORS['text_tertiary'])
+        self.records_view.tag_config('match', background=COLORS['nav_hover'])
+
+        self.scrollbar = ttk.Scrollbar(records_frame, orient=tk.VERTICAL,
+                                       style='Vertical.TScrollbar',
+                                       command=self.on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        for widget in (self.records_view, self.scrollbar):
+            widget.bind('<MouseWheel>', self.on_mouse_wheel)
+            widget.bind('<Button-4>', lambda e: self.scroll_to(self.first_record - 3))
+            widget.bind('<Button-5>', lambda e: self.scroll_to(self.first_record + 3))
+
+        # Live validation results card
+        results_card = self.create_card(self.parent, "Latest Validation Results", expand=False)
+
+        self.results_view = tk.Text(results_card,
+                                    bg=COLORS['bg_tertiary'],
+                                    fg=COLORS['text_secondary'],
+                                    font=FONTS.get('code_small', FONT_FALLBACKS['code_small']),
+                                    relief=tk.FLAT,
+                                    wrap=tk.NONE,
+                                    height=6,
+                                    state='disabled')
+        self.results_view.pack(fill=tk.X, pady=(10, 0))
+
+    def create_card(self, parent, title, expand=True):
+        """Create a card container"""
+        card = tk.Frame(parent, bg=COLORS['bg_secondary'])
+        card.pack(fill=tk.BOTH if expand else tk.X, expand=expand, pady=(0, 20))
+
+        # Card header
+        header = tk.Frame(card, bg=COLORS['bg_secondary'])
+        header.pack(fill=tk.X, padx=CARD_PADDING, pady=(CARD_PADDING, 10))
+
+        title_label = tk.Label(header, text=title,
+                               font=FONTS.get('subheading', FONT_FALLBACKS['subheading']),
+                               bg=COLORS['bg_secondary'],
+                               fg=COLORS['text_primary'])
+        title_label.pack(side=tk.LEFT)
+
+        accent_line = tk.Frame(header, bg=COLORS['accent_primary'], height=2, width=40)
+        accent_line.pack(side=tk.LEFT, padx=(10, 0))
+
+        # Card content
+        content = tk.Frame(card, bg=COLORS['bg_secondary'])
+        content.pack(fill=tk.BOTH, expand=True, padx=CARD_PADDING, pady=(0, CARD_PADDING))
+
+        return content
+
+    def refresh_index(self):
+        """Index new log records in the background, then redraw the current page"""
+        self.status_badge.config(text="● INDEXING", fg=COLORS['warning'])
+        self.task_runner.submit(self.index.refresh, on_done=self.on_indexed,
+                                on_error=self.on_index_error)
+
+    def on_indexed(self, added):
+        """Redraw once the index has caught up with the file, following the tail if it was in view"""
+        self.status_badge.config(text=f"● {len(self.index):,} RECORDS", fg=COLORS['success'])
+
+        previous_total = len(self.index) - added
+        if added and self.first_record >= previous_total - HISTORY_PAGE_SIZE:
+            self.first_record = -1
+            self.scroll_to(len(self.index))
+        else:
+            self.render_page()
+
+    def poll_log_events(self):
+        """Apply file-change events flagged by the watchdog thread"""
+        if self.log_changed.is_set():
+            self.log_changed.clear()
+            # The index reads only the bytes appended since its last refresh
+            self.refresh_index()
+
+        appended = []
+        while True:
+            try:
+                appended.append(self.new_results.get_nowait())
+            except queue.Empty:
+                break
+        if appended:
+            self.append_results(''.join(appended))
+
+        try:
+            self.parent.after(LIVE_LOG_POLL_MS, self.poll_log_events)
+        except tk.TclError:
+            self.stop()
+
+    def append_results(self, text):
+        """Append new validation result lines, keeping only the most recent ones"""
+        self.results_view.configure(state='normal')
+        self.results_view.insert(tk.END, text)
+
+        line_count = int(self.results_view.index('end-1c').split('.')[0])
+        if line_count > LIVE_LOG_MAX_LINES:
+            self.results_view.delete("1.0", f"{line_count - LIVE_LOG_MAX_LINES + 1}.0")
+
+        self.results_view.see(tk.END)
+        self.results_view.configure(state='disabled')
+
+    def stop(self):
+        """Stop background work when the view is destroyed"""
+        self.task_runner.shutdown()
+        self.log_watcher.stop()
+
+    def on_index_error(self, error):
+        self.status_badge.config(text="● ERROR", fg=COLORS['error'])
+        print(f"Error indexing password log: {error}")
+
+    def on_scroll(self, action, amount, unit=None):
+        """Translate scrollbar commands into a first visible record number"""
+        if action == 'moveto':
+            self.scroll_to(int(float(amount) * len(self.index)))
+        elif unit == 'pages':
+            self.scroll_to(self.first_record + int(amount) * HISTORY_PAGE_SIZE)
+        else:
+            self.scroll_to(self.first_record + int(amount))
+
+    def on_mouse_wheel(self, event):
+        self.scroll_to(self.first_record - int(event.delta / 120) * 3)
+        return 'break'
+
+    def scroll_to(self, record_number):
+        """Show the page starting at record_number, clamped to the log"""
+        last_page_start = max(len(self.index) - HISTORY_PAGE_SIZE, 0)
+        record_number = min(max(record_number, 0), last_page_start)
+        if record_number != self.first_record:
+            self.first_record = record_number
+            self.render_page()
+
+    def render_page(self):
+        """Read and draw only the records that fit in the visible window"""
+        total = len(self.index)
+        records = self.index.read_records(self.first_record, HISTORY_PAGE_SIZE)
+        highlighted = self.matches[self.match_position] if self.matches else None
+
+        self.records_view.configure(state='normal')
+        self.records_view.delete("1.0", tk.END)
+
+        if not records:
+            self.records_view.insert(tk.END, "No password history yet.")
+
+        for record in records:
+            line_tags = ('match',) if record['number'] == highlighted else ()
+            self.records_view.insert(tk.END, f"{record['number'] + 1:>9}  ", ('number',) + line_tags)
+            self.records_view.insert(tk.END, f"{record['timestamp']}  {record['password']:<18}  ", line_tags)
+            self.records_view.insert(tk.END, f"{record['hash']}\n", ('hash',) + line_tags)
+
+        self.records_view.configure(state='disabled')
+
+        if total:
+            self.scrollbar.set(self.first_record / total,
+                               min(self.first_record + HISTORY_PAGE_SIZE, total) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def search(self):
+        """Look up records by hash prefix using the index and jump to the first match"""
+        prefix = self.search_var.get()
+        self.matches = self.index.find_hash_prefix(prefix)
+        self.match_position = 0
+
+        if not prefix.strip():
+            self.search_status.config(text="Enter a hash prefix and press Enter", fg=COLORS['text_muted'])
+        elif not self.matches:
+            self.search_status.config(text="No matching hashes", fg=COLORS['error'])
+        else:
+            self.show_match()
+            return
+
+        self.render_page()
+
+    def next_match(self):
+        """Cycle to the next search result"""
+        if not self.matches:
+            return
+        self.match_position = (self.match_position + 1) % len(self.matches)
+        self.show_match()
+
+    def show_match(self):
+        record_number = self.matches[self.match_position]
+        self.search_status.config(
+            text=f"Match {self.match_position + 1} of {len(self.matches)} (record {record_number + 1:,})",
+            fg=COLORS['success'])
+        # Centre the match in the page where possible
+        self.first_record = -1
+        self.scroll_to(record_number - HISTORY_PAGE_SIZE // 2)
@@ -0,0 +1,287 @@
+"""
+Callback Profiling
+Times every Tk callback, logs the slow ones, and captures cProfile and
+tracemalloc reports for the next few user actions on request
+"""
+
+import cProfile
+import os
+import pstats
+import threading
+import time
+import tkinter as tk
+import tracemalloc
+from datetime import datetime
+
+from utils.constants import (
+    PROFILE_DIR, PROFILE_TOP_ALLOCATIONS, SLOW_CALLBACK_LOG, SLOW_CALLBACK_MS
+)
+
+# Events that mean the user did something; hover, focus and redraw events are not actions
+ACTION_EVENT_TYPES = frozenset({'ButtonPress', 'ButtonRelease', 'KeyPress', 'KeyRelease'})
+
+# Longest wait for background work once the last action has run; superseded jobs never start
+BACKGROUND_WAIT_SECONDS = 5
+
+# The monitor installed by CallbackMonitor.install(), if any
+MONITOR = None
+
+
+def callback_name(func):
+    """Return a readable module.qualname for a Tk callback, looking through after() wrappers."""
+    if is_timer(func):
+        # after() registers a closure that calls the real function
+        cells = dict(zip(func.__code__.co_freevars, func.__closure__ or ()))
+        if 'func' in cells:
+            func = cells['func'].cell_contents
+    func = getattr(func, '__func__', func)
+    module = getattr(func, '__module__', None) or ''
+    name = getattr(func, '__qualname__', None) or type(func).__qualname__
+    return f"{module}.{name}" if module else name
+
+
+def is_timer(func):
+    return getattr(func, '__qualname__', '').endswith('after.<locals>.callit')
+
+
+def is_action(func, args):
+    """Return True for user-initiated callbacks: widget commands and key or mouse button events."""
+    if is_timer(func):
+        return False
+    if args and isinstance(args[0], tk.Event):
+        return str(args[0].type) in ACTION_EVENT_TYPES
+    return True
+
+
+class MonitoredCallWrapper(tk.CallWrapper):
+    """tkinter's callback wrapper, routed through the installed monitor."""
+
+    def __call__(self, *args):
+        try:
+            if self.subst:
+                args = self.subst(*args)
+            return MONITOR.run(self.func, args)
+        except SystemExit:
+            raise
+        except:  # noqa: E722 - matches tkinter, which reports every callback error
+            self.widget._report_exception()
+
+
+class ProfileCapture:
+    """cProfile and tracemalloc state for one capture of the next N actions."""
+
+    def __init__(self, actions):
+        self.remaining = actions
+        self.actions = []
+        self.profile = cProfile.Profile()
+        self.background_profiles = []
+        self.pending = 0
+        self.deadline = None
+        self.lock = threading.Lock()
+        self.started = datetime.now()
+
+        self.was_tracing = tracemalloc.is_tracing()
+        if not self.was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+
+    def profile_background(self, func):
+        """Wrap func so it is profiled in whichever worker thread runs it."""
+        with self.lock:
+            self.pending += 1
+
+        def run(*args, **kwargs):
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler already covers this thread (cProfile is process-wide on 3.12+)
+                profile = None
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if profile is not None:
+                    profile.disable()
+                with self.lock:
+                    if profile is not None:
+                        self.background_profiles.append(profile)
+                    self.pending -= 1
+
+        return run
+
+    def is_finished(self):
+        with self.lock:
+            if self.remaining > 0:
+                return False
+            if self.deadline is None:
+                self.deadline = time.monotonic() + BACKGROUND_WAIT_SECONDS
+            return self.pending == 0 or time.monotonic() >= self.deadline
+
+    def write_reports(self, output_dir=PROFILE_DIR):
+        """Write the merged .prof file and the allocation report, returning their paths."""
+        os.makedirs(output_dir, exist_ok=True)
+        stamp = self.started.strftime("%Y%m%d_%H%M%S")
+        prof_file = os.path.join(output_dir, f"profile_{stamp}.prof")
+        alloc_file = os.path.join(output_dir, f"profile_{stamp}_allocations.txt")
+
+        # Taken before the stats are merged so the profiler's own bookkeeping stays out of the report
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        if not self.was_tracing:
+            tracemalloc.stop()
+
+        stats = None
+        for profile in [self.profile] + self.background_profiles:
+            # pstats refuses profiles that never recorded a call
+            if not profile.getstats():
+                continue
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+        if stats is not None:
+            stats.dump_stats(prof_file)
+        else:
+            prof_file = None
+
+        with open(alloc_file, "w", encoding="utf-8") as file:
+            file.write(f"Profile capture started {self.started:%Y-%m-%d %H:%M:%S}\n")
+            file.write(f"Actions: {', '.join(self.actions) or 'none'}\n")
+            file.write(f"Traced memory: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB\n")
+            file.write(f"\nTop {PROFILE_TOP_ALLOCATIONS} allocation sites still alive at the end of the capture:\n")
+            for stat in snapshot.statistics('lineno')[:PROFILE_TOP_ALLOCATIONS]:
+                file.write(f"{stat}\n")
+
+        return prof_file, alloc_file
+
+
+class CallbackMonitor:
+    """Times Tk callbacks, logs those slower than a threshold, and runs profile captures.
+
+    install() swaps tkinter's callback wrapper, so it must run before the
+    widgets whose callbacks should be seen are created.
+    """
+
+    def __init__(self, root, slow_ms=SLOW_CALLBACK_MS, log_file=SLOW_CALLBACK_LOG, on_status=None):
+        self.root = root
+        self.slow_seconds = slow_ms / 1000
+        self.log_file = log_file
+        self.on_status = on_status
+        self.capture = None
+        self.in_action = False
+
+    def install(self):
+        global MONITOR
+        MONITOR = self
+        tk.CallWrapper = MonitoredCallWrapper
+
+    def run(self, func, args):
+        """Call a Tk callback, profiling it when it is part of a capture and timing it always."""
+        capture = self.capture
+        profiled = capture is not None and not self.in_action and is_action(func, args)
+        if profiled:
+            self.in_action = True
+            capture.profile.enable()
+
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            if profiled:
+                capture.profile.disable()
+                self.in_action = False
+                self.action_done(capture, func)
+            if elapsed >= self.slow_seconds:
+                self.log_slow_callback(func, args, elapsed)
+
+    # --- Slow callbacks ---
+    def log_slow_callback(self, func, args, elapsed):
+        event = f" ({args[0].type} event)" if args and isinstance(args[0], tk.Event) else ""
+        line = (f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  {elapsed * 1000:8.1f} ms  "
+                f"{callback_name(func)}{event}\n")
+        try:
+            os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok=True)
+            with open(self.log_file, "a", encoding="utf-8") as file:
+                file.write(line)
+        except Exception as e:
+            print(f"Error logging slow callback: {e}")
+
+    # --- Profile captures ---
+    def start_capture(self, actions):
+        """Profile the next N user actions, including background work they submit."""
+        if self.capture is not None:
+            return
+        self.capture = ProfileCapture(actions)
+        self.status(f"Profiling next {actions} action(s)")
+
+    def stop_capture(self):
+        """End the running capture early and write whatever it has recorded."""
+        capture = self.capture
+        if capture is None:
+            return
+        with capture.lock:
+            capture.remaining = 0
+        self.status("Profiling - waiting for background work")
+        # Deferred so the click that stopped the capture has returned first
+        self.root.after(0, self.finish_capture)
+
+    def toggle_capture(self, actions):
+        if self.capture is None:
+            self.start_capture(actions)
+        else:
+            self.stop_capture()
+
+    def profile_background(self, func):
+        capture = self.capture
+        if capture is None or (capture.remaining <= 0 and not self.in_action):
+            return func
+        return capture.profile_background(func)
+
+    def action_done(self, capture, func):
+        with capture.lock:
+            if capture.remaining <= 0:
+                # Stopped early by this action; finish_capture is already scheduled
+                return
+            capture.remaining -= 1
+            capture.actions.append(callback_name(func))
+            remaining = capture.remaining
+        if remaining > 0:
+            self.status(f"Profiling - {remaining} action(s) left")
+        else:
+            self.status("Profiling - waiting for background work")
+            self.root.after(50, self.finish_capture)
+
+    def finish_capture(self):
+        capture = self.capture
+        if capture is None:
+            return
+        if not capture.is_finished():
+            self.root.after(50, self.finish_capture)
+            return
+
+        self.capture = None
+        try:
+            prof_file, alloc_file = capture.write_reports()
+        except Exception as e:
+            print(f"Error writing profile reports: {e}")
+            self.status("Profiling failed")
+            return
+        print(f"Profile written to {prof_file or '(no calls recorded)'} and {alloc_file}")
+        self.status(f"Saved {os.path.basename(alloc_file)}")
+
+    def status(self, text):
+        if self.on_status:
+            self.on_status(text)
+
+
+def profile_background(func):
+    """Wrap background work submitted during a capture; returns func unchanged otherwise."""
+    if MONITOR is None:
+        return func
+    return MONITOR.profile_background(func)
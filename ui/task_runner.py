@@ -0,0 +1,100 @@
+"""
+Background Task Runner
+Runs view work off the Tk main thread and marshals results back to it
+"""
+
+import queue
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+from ui.profiling import profile_background
+
+
+class BackgroundTaskRunner:
+    """Runs callables in a worker thread and delivers results on the Tk event loop.
+
+    Results travel through a queue that is polled with after(), so callbacks
+    always run on the main thread. Submitting a new task supersedes the previous
+    one: a queued run is cancelled and a running one has its result dropped.
+    """
+
+    def __init__(self, widget, max_workers=1, poll_interval=30):
+        self.widget = widget
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='octoguard-worker')
+        self.results = queue.Queue()
+        self.generation = 0
+        self.future = None
+        self.polling = False
+
+    def submit(self, func, *args, on_done=None, on_error=None, on_progress=None):
+        """Run func(*args) in the background, superseding any run still in flight.
+
+        With on_progress, func is also called with progress= and is_cancelled=
+        keyword arguments so long jobs can report partial results and stop early.
+        """
+        self.cancel()
+        generation = self.generation
+        # Profiled in the worker thread when a capture is running
+        func = profile_background(func)
+        kwargs = {}
+        if on_progress is not None:
+            kwargs['progress'] = lambda value: self.results.put((generation, on_progress, value))
+            kwargs['is_cancelled'] = lambda: generation != self.generation
+
+        def job():
+            # Skip work that was superseded while waiting in the executor
+            if generation != self.generation:
+                return
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self.results.put((generation, on_error, e))
+            else:
+                self.results.put((generation, on_done, result))
+
+        self.future = self.executor.submit(job)
+        self._schedule_poll()
+        return generation
+
+    def cancel(self):
+        """Discard the current run so its result is never delivered."""
+        self.generation += 1
+        if self.future is not None:
+            self.future.cancel()
+            self.future = None
+
+    def is_busy(self):
+        """Return True while a submitted run has not finished."""
+        return self.future is not None and not self.future.done()
+
+    def shutdown(self):
+        """Stop accepting work and drop anything still queued."""
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule_poll(self):
+        if self.polling:
+            return
+        try:
+            self.widget.after(self.poll_interval, self._poll)
+            self.polling = True
+        except tk.TclError:
+            # Widget was destroyed; nothing left to deliver to
+            self.shutdown()
+
+    def _poll(self):
+        self.polling = False
+
+        while True:
+            try:
+                generation, callback, value = self.results.get_nowait()
+            except queue.Empty:
+                break
+
+            # Results from superseded runs are dropped
+            if generation == self.generation and callback is not None:
+                callback(value)
+
+        if self.is_busy() or not self.results.empty():
+            self._schedule_poll()
@@ -86,9 +86,74 @@ USERNAME_MAX_LENGTH = 16
 MESSAGE_MAX_LENGTH = 250
 NAME_MIN_LENGTH = 2
 
+# Password Assessment Settings
+STRONG_PASSWORD_LENGTH = 12
+# Ratings by estimated guesses: below 10^6 is WEAK, 10^10 and above is STRONG
+MODERATE_MIN_GUESSES_LOG10 = 6
+STRONG_MIN_GUESSES_LOG10 = 10
+
 # File Paths
 LOG_FILE = "data/security_toolkit_log.txt"
 VALIDATION_RESULTS_FILE = "data/validation_results.txt"
+METRICS_PROM_FILE = "data/metrics.prom"
+METRICS_JSON_FILE = "data/metrics.json"
+PROFILE_DIR = "data"
+SLOW_CALLBACK_LOG = "data/slow_callbacks.log"
+RULESET_FILE = "data/ruleset.bin"
+POLICY_FILE = "security_policy.json"
+SIMILARITY_INDEX_FILE = "data/similarity_index.bin"
+SIMILARITY_KEY_FILE = "data/similarity.key"
+WORDLIST_FILE = "data/wordlist.bin"
+
+# Password History Settings
+HISTORY_PAGE_SIZE = 25
+LIVE_LOG_POLL_MS = 250
+LIVE_LOG_MAX_LINES = 200
+
+# Profiling Settings
+PROFILE_ACTIONS = 5
+PROFILE_TOP_ALLOCATIONS = 25
+SLOW_CALLBACK_MS = 100
+
+# Security Policy Settings
+POLICY_CHECK_INTERVAL = 1.0
+SNAPSHOT_MIN_WORDS = 256
+
+# Passphrase Settings
+PASSPHRASE_MIN_WORDS = 3
+PASSPHRASE_MAX_WORDS = 12
+PASSPHRASE_DEFAULT_WORDS = 6
+PASSPHRASE_SEPARATOR = "-"
+
+# Target Entropy Settings
+TARGET_ENTROPY_DEFAULT_BITS = 80
+
+# Password Reuse Settings
+# Bigram sets of "Summer2023!" and "Summer2024!" are about 70% alike, "Winter2023!" about 40%;
+# 32 bands of 3 rows put pairs 60% alike in a shared bucket 99.9% of the time, 20% alike under 23%
+MINHASH_NGRAM = 2
+MINHASH_BANDS = 32
+MINHASH_ROWS = 3
+NEAR_DUPLICATE_SIMILARITY = 0.6
+GENERATE_DISTINCT_ATTEMPTS = 8
+
+# Streamlit Settings
+CACHE_MAX_ENTRIES = 1024
+BULK_CHUNK_SIZE = 5000
+
+# HTTP API Settings
+API_HOST = "127.0.0.1"
+API_PORT = 8765
+API_MAX_BODY_BYTES = 10 * 1024 * 1024
+API_MAX_BATCH_ITEMS = 10000
+# Longer passwords are refused before they reach the guess estimator
+API_MAX_PASSWORD_LENGTH = 1024
+# Characters the guess estimator may rate per assess batch, bounding its CPU time to about a minute
+API_MAX_BATCH_RATED_CHARACTERS = 100_000
+API_KEEPALIVE_TIMEOUT = 15
+# Requests with more header lines or header bytes than this are answered 431
+API_MAX_HEADER_COUNT = 100
+API_MAX_HEADER_BYTES = 64 * 1024
 
 # Security Lists
 COMMON_PASSWORDS = [
@@ -102,8 +167,8 @@ DICTIONARY_WORDS = [
 ]
 
 SQL_KEYWORDS = [
-    'SELECT', 'DROP', 'INSERT', 'DELETE',
-    'UPDATE', 'UNION', 'EXEC', 'EXECUTE'
+    'SELECT', 'DROP', 'INSERT', 'DELETE', 'UPDATE',
+    'UNION', 'EXEC', 'EXECUTE', 'ALTER', 'CREATE', 'TABLE'
 ]
 
 SPECIAL_CHARACTERS = "!@#$%^&*()_+-=[]{};:'\",.<>?/\\|"
@@ -1,6 +1,10 @@
+import csv
+import json
 import os
 from datetime import datetime
 
+from modules.output_encoder import neutralize_csv_formula
+
 
 def save_password_to_log(password, password_hash, log_file="data/security_toolkit_log.txt"):
     """Save a password and its SHA-256 hash to a log file."""
@@ -51,4 +55,127 @@ def save_validation_result(result_text, result_file="data/validation_results.txt
         return True
     except Exception as e:
         print(f"Error saving validation results: {e}")
-        return False
\ No newline at end of file
+        return False
+
+
+def save_results_jsonl(records, result_file="data/validation_results.jsonl"):
+    """Append flattened form result records to a JSON lines file."""
+    try:
+        # Create data directory if it doesn't exist
+        os.makedirs(os.path.dirname(result_file), exist_ok=True)
+
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+        with open(result_file, "a", encoding="utf-8") as file:
+            file.writelines(encode(record) + "\n" for record in records)
+
+        return True
+    except Exception as e:
+        print(f"Error saving results to JSON lines: {e}")
+        return False
+
+
+def _result_schema(pa, records):
+    """Arrow schema for result records, taken from the first ones and fixed for the whole file.
+
+    Columns that are all-null in those records (an error column with no errors yet)
+    would otherwise be typed null, and a later batch holding strings would not fit.
+    """
+    schema = pa.Table.from_pylist(records).schema
+    return pa.schema([field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+                      for field in schema])
+
+
+def save_results_arrow(records, result_file="data/validation_results.arrow", batch_size=65536):
+    """Write flattened form result records to an Arrow IPC file in fixed-size batches."""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        print("Error saving results to Arrow: pyarrow is not installed")
+        return False
+
+    try:
+        # Create data directory if it doesn't exist
+        os.makedirs(os.path.dirname(result_file), exist_ok=True)
+
+        writer = None
+        schema = None
+        batch = []
+
+        def flush():
+            nonlocal writer, schema
+            if writer is None:
+                schema = _result_schema(pa, batch)
+                writer = pa.ipc.new_file(result_file, schema)
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+            batch.clear()
+
+        try:
+            for record in records:
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    flush()
+
+            if batch or writer is None:
+                flush()
+        finally:
+            if writer is not None:
+                writer.close()
+        return True
+    except Exception as e:
+        print(f"Error saving results to Arrow: {e}")
+        return False
+
+
+def append_results_csv(records, result_file="data/validation_results.csv"):
+    """Append flattened form result records to a CSV file, writing the header for a new file."""
+    if not records:
+        return True
+
+    try:
+        # Create data directory if it doesn't exist
+        os.makedirs(os.path.dirname(result_file) or ".", exist_ok=True)
+        write_header = not os.path.exists(result_file) or os.path.getsize(result_file) == 0
+
+        with open(result_file, "a", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=list(records[0]))
+            if write_header:
+                writer.writeheader()
+            for record in records:
+                # Cells are opened in spreadsheets, so strings must not start a formula
+                writer.writerow({key: neutralize_csv_formula(value) if isinstance(value, str) else value
+                                 for key, value in record.items()})
+
+        return True
+    except Exception as e:
+        print(f"Error saving results to CSV: {e}")
+        return False
+
+
+class ParquetResultWriter:
+    """Writes chunks of flattened result records to one Parquet file as they arrive."""
+
+    def __init__(self, result_file="data/validation_results.parquet"):
+        self.result_file = result_file
+        self.writer = None
+        self.schema = None
+
+    def write(self, records):
+        """Append one chunk of records as a row group."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not records:
+            return
+
+        if self.writer is None:
+            self.schema = _result_schema(pa, records)
+            os.makedirs(os.path.dirname(self.result_file) or ".", exist_ok=True)
+            self.writer = pq.ParquetWriter(self.result_file, self.schema)
+
+        self.writer.write_table(pa.Table.from_pylist(records, schema=self.schema))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
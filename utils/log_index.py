@@ -0,0 +1,175 @@
+import bisect
+import heapq
+import os
+import threading
+from array import array
+
+RECORD_START = b"Timestamp: "
+PASSWORD_PREFIX = b"Password: "
+HASH_PREFIX = b"Hash: "
+
+
+class PasswordLogIndex:
+    """Byte-offset and hash-prefix index over a password log file.
+
+    Only record offsets and hashes are held in memory; record text is read from
+    disk a page at a time. Appended records are picked up by refresh(), which
+    reads only the bytes past the last indexed offset.
+    """
+
+    def __init__(self, log_file="data/security_toolkit_log.txt"):
+        self.log_file = log_file
+        self.offsets = array('Q')
+        self.indexed_size = 0
+        # Hashes sorted for prefix search, with the record number of each
+        self.sorted_hashes = []
+        self.sorted_records = array('L')
+        # Guards the tables for readers; refreshes are serialized separately so scans run unlocked
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def refresh(self):
+        """Index records appended since the last refresh and return how many were added.
+
+        The file is read and new hashes merged without holding the lock that
+        read_records() and find_hash_prefix() take, so readers only wait for
+        the final append or swap.
+        """
+        try:
+            size = os.path.getsize(self.log_file)
+        except OSError:
+            return 0
+
+        # Only one refresh at a time; it is the sole writer, so it may read the tables unlocked
+        with self._refresh_lock:
+            # The file was truncated or replaced; start over
+            reset = size < self.indexed_size
+            start = 0 if reset else self.indexed_size
+            if size == start and not reset:
+                return 0
+
+            new_offsets, new_hashes, end = self._scan(start)
+
+            if reset:
+                offsets = array('Q', new_offsets)
+                sorted_hashes, sorted_records = self._merge_hashes([], array('L'), self._hash_pairs(0, new_hashes))
+                with self._lock:
+                    self.offsets = offsets
+                    self.indexed_size = end
+                    self.sorted_hashes = sorted_hashes
+                    self.sorted_records = sorted_records
+                return len(new_offsets)
+
+            pairs = self._hash_pairs(len(self.offsets), new_hashes)
+            # Large batches: one linear merge of two sorted runs, built aside and swapped in
+            merge = bool(pairs) and (not self.sorted_hashes or len(pairs) > len(self.sorted_hashes) // 8)
+            if merge:
+                sorted_hashes, sorted_records = self._merge_hashes(self.sorted_hashes, self.sorted_records, pairs)
+
+            with self._lock:
+                self.offsets.extend(new_offsets)
+                self.indexed_size = end
+                if merge:
+                    self.sorted_hashes = sorted_hashes
+                    self.sorted_records = sorted_records
+                else:
+                    # Small appends while tailing: insert in place
+                    for record_hash, record in pairs:
+                        position = bisect.bisect_right(self.sorted_hashes, record_hash)
+                        self.sorted_hashes.insert(position, record_hash)
+                        self.sorted_records.insert(position, record)
+
+            return len(new_offsets)
+
+    def _scan(self, start):
+        """Read complete records from start and return their offsets, hashes and the end offset."""
+        offsets = []
+        hashes = []
+        position = start
+        end = start
+
+        with open(self.log_file, "rb") as file:
+            file.seek(start)
+            for line in file:
+                # Stop at a partially written trailing line
+                if not line.endswith(b"\n"):
+                    break
+                if line.startswith(RECORD_START):
+                    offsets.append(position)
+                    hashes.append(None)
+                elif line.startswith(HASH_PREFIX) and hashes:
+                    hashes[-1] = line[len(HASH_PREFIX):].strip().decode('ascii', 'replace')
+                elif line.startswith(b"-") and offsets:
+                    end = position + len(line)
+                position += len(line)
+
+        # Leave records without their closing separator for the next refresh
+        while offsets and offsets[-1] >= end:
+            offsets.pop()
+            hashes.pop()
+
+        return offsets, hashes, max(end, start)
+
+    @staticmethod
+    def _hash_pairs(first_record, hashes):
+        """Return sorted (hash, record number) pairs for the records that have a hash."""
+        return sorted((record_hash, first_record + i) for i, record_hash in enumerate(hashes) if record_hash)
+
+    @staticmethod
+    def _merge_hashes(sorted_hashes, sorted_records, pairs):
+        """Return new sorted hash and record tables with pairs merged in."""
+        merged = list(heapq.merge(zip(sorted_hashes, sorted_records), pairs))
+        return [record_hash for record_hash, _ in merged], array('L', (record for _, record in merged))
+
+    def read_records(self, start, count):
+        """Return up to count parsed records starting at record number start."""
+        with self._lock:
+            total = len(self.offsets)
+            if start >= total or count <= 0:
+                return []
+            stop = min(start + count, total)
+            begin = self.offsets[start]
+            end = self.offsets[stop] if stop < total else self.indexed_size
+
+        with open(self.log_file, "rb") as file:
+            file.seek(begin)
+            chunk = file.read(end - begin)
+
+        records = []
+        record = None
+        for line in chunk.splitlines():
+            if line.startswith(RECORD_START):
+                record = {
+                    'number': start + len(records),
+                    'timestamp': line[len(RECORD_START):].decode('utf-8', 'replace'),
+                    'password': '',
+                    'hash': ''
+                }
+                records.append(record)
+            elif record is None:
+                continue
+            elif line.startswith(PASSWORD_PREFIX):
+                record['password'] = line[len(PASSWORD_PREFIX):].decode('utf-8', 'replace')
+            elif line.startswith(HASH_PREFIX):
+                record['hash'] = line[len(HASH_PREFIX):].decode('ascii', 'replace')
+
+        return records
+
+    def find_hash_prefix(self, prefix, limit=100):
+        """Return record numbers (in file order) whose hash starts with prefix."""
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+
+        with self._lock:
+            position = bisect.bisect_left(self.sorted_hashes, prefix)
+            matches = []
+            while (position < len(self.sorted_hashes) and len(matches) < limit
+                   and self.sorted_hashes[position].startswith(prefix)):
+                matches.append(self.sorted_records[position])
+                position += 1
+
+        return sorted(matches)
@@ -0,0 +1,165 @@
+import os
+import threading
+from collections import deque
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+
+class LogTailer:
+    """Reads only the complete lines appended to a file since the last read.
+
+    backlog is how many bytes of existing content the first read should include;
+    the default of 0 starts at the current end of the file.
+    """
+
+    def __init__(self, path, backlog=0):
+        self.path = os.path.abspath(path)
+        self.offset = max(self._size() - backlog, 0)
+        # Starting mid-file lands inside a line; drop it on the first read
+        self.skip_partial = self.offset > 0 and backlog > 0
+        self._lock = threading.Lock()
+
+    def _size(self):
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def read_new(self):
+        """Return the text appended since the last call, or an empty string."""
+        with self._lock:
+            size = self._size()
+
+            # Truncated or replaced: start again from the top
+            if size < self.offset:
+                self.offset = 0
+                self.skip_partial = False
+
+            if size == self.offset:
+                return ""
+
+            try:
+                with open(self.path, "rb") as file:
+                    file.seek(self.offset)
+                    data = file.read(size - self.offset)
+            except OSError:
+                return ""
+
+            # Hold back a partially written last line until it is finished
+            end = data.rfind(b"\n") + 1
+            start = 0
+            if self.skip_partial and end:
+                start = data.find(b"\n") + 1
+                self.skip_partial = False
+
+            self.offset += end
+            return data[start:end].decode('utf-8', 'replace')
+
+
+class _TailHandler(FileSystemEventHandler):
+    """Routes watchdog events for watched files to their tailers."""
+
+    def __init__(self, watcher):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_modified(self, event):
+        self.watcher.dispatch(event.src_path)
+
+    def on_created(self, event):
+        self.watcher.dispatch(event.src_path)
+
+    def on_moved(self, event):
+        self.watcher.dispatch(event.dest_path)
+
+
+class LogWatcher:
+    """Watches log files through watchdog and calls back with newly appended text.
+
+    Callbacks run on the watchdog observer thread; GUI code must hand the text
+    over to its own thread before touching widgets.
+    """
+
+    def __init__(self):
+        self.observer = Observer()
+        self.handler = _TailHandler(self)
+        self.tailers = {}
+        self.watched_dirs = set()
+        self.started = False
+
+    def watch(self, path, callback, backlog=0):
+        """Call callback(text) whenever complete lines are appended to path.
+
+        With a backlog, the last backlog bytes already in the file are delivered first.
+        """
+        tailer = LogTailer(path, backlog)
+        self.tailers[tailer.path] = (tailer, callback)
+
+        self._watch_directory(tailer.path)
+
+        if backlog:
+            self.dispatch(tailer.path)
+
+    def on_change(self, path, callback):
+        """Call callback() on every change to path, for readers that track their own offset."""
+        path = os.path.abspath(path)
+        self.tailers[path] = (None, callback)
+        self._watch_directory(path)
+
+    def _watch_directory(self, path):
+        # Watch the directory so files that do not exist yet are picked up when created
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        if directory not in self.watched_dirs:
+            self.observer.schedule(self.handler, directory, recursive=False)
+            self.watched_dirs.add(directory)
+
+    def dispatch(self, path):
+        entry = self.tailers.get(os.path.abspath(path))
+        if entry is None:
+            return
+
+        tailer, callback = entry
+        if tailer is None:
+            callback()
+            return
+
+        text = tailer.read_new()
+        if text:
+            callback(text)
+
+    def start(self):
+        if not self.started:
+            self.observer.start()
+            self.started = True
+
+    def stop(self):
+        if self.started:
+            self.observer.stop()
+            self.observer.join(timeout=2)
+            self.started = False
+
+
+class LogFeed:
+    """Keeps the most recent lines of several log files, updated by a LogWatcher."""
+
+    def __init__(self, paths, max_lines=200, backlog=64 * 1024):
+        self.lines = {os.path.abspath(path): deque(maxlen=max_lines) for path in paths}
+        self.version = 0
+        self._lock = threading.Lock()
+        self.watcher = LogWatcher()
+
+        for path in self.lines:
+            self.watcher.watch(path, lambda text, path=path: self._append(path, text), backlog)
+        self.watcher.start()
+
+    def _append(self, path, text):
+        with self._lock:
+            self.lines[path].extend(text.splitlines())
+            self.version += 1
+
+    def recent(self, path):
+        """Return a copy of the buffered lines for path."""
+        with self._lock:
+            return list(self.lines[os.path.abspath(path)])
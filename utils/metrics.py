@@ -0,0 +1,214 @@
+"""
+Opt-in timing instrumentation for the toolkit's operations and individual rules.
+
+Set OCTOGUARD_METRICS=1 before starting any entry point to record call counts and
+latency histograms. The decision is made once at import: when metrics are off,
+timed() and timed_pattern() hand back the original function or compiled pattern,
+so the disabled path costs nothing per call. When on, the snapshot is written to
+METRICS_PROM_FILE (Prometheus text format) and METRICS_JSON_FILE at exit, or on
+demand with export_metrics().
+
+Standard-library imports other than the builtin time module are deferred to
+the enabled paths so that importing this module adds nothing measurable to the
+CLI's startup.
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+from utils.constants import METRICS_PROM_FILE, METRICS_JSON_FILE
+
+ENABLED = os.environ.get('OCTOGUARD_METRICS', '').lower() not in ('', '0', 'false', 'no')
+
+# Histogram bucket upper bounds in seconds, from 1 microsecond to 1 second
+BUCKET_BOUNDS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0,
+)
+
+FAMILIES = {
+    'operation': "Latency of toolkit operations such as validate_email or assess_password_strength.",
+    'rule': "Latency of individual rules such as one regex or SQL keyword check.",
+}
+
+
+class Histogram:
+    """Call count, total time and per-bucket counts for one operation or rule."""
+
+    __slots__ = ('count', 'sum', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        # One slot per bound plus one for anything slower than the last bound
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.sum += seconds
+        self.buckets[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+
+    def cumulative(self):
+        """Bucket counts as Prometheus expects them: each includes every faster bucket."""
+        total = 0
+        counts = []
+        for count in self.buckets:
+            total += count
+            counts.append(total)
+        return counts
+
+
+class MetricsRegistry:
+    """Thread-safe store of histograms keyed by (family, name)."""
+
+    def __init__(self):
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def observe(self, family, name, seconds):
+        with self.lock:
+            histogram = self.histograms.get((family, name))
+            if histogram is None:
+                histogram = self.histograms[(family, name)] = Histogram()
+            histogram.observe(seconds)
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+
+    def snapshot(self):
+        """Return a JSON-serializable copy of every histogram."""
+        from datetime import datetime
+
+        with self.lock:
+            items = sorted(self.histograms.items())
+            data = {family: {} for family in FAMILIES}
+            for (family, name), histogram in items:
+                bounds = [str(bound) for bound in BUCKET_BOUNDS] + ['+Inf']
+                data[family][name] = {
+                    'count': histogram.count,
+                    'sum': histogram.sum,
+                    'mean': histogram.sum / histogram.count if histogram.count else 0.0,
+                    'buckets': dict(zip(bounds, histogram.cumulative())),
+                }
+        data['timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return data
+
+    def to_prometheus(self):
+        """Render every histogram in the Prometheus text exposition format."""
+        with self.lock:
+            items = sorted(self.histograms.items())
+
+            lines = []
+            for family, help_text in FAMILIES.items():
+                metric = f"octoguard_{family}_seconds"
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} histogram")
+                for (item_family, name), histogram in items:
+                    if item_family != family:
+                        continue
+                    label = f'{family}="{escape_label(name)}"'
+                    for bound, count in zip(BUCKET_BOUNDS, histogram.cumulative()):
+                        lines.append(f'{metric}_bucket{{{label},le="{bound}"}} {count}')
+                    lines.append(f'{metric}_bucket{{{label},le="+Inf"}} {histogram.count}')
+                    lines.append(f"{metric}_sum{{{label}}} {histogram.sum:.9f}")
+                    lines.append(f"{metric}_count{{{label}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+METRICS = MetricsRegistry()
+
+
+def timed(name):
+    """Decorator recording the latency of every call under the given operation name."""
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        import functools
+
+        observe = METRICS.observe
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe('operation', name, perf_counter() - start)
+
+        return wrapper
+
+    return decorate
+
+
+class TimedPattern:
+    """Compiled-regex proxy that records each search, match, sub or findall under one rule name."""
+
+    def __init__(self, name, pattern):
+        self.name = name
+        self.pattern = pattern
+
+    def _timed(self, method, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            METRICS.observe('rule', self.name, perf_counter() - start)
+
+    def search(self, *args, **kwargs):
+        return self._timed(self.pattern.search, *args, **kwargs)
+
+    def match(self, *args, **kwargs):
+        return self._timed(self.pattern.match, *args, **kwargs)
+
+    def fullmatch(self, *args, **kwargs):
+        return self._timed(self.pattern.fullmatch, *args, **kwargs)
+
+    def sub(self, *args, **kwargs):
+        return self._timed(self.pattern.sub, *args, **kwargs)
+
+    def findall(self, *args, **kwargs):
+        return self._timed(self.pattern.findall, *args, **kwargs)
+
+    def __getattr__(self, attribute):
+        # Anything else (flags, groups, finditer, ...) goes straight to the pattern untimed
+        return getattr(self.pattern, attribute)
+
+
+def timed_pattern(name, pattern):
+    """Return the compiled pattern, wrapped to record per-call latency when metrics are enabled."""
+    return TimedPattern(name, pattern) if ENABLED else pattern
+
+
+def export_metrics(prom_file=METRICS_PROM_FILE, json_file=METRICS_JSON_FILE):
+    """Write the current metrics as a Prometheus text file and a JSON snapshot."""
+    import json
+
+    try:
+        for path, content in ((prom_file, METRICS.to_prometheus()),
+                              (json_file, json.dumps(METRICS.snapshot(), indent=2))):
+            if not path:
+                continue
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            # Write then rename so a textfile collector never reads a half-written file
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                file.write(content)
+            os.replace(temp_path, path)
+        return True
+    except Exception as e:
+        print(f"Error exporting metrics: {e}")
+        return False
+
+
+if ENABLED:
+    import atexit
+
+    atexit.register(export_metrics)
@@ -0,0 +1,119 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+def _frame(item):
+    """Encode an item with its type and length, so no two distinct inputs share a byte string.
+
+    repr() keeps None apart from "None" and 1 apart from "1"; the length prefix
+    keeps field boundaries apart from separator characters inside values.
+    """
+    data = repr(item).encode('utf-8', 'surrogatepass')
+    return f"{type(item).__name__}:{len(data)}:".encode('ascii') + data
+
+
+class ResultCache:
+    """Thread-safe, size-bounded LRU cache with optional TTL for pure toolkit results.
+
+    Keys are keyed BLAKE2b digests of the input, so passwords and form values are
+    never stored in plaintext. Cached results are shared between callers and must
+    be treated as read-only.
+    """
+
+    def __init__(self, max_size=1024, ttl=None, secret=None):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        # A per-process random secret keeps digests useless outside this process
+        self._secret = secret if secret is not None else os.urandom(32)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def make_key(self, namespace, value, extra=()):
+        """Return the keyed digest identifying a namespaced input."""
+        digest = hashlib.blake2b(key=self._secret, digest_size=16)
+        digest.update(_frame(namespace))
+
+        if isinstance(value, dict):
+            # Sort fields so equal forms hash equally regardless of insertion order
+            digest.update(b'd' + _frame(len(value)))
+            for field in sorted(value, key=repr):
+                digest.update(_frame(field) + _frame(value[field]))
+        else:
+            digest.update(b'v' + _frame(value))
+
+        digest.update(b'e' + _frame(extra))
+        return digest.digest()
+
+    def get_or_compute(self, namespace, value, compute, *args):
+        """Return the cached result for value, computing and storing it on a miss."""
+        key = self.make_key(namespace, value, args)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+
+        # Compute outside the lock so a slow call never blocks other threads
+        result = compute(value, *args)
+        expires_at = now + self.ttl if self.ttl else None
+
+        with self._lock:
+            self._entries[key] = (expires_at, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return result
+
+    def cached(self, namespace, func):
+        """Wrap a single-input function so its results go through this cache."""
+        def wrapper(value, *args):
+            return self.get_or_compute(namespace, value, func, *args)
+
+        wrapper.__name__ = getattr(func, '__name__', 'cached')
+        wrapper.__doc__ = getattr(func, '__doc__', None)
+        wrapper.cache = self
+        return wrapper
+
+    def clear(self):
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,327 @@
+"""
+Rule Set Snapshot
+Precompiled, memory-mapped form of the security word lists
+
+The snapshot holds a sorted common-password table and two Aho-Corasick automata
+(dictionary words and SQL keywords) as flat uint32 arrays. Loading maps the file
+and casts views over it, so nothing is parsed or rebuilt at startup. The header
+records a checksum of the source lists; when they change the snapshot is rebuilt
+on the next load.
+
+Build explicitly with: python -m utils.rule_snapshot build
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import deque
+
+from utils.constants import COMMON_PASSWORDS, DICTIONARY_WORDS, SQL_KEYWORDS, RULESET_FILE
+
+MAGIC = b"OGRS"
+FORMAT_VERSION = 1
+
+# magic, format version, byte order flag, source checksum, section count
+HEADER = struct.Struct("<4sHH32sI")
+# name, offset, length
+SECTION = struct.Struct("<16sQQ")
+LITTLE_ENDIAN = 1 if sys.byteorder == 'little' else 0
+
+# Bytes that count as word characters for SQL keyword boundaries; non-ASCII is treated as a letter
+WORD_BYTES = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_" + bytes(range(0x80, 0x100)))
+
+
+def source_checksum(common, dictionary, sql):
+    """SHA-256 over the source lists as given and the format version.
+
+    The lists are hashed without normalizing them, which keeps the check cheap
+    for large lists; reordering one only costs an unnecessary rebuild.
+    """
+    digest = hashlib.sha256(f"v{FORMAT_VERSION}".encode('ascii'))
+    for name, words in (('common', common), ('dictionary', dictionary), ('sql', sql)):
+        digest.update(f"\0{name}\0{len(words)}\0".encode('ascii'))
+        digest.update('\0'.join(words).encode('utf-8'))
+    return digest.digest()
+
+
+# --- Building ---
+def _string_table(words):
+    """Encode words as a uint32 offsets array (len + 1 entries) and a UTF-8 blob."""
+    offsets = array('I', [0])
+    blob = bytearray()
+    for word in words:
+        blob += word.encode('utf-8')
+        offsets.append(len(blob))
+    return offsets.tobytes(), bytes(blob)
+
+
+def _build_automaton(patterns):
+    """Build a dense Aho-Corasick DFA over byte classes for a list of byte strings.
+
+    Returns (byte classes, class count, transition table, output offsets, output pattern ids).
+    """
+    # Bytes that occur in any pattern get their own class; everything else shares class 0.
+    # When patterns use all 256 bytes there is nothing to share it, so ids start at 0 and fit a byte
+    used = sorted({byte for pattern in patterns for byte in pattern})
+    first = 1 if len(used) < 256 else 0
+    classes = bytearray(256)
+    for class_id, byte in enumerate(used, first):
+        classes[byte] = class_id
+    class_count = len(used) + first
+
+    goto = [{}]
+    outputs = [[]]
+    for pattern_id, pattern in enumerate(patterns):
+        state = 0
+        for byte in pattern:
+            cls = classes[byte]
+            if cls not in goto[state]:
+                goto.append({})
+                outputs.append([])
+                goto[state][cls] = len(goto) - 1
+            state = goto[state][cls]
+        outputs[state].append(pattern_id)
+
+    # Breadth-first pass resolving failure links straight into the dense table
+    table = array('I', bytes(4 * len(goto) * class_count))
+    fail = [0] * len(goto)
+    queue = deque()
+    for cls in range(class_count):
+        target = goto[0].get(cls, 0)
+        table[cls] = target
+        if target:
+            queue.append(target)
+
+    while queue:
+        state = queue.popleft()
+        outputs[state] = outputs[state] + outputs[fail[state]]
+        row = state * class_count
+        fail_row = fail[state] * class_count
+        for cls in range(class_count):
+            target = goto[state].get(cls)
+            if target is None:
+                table[row + cls] = table[fail_row + cls]
+            else:
+                table[row + cls] = target
+                fail[target] = table[fail_row + cls]
+                queue.append(target)
+
+    output_offsets = array('I', [0])
+    output_ids = array('I')
+    for ids in outputs:
+        output_ids.extend(ids)
+        output_offsets.append(len(output_ids))
+
+    return bytes(classes), class_count, table, output_offsets, output_ids
+
+
+def _automaton_sections(prefix, words, encode):
+    patterns = [encode(word) for word in words]
+    classes, class_count, table, output_offsets, output_ids = _build_automaton(patterns)
+    offsets, blob = _string_table(words)
+    return [
+        (f"{prefix}.classes", classes),
+        (f"{prefix}.meta", array('I', [class_count, len(words)]).tobytes()),
+        (f"{prefix}.table", table.tobytes()),
+        (f"{prefix}.out_off", output_offsets.tobytes()),
+        (f"{prefix}.out_ids", output_ids.tobytes()),
+        (f"{prefix}.offsets", offsets),
+        (f"{prefix}.blob", blob),
+    ]
+
+
+def build_snapshot(path=RULESET_FILE, common=COMMON_PASSWORDS, dictionary=DICTIONARY_WORDS, sql=SQL_KEYWORDS):
+    """Compile the lists and write the snapshot atomically; returns the checksum."""
+    common_words = sorted({word.lower() for word in common})
+    dictionary_words = sorted({word.lower() for word in dictionary})
+    sql_words = sorted({word.upper() for word in sql})
+
+    common_offsets, common_blob = _string_table(common_words)
+    sections = [
+        ("common.offsets", common_offsets),
+        ("common.blob", common_blob),
+    ]
+    sections += _automaton_sections("dict", dictionary_words, lambda word: word.encode('utf-8'))
+    sections += _automaton_sections("sql", sql_words, lambda word: word.encode('utf-8'))
+
+    checksum = source_checksum(common, dictionary, sql)
+    header_size = HEADER.size + SECTION.size * len(sections)
+
+    # Sections start on 8-byte boundaries so uint32 views are aligned
+    table = []
+    position = header_size
+    for name, data in sections:
+        position += -position % 8
+        table.append((name, position, len(data)))
+        position += len(data)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, LITTLE_ENDIAN, checksum, len(sections)))
+        for name, offset, length in table:
+            file.write(SECTION.pack(name.encode('ascii'), offset, length))
+        for (name, offset, length), (_, data) in zip(table, sections):
+            file.write(b"\0" * (offset - file.tell()))
+            file.write(data)
+    # Readers that already mapped the old file keep their view; new loads see the new one
+    os.replace(temp_path, path)
+    return checksum
+
+
+# --- Loading ---
+class _Automaton:
+    """Read-only Aho-Corasick matcher over views into the mapped snapshot."""
+
+    def __init__(self, sections, prefix):
+        self.classes = bytes(sections[f"{prefix}.classes"])
+        self.class_count, self.pattern_count = sections[f"{prefix}.meta"].cast('I')
+        self.table = sections[f"{prefix}.table"].cast('I')
+        self.output_offsets = sections[f"{prefix}.out_off"].cast('I')
+        self.output_ids = sections[f"{prefix}.out_ids"].cast('I')
+        self.word_offsets = sections[f"{prefix}.offsets"].cast('I')
+        self.blob = sections[f"{prefix}.blob"]
+
+    def word(self, pattern_id):
+        return bytes(self.blob[self.word_offsets[pattern_id]:self.word_offsets[pattern_id + 1]]).decode('utf-8')
+
+    def scan(self, data):
+        """Yield (end index, pattern id) for every match in a byte string."""
+        table = self.table
+        class_count = self.class_count
+        output_offsets = self.output_offsets
+        output_ids = self.output_ids
+
+        state = 0
+        # translate maps every input byte to its class in one C-level pass
+        for index, cls in enumerate(data.translate(self.classes)):
+            state = table[state * class_count + cls]
+            start, end = output_offsets[state], output_offsets[state + 1]
+            for position in range(start, end):
+                yield index, output_ids[position]
+
+
+class RuleSnapshot:
+    """A loaded snapshot: common-password lookup and dictionary and SQL keyword automata."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self.mmap)
+
+        magic, version, byte_order, self.checksum, section_count = HEADER.unpack_from(view)
+        if magic != MAGIC or version != FORMAT_VERSION or byte_order != LITTLE_ENDIAN:
+            self.close()
+            raise ValueError(f"Unsupported rule snapshot: {path}")
+
+        sections = {}
+        for index in range(section_count):
+            name, offset, length = SECTION.unpack_from(view, HEADER.size + index * SECTION.size)
+            sections[name.rstrip(b"\0").decode('ascii')] = view[offset:offset + length]
+
+        self.common_offsets = sections["common.offsets"].cast('I')
+        self.common_blob = sections["common.blob"]
+        self.dictionary = _Automaton(sections, "dict")
+        self.sql = _Automaton(sections, "sql")
+
+    def close(self):
+        try:
+            self.mmap.close()
+        except BufferError:
+            # Views are still referenced; the mapping is released when they are
+            pass
+
+    def is_common_password(self, password):
+        """Binary search the sorted common-password table."""
+        target = password.lower().encode('utf-8')
+        offsets = self.common_offsets
+        blob = self.common_blob
+        low, high = 0, len(offsets) - 1
+        while low < high:
+            middle = (low + high) // 2
+            word = blob[offsets[middle]:offsets[middle + 1]]
+            if word == target:
+                return True
+            if bytes(word) < target:
+                low = middle + 1
+            else:
+                high = middle
+        return False
+
+    def find_dictionary_words(self, password):
+        """Return the dictionary words contained in the password, ignoring case."""
+        automaton = self.dictionary
+        found = {automaton.word(pattern_id) for _, pattern_id in automaton.scan(password.lower().encode('utf-8'))}
+        return sorted(found)
+
+    def find_sql_keywords(self, text):
+        """Return the SQL keywords that appear as whole words in the text, ignoring case."""
+        automaton = self.sql
+        data = text.upper().encode('utf-8')
+        found = set()
+        for end, pattern_id in automaton.scan(data):
+            start = end - (automaton.word_offsets[pattern_id + 1] - automaton.word_offsets[pattern_id]) + 1
+            before = data[start - 1] if start > 0 else None
+            after = data[end + 1] if end + 1 < len(data) else None
+            if before not in WORD_BYTES and after not in WORD_BYTES:
+                found.add(automaton.word(pattern_id))
+        return sorted(found)
+
+
+def load_snapshot(path=RULESET_FILE, common=COMMON_PASSWORDS, dictionary=DICTIONARY_WORDS, sql=SQL_KEYWORDS):
+    """Map the snapshot, rebuilding it first when it is missing, stale or unreadable."""
+    expected = source_checksum(common, dictionary, sql)
+    try:
+        snapshot = RuleSnapshot(path)
+        if snapshot.checksum == expected:
+            return snapshot
+        snapshot.close()
+    except (OSError, ValueError, KeyError, struct.error):
+        pass
+
+    build_snapshot(path, common, dictionary, sql)
+    return RuleSnapshot(path)
+
+
+_snapshot = None
+
+
+def get_snapshot():
+    """Return the process-wide snapshot, loading it on first use."""
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = load_snapshot()
+    return _snapshot
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or inspect the rule set snapshot")
+    parser.add_argument("command", choices=["build", "check"])
+    parser.add_argument("--output", default=RULESET_FILE)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        checksum = build_snapshot(args.output)
+        print(f"Wrote {args.output} ({os.path.getsize(args.output)} bytes, checksum {checksum.hex()[:16]})")
+        return 0
+
+    expected = source_checksum(COMMON_PASSWORDS, DICTIONARY_WORDS, SQL_KEYWORDS)
+    try:
+        snapshot = RuleSnapshot(args.output)
+    except (OSError, ValueError) as e:
+        print(f"{args.output}: unusable ({e})")
+        return 1
+    if snapshot.checksum != expected:
+        print(f"{args.output}: stale - the source lists in utils/constants.py have changed")
+        return 1
+    print(f"{args.output}: up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Passphrase Wordlist
+Memory-mapped word table for passphrase generation
+
+The file holds a uint32 offsets array (one entry per word plus an end marker)
+followed by the UTF-8 words back to back. Loading maps the file and casts a
+view over the offsets, so a list of millions of words opens instantly and
+picking the n-th word is two array reads and one slice; no Python object is
+created for a word until it is drawn.
+
+Build from a text file with one word per line (diceware lists with a roll
+number before each word work as they are):
+  python -m utils.wordlist build words.txt
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from utils.constants import WORDLIST_FILE, PASSPHRASE_SEPARATOR
+
+MAGIC = b"OGWL"
+FORMAT_VERSION = 1
+
+# magic, format version, byte order flag, word count, offsets position, blob position
+HEADER = struct.Struct("<4sHHQQQ")
+LITTLE_ENDIAN = 1 if sys.byteorder == 'little' else 0
+
+
+def read_words(source):
+    """Yield the distinct words of a text wordlist in file order.
+
+    The last field of each line is the word, so "11111 abacus" reads as
+    "abacus". Blank lines, '#' comments and words containing the passphrase
+    separator are skipped; duplicates would make some words likelier than
+    others and overstate the entropy.
+    """
+    seen = set()
+    with open(source, encoding='utf-8') as file:
+        for line in file:
+            fields = line.split()
+            if not fields or fields[0].startswith('#'):
+                continue
+            word = fields[-1]
+            if PASSPHRASE_SEPARATOR in word or word in seen:
+                continue
+            seen.add(word)
+            yield word
+
+
+def build_wordlist(source, path=WORDLIST_FILE):
+    """Compile a text wordlist and write it atomically; returns the word count."""
+    offsets = array('I', [0])
+    blob = bytearray()
+    for word in read_words(source):
+        blob += word.encode('utf-8')
+        if len(blob) > 0xFFFFFFFF:
+            raise ValueError("Wordlist is too large: words must fit in 4 GiB")
+        offsets.append(len(blob))
+
+    count = len(offsets) - 1
+    if count < 2:
+        raise ValueError(f"{source} has fewer than two usable words")
+
+    offsets_position = HEADER.size
+    blob_position = offsets_position + len(offsets) * offsets.itemsize
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, LITTLE_ENDIAN, count, offsets_position, blob_position))
+        file.write(offsets.tobytes())
+        file.write(blob)
+    # Readers that already mapped the old file keep their view; new loads see the new one
+    os.replace(temp_path, path)
+    return count
+
+
+class Wordlist:
+    """A loaded wordlist: len() words, each read straight from the mapping by index."""
+
+    def __init__(self, path=WORDLIST_FILE):
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self.mmap)
+
+        try:
+            magic, version, byte_order, self.count, offsets_position, blob_position = HEADER.unpack_from(view)
+        except struct.error:
+            magic = None
+        if magic != MAGIC or version != FORMAT_VERSION or byte_order != LITTLE_ENDIAN:
+            self.close()
+            raise ValueError(f"Unsupported wordlist: {path}")
+
+        if blob_position - offsets_position != 4 * (self.count + 1) or blob_position > len(view):
+            self.close()
+            raise ValueError(f"Truncated wordlist: {path}")
+        self.offsets = view[offsets_position:blob_position].cast('I')
+        self.blob = view[blob_position:]
+        if self.offsets[-1] != len(self.blob):
+            self.close()
+            raise ValueError(f"Truncated wordlist: {path}")
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        offsets = self.offsets
+        return bytes(self.blob[offsets[index]:offsets[index + 1]]).decode('utf-8')
+
+    def close(self):
+        try:
+            self.mmap.close()
+        except BufferError:
+            # Views are still referenced; the mapping is released when they are
+            pass
+
+
+_wordlist = None
+
+
+def get_wordlist():
+    """Return the process-wide wordlist, mapping it on first use.
+
+    Raises OSError when no wordlist has been built and ValueError when it is unreadable.
+    """
+    global _wordlist
+    if _wordlist is None:
+        _wordlist = Wordlist()
+    return _wordlist
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or inspect the passphrase wordlist")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="compile a text wordlist")
+    build.add_argument("source", help="text file with one word per line")
+    build.add_argument("--output", default=WORDLIST_FILE)
+    check = subparsers.add_parser("check", help="report the size of a compiled wordlist")
+    check.add_argument("--output", default=WORDLIST_FILE)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        try:
+            count = build_wordlist(args.source, args.output)
+        except (OSError, ValueError) as e:
+            print(f"Error building wordlist: {e}")
+            return 1
+        print(f"Wrote {args.output} ({count} words, {os.path.getsize(args.output)} bytes)")
+        return 0
+
+    import math
+
+    try:
+        wordlist = Wordlist(args.output)
+    except (OSError, ValueError) as e:
+        print(f"{args.output}: unusable ({e})")
+        return 1
+    print(f"{args.output}: {len(wordlist)} words, {math.log2(len(wordlist)):.2f} bits per word")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())